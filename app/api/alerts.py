@@ -1,32 +1,162 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from typing import List, Optional, Set
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.crud import alert_crud
-from app.schemas.alert import AlertResponse
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db, get_read_db
+from app.crud import alert_crud, alert_inbox_crud
+from app.schemas.alert import (
+    AlertResponse, AlertInboxItem, AlertInboxSummary, AlertMarkRead, AlertMarkReadResult
+)
+from app.services.alert_stream import alert_stream_hub
+from .export import export_response, parse_cursor, set_next_cursor
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
+# 실시간 스트림 재연결 시 놓친 알림을 한 번에 조회하는 개수
+BACKFILL_PAGE_SIZE = 100
+
 
 @router.get("", response_model=List[AlertResponse])
 async def get_alerts(
+    response: Response,
     user_id: str = Query(..., description="사용자 ID"),
     limit: int = Query(50, description="조회할 개수", le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """사용자별 알림 기록 조회 (페이지가 가득 차면 X-Next-Cursor 헤더로 다음 페이지 커서 반환)"""
+    alerts = await alert_crud.get_by_user_id(db, user_id, limit, parse_cursor(cursor))
+    set_next_cursor(response, alerts, limit, "sent_at")
+    return alerts
+
+
+@router.get("/summary", response_model=AlertInboxSummary)
+async def get_alert_summary(
+    user_id: str = Query(..., description="사용자 ID"),
     db: AsyncSession = Depends(get_db)
 ):
-    """사용자별 알림 기록 조회"""
-    alerts = await alert_crud.get_by_user_id(db, user_id, limit)
+    """안 읽은 알림 수 / 전체 알림 수 (배지용, 미리 집계된 값을 기본 키로 조회)
+    
+    읽음 처리 직후 값이 바로 보이도록 read replica가 아닌 primary에서 읽는다.
+    """
+    inbox = await alert_inbox_crud.get(db, user_id)
+    if inbox is None:
+        return AlertInboxSummary(user_id=user_id)
+    return inbox
+
+
+@router.get("/inbox", response_model=List[AlertInboxItem])
+async def get_alert_inbox(
+    response: Response,
+    user_id: str = Query(..., description="사용자 ID"),
+    unread_only: bool = Query(False, description="안 읽은 알림만"),
+    limit: int = Query(50, description="조회할 개수", le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """알림함 목록 (물건 정보는 알림에 저장된 요약만, 물건 테이블 조인 없음)"""
+    alerts = await alert_crud.get_inbox(db, user_id, limit, parse_cursor(cursor), unread_only)
+    set_next_cursor(response, alerts, limit, "sent_at")
     return alerts
 
 
+@router.post("/read", response_model=AlertMarkReadResult)
+async def mark_alerts_read(
+    read_in: AlertMarkRead,
+    db: AsyncSession = Depends(get_db)
+):
+    """알림 일괄 읽음 처리 (alert_ids가 없으면 안 읽은 알림 전체)"""
+    return await alert_crud.mark_read(db, read_in.user_id, read_in.alert_ids)
+
+
+@router.get("/export")
+async def export_alerts(
+    user_id: Optional[str] = Query(None, description="사용자 ID (없으면 전체)"),
+    format: str = Query("ndjson", description="내보내기 형식 (ndjson / csv)")
+):
+    """알림 기록 내보내기 (최신순, 스트리밍)"""
+    return export_response(
+        lambda db: alert_crud.stream_alerts(db, user_id),
+        AlertResponse,
+        format,
+        "alerts"
+    )
+
+
+@router.get("/stream")
+async def stream_alerts(
+    request: Request,
+    user_id: str = Query(..., description="사용자 ID"),
+    last_event_id: Optional[int] = Header(None, description="재연결 시 마지막으로 받은 알림 ID (브라우저가 자동 전송)")
+):
+    """새 알림 실시간 스트림 (Server-Sent Events, 폴링 대신 사용)
+    
+    event: alert, id: 알림 ID, data: AlertResponse JSON.
+    재연결 시 Last-Event-ID 이후 알림을 먼저 보내고, 연결 유지를 위해 주기적으로 주석 줄을 보낸다.
+    """
+    subscription = await alert_stream_hub.subscribe(user_id)
+    
+    async def events():
+        try:
+            yield f"retry: {settings.alert_stream_retry_ms}\n\n"
+            
+            # 보충으로 이미 보낸 알림 ID (구독 이후 알림은 큐에도 들어오므로 한 번씩만 보냄).
+            # 알림 조회(_push)는 NOTIFY마다 따로 실행돼 큐에 ID 순서대로 들어온다는 보장이 없으므로
+            # "마지막 ID 이하는 건너뜀" 대신 보낸 ID로 중복을 거른다
+            backfilled: Set[int] = set()
+            if last_event_id is not None:
+                # 끊긴 동안 생성된 알림을 페이지 단위로 끝까지 보충
+                after_id = last_event_id
+                while True:
+                    async with AsyncSessionLocal() as db:
+                        missed = await alert_crud.get_since(db, user_id, after_id, limit=BACKFILL_PAGE_SIZE)
+                    for alert in missed:
+                        yield _sse_event(AlertResponse.model_validate(alert))
+                        backfilled.add(alert.id)
+                    if len(missed) < BACKFILL_PAGE_SIZE:
+                        break
+                    after_id = missed[-1].id
+            
+            while not await request.is_disconnected():
+                try:
+                    alert = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=settings.alert_stream_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if alert is None:
+                    # 놓친 알림이 있거나 LISTEN 연결이 끊김 → 종료하면 클라이언트가 Last-Event-ID로 재연결
+                    break
+                if alert.id in backfilled:
+                    # 보충과 겹치는 알림은 한 번만 겹치므로 확인 후 제거 (연결이 길어져도 집합이 커지지 않음)
+                    backfilled.discard(alert.id)
+                    continue
+                yield _sse_event(alert)
+        finally:
+            alert_stream_hub.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{alert_id}", response_model=AlertResponse)
 async def get_alert(
     alert_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """알림 상세 조회"""
     alert = await alert_crud.get_by_id(db, alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
-    return alert 
\ No newline at end of file
+    return alert
+
+
+def _sse_event(alert: AlertResponse) -> str:
+    return f"id: {alert.id}\nevent: alert\ndata: {alert.model_dump_json()}\n\n"
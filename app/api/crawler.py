@@ -1,62 +1,75 @@
-from typing import Dict
-from fastapi import APIRouter, Depends, BackgroundTasks
+from typing import Dict, List
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.crawler import CourtAuctionCrawler
-from app.services import KeywordMatcher
+from app.crud import crawl_job_crud
+from app.crawler import discover_crawlers
+from app.schemas.crawl_job import CrawlJobResponse
+from app.services import crawl_runner
 
 router = APIRouter(prefix="/crawler", tags=["crawler"])
 
 
 @router.post("/run", response_model=Dict)
 async def run_crawler(
-    background_tasks: BackgroundTasks,
     pages: int = 3,
-    db: AsyncSession = Depends(get_db)
+    incremental: bool = False,
+    wait: bool = False
 ):
-    """수동 크롤링 실행"""
+    """수동 크롤링 실행 (incremental=true면 이미 본 페이지가 나올 때까지만 크롤링)
+    
+    이미 실행 중인 크롤링이 있으면 새로 시작하지 않고 그 실행에 합류한다.
+    wait=true면 크롤링이 끝날 때까지 기다렸다가 결과를 반환한다.
+    """
     
     # 백그라운드에서 크롤링 실행
-    background_tasks.add_task(perform_crawling, db, pages)
+    result = await crawl_runner.trigger(pages, incremental, trigger="manual")
     
-    return {
-        "message": "크롤링이 시작되었습니다",
-        "pages": pages,
-        "status": "started"
+    messages = {
+        "started": "크롤링이 시작되었습니다",
+        "already_running": "이미 실행 중인 크롤링에 합류했습니다",
     }
+    response = {"message": messages.get(result["status"], result.get("message")), **result}
+    
+    task = crawl_runner.current_task
+    if wait and task is not None:
+        # 요청이 끊겨도 크롤링 자체는 취소되지 않도록 shield
+        response["results"] = await asyncio.shield(task)
+        response["status"] = "completed"
+    
+    return response
 
 
 @router.get("/status")
-async def get_crawler_status():
-    """크롤러 상태 조회"""
+async def get_crawler_status(db: AsyncSession = Depends(get_db)):
+    """크롤러 상태 조회 (실행 중이면 진행 통계 포함)"""
+    current_job = CrawlJobResponse.model_validate(crawl_runner.snapshot()) if crawl_runner.is_running else None
+    recent = await crawl_job_crud.get_recent_jobs(db, limit=1)
+    
     return {
-        "status": "ready",
-        "message": "크롤러가 준비되었습니다",
-        "supported_sites": ["대법원 경매정보"]
+        "status": "running" if crawl_runner.is_running else "ready",
+        "message": "크롤링이 실행 중입니다" if crawl_runner.is_running else "크롤러가 준비되었습니다",
+        "supported_sites": [crawler.source_site for crawler in discover_crawlers().values()],
+        "current_job": current_job,
+        "last_job": CrawlJobResponse.model_validate(recent[0]) if recent else None
     }
 
 
-async def perform_crawling(db: AsyncSession, pages: int = 3):
-    """실제 크롤링 수행"""
-    try:
-        print("🕷️ 크롤링 시작...")
-        
-        # 크롤러 초기화
-        crawler = CourtAuctionCrawler()
-        matcher = KeywordMatcher()
-        
-        # 크롤링 실행
-        crawled_items = await crawler.crawl_items(pages)
-        
-        # 키워드 매칭 및 알림 처리
-        results = await matcher.process_crawled_items(db, crawled_items)
-        
-        print(f"✅ 크롤링 완료: {results}")
-        
-        # 크롤러 정리
-        crawler.close()
-        
-    except Exception as e:
-        print(f"❌ 크롤링 실패: {e}")
-        raise 
\ No newline at end of file
+@router.get("/jobs", response_model=List[CrawlJobResponse])
+async def get_crawl_jobs(limit: int = 20, db: AsyncSession = Depends(get_db)):
+    """최근 크롤링 작업 목록 조회"""
+    return await crawl_job_crud.get_recent_jobs(db, limit=limit)
+
+
+@router.get("/jobs/{job_id}", response_model=CrawlJobResponse)
+async def get_crawl_job(job_id: int, db: AsyncSession = Depends(get_db)):
+    """크롤링 작업 조회 (이 워커에서 실행 중이면 실시간 통계)"""
+    if crawl_runner.is_running and crawl_runner.current_job.get("id") == job_id:
+        return CrawlJobResponse.model_validate(crawl_runner.snapshot())
+    
+    job = await crawl_job_crud.get_by_id(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="크롤링 작업을 찾을 수 없습니다")
+    return job
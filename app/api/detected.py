@@ -1,35 +1,70 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.crud import detected_item_crud
 from app.schemas.detected_item import DetectedItemResponse
+from app.services.response_cache import LIST_TAG, item_tag, response_cache
+from .export import export_response, parse_cursor, set_next_cursor
 
 router = APIRouter(prefix="/detected", tags=["detected"])
 
+_item_list = TypeAdapter(List[DetectedItemResponse])
+_item = TypeAdapter(DetectedItemResponse)
+
 
 @router.get("", response_model=List[DetectedItemResponse])
 async def get_detected_items(
+    request: Request,
     keyword: Optional[str] = Query(None, description="검색할 키워드"),
     limit: int = Query(50, description="조회할 개수", le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """감지된 경매 물건 목록 조회"""
-    if keyword:
-        items = await detected_item_crud.get_by_keyword(db, keyword, limit)
-    else:
-        items = await detected_item_crud.get_recent_items(db, limit)
-    return items
+    """감지된 경매 물건 목록 조회
+    
+    키워드가 없으면 최신순으로 조회하고, 페이지가 가득 차면 다음 페이지 커서를
+    X-Next-Cursor 헤더로 반환한다. 키워드 검색은 관련도순 상위 결과만 반환하고 커서를 지원하지
+    않는다 (함께 넘기면 400).
+    응답은 크롤링으로 새 물건이 적재될 때까지 캐시되고 ETag로 304를 지원한다.
+    캐시는 적재 커밋 직후 무효화되므로 복제 지연이 있는 replica가 아니라 primary에서 채운다
+    (replica에서 채우면 적재 전 데이터가 새 세대로 TTL 동안 캐시됨). 캐시 적중 시에는 DB 연결을 쓰지 않는다.
+    """
+    if keyword and cursor:
+        raise HTTPException(status_code=400, detail="키워드 검색은 커서 페이지를 지원하지 않습니다 (limit으로 개수 조정)")
+    page_cursor = parse_cursor(cursor)
+    
+    async def load(response: Response):
+        if keyword:
+            return await detected_item_crud.get_by_keyword(db, keyword, limit)
+        items = await detected_item_crud.get_recent_items(db, limit, page_cursor)
+        set_next_cursor(response, items, limit, "created_at")
+        return items
+    
+    return await response_cache.respond(request, LIST_TAG, load, _item_list)
+
+
+@router.get("/export")
+async def export_detected_items(
+    format: str = Query("ndjson", description="내보내기 형식 (ndjson / csv)")
+):
+    """감지된 경매 물건 전체 내보내기 (최신순, 스트리밍)"""
+    return export_response(detected_item_crud.stream_all, DetectedItemResponse, format, "detected_items")
 
 
 @router.get("/{item_id}", response_model=DetectedItemResponse)
 async def get_detected_item(
+    request: Request,
     item_id: int,
     db: AsyncSession = Depends(get_db)
 ):
-    """감지된 경매 물건 상세 조회"""
-    item = await detected_item_crud.get_by_id(db, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="경매 물건을 찾을 수 없습니다")
-    return item 
\ No newline at end of file
+    """감지된 경매 물건 상세 조회 (캐시, ETag 지원, 목록과 같은 이유로 primary에서 채움)"""
+    async def load(response: Response):
+        item = await detected_item_crud.get_by_id(db, item_id)
+        if not item:
+            raise HTTPException(status_code=404, detail="경매 물건을 찾을 수 없습니다")
+        return item
+    
+    return await response_cache.respond(request, item_tag(item_id), load, _item)
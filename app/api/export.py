@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Callable, Dict, List, Optional, Type, Union, get_args
+
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.pagination import Cursor, decode_cursor, encode_cursor
+from app.database import ReadSessionLocal
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 내보내기 응답을 몇 행씩 묶어서 보낼지
+_CHUNK_ROWS = 500
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """쿼리 파라미터 커서 해석 (잘못된 커서는 400)"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def set_next_cursor(response: Response, rows: List, limit: int, timestamp_attr: str):
+    """페이지가 가득 찼으면 마지막 행 기준의 다음 페이지 커서를 응답 헤더에 설정"""
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, timestamp_attr), last.id)
+
+
+def export_response(
+    rows: Callable[[AsyncSession], AsyncIterator],
+    schema: Type[BaseModel],
+    format: str,
+    filename: str,
+) -> StreamingResponse:
+    """서버 측 커서로 읽은 행을 NDJSON/CSV로 스트리밍
+
+    요청 세션은 응답 스트리밍 도중 닫힐 수 있으므로 스트림이 자체 세션(read replica)을 연다.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {format}")
+
+    async def generate():
+        async with ReadSessionLocal() as db:
+            columns = _columns(schema) if format == "csv" else None
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=columns, restval="") if columns else None
+            if writer:
+                buffer.write("\ufeff")  # 엑셀에서 한글이 깨지지 않도록 BOM
+                writer.writeheader()
+
+            count = 0
+            async for row in rows(db):
+                data = schema.model_validate(row).model_dump(mode="json")
+                if writer:
+                    writer.writerow(_flatten(data))
+                else:
+                    buffer.write(json.dumps(data, ensure_ascii=False))
+                    buffer.write("\n")
+
+                count += 1
+                if count % _CHUNK_ROWS == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+
+            if buffer.tell():
+                yield buffer.getvalue()
+
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
+
+
+def _nested_model(annotation) -> Optional[Type[BaseModel]]:
+    """필드 타입이 (Optional) 하위 모델이면 그 모델"""
+    candidates = get_args(annotation) if getattr(annotation, "__origin__", None) is Union else (annotation,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _columns(schema: Type[BaseModel], prefix: str = "") -> List[str]:
+    """CSV 컬럼 목록 (하위 모델은 item.title 처럼 펼침)"""
+    columns = []
+    for name, field in schema.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested is not None:
+            columns.extend(_columns(nested, f"{prefix}{name}."))
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+def _flatten(data: Dict, prefix: str = "") -> Dict:
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            flat[f"{prefix}{key}"] = json.dumps(value, ensure_ascii=False)
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
@@ -1,11 +1,19 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 import os
 
 
 class Settings(BaseSettings):
     # Database
     database_url: str
+    database_read_url: Optional[str] = None  # 조회 전용 API에 사용할 read replica (없으면 primary)
+    database_echo: bool = False  # SQL 로그 출력 (개발용)
+    database_pool_size: int = 10
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0  # 연결 체크아웃 대기 최대 시간 (초)
+    database_pool_recycle: int = 1800  # 연결 재생성 주기 (초, 프록시 유휴 연결 종료 대비)
+    database_pool_pre_ping: bool = True
+    database_statement_cache_size: int = 100  # asyncpg prepared statement 캐시 (PgBouncer 트랜잭션 모드면 0)
     
     # Supabase
     supabase_url: str
@@ -22,7 +30,90 @@ class Settings(BaseSettings):
     
     # Crawler Settings
     crawler_interval_hours: int = 2
+    crawler_scheduler_enabled: bool = True  # 앱 시작 시 주기 크롤링 스케줄러 실행
+    crawler_scheduled_pages: int = 3
+    crawler_scheduled_incremental: bool = True
+    crawl_job_flush_seconds: float = 5.0  # 실행 중 진행 통계를 DB에 반영하는 주기
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    crawler_sources: List[str] = []  # 실행할 크롤러 소스 이름 (비어 있으면 등록된 전체)
+    crawler_global_concurrency: int = 16  # 모든 소스를 합친 동시 요청 수
+    crawler_source_concurrency: Dict[str, int] = {}  # 소스별 동시 요청 수 (없으면 crawler_concurrency_per_host)
+    crawler_request_timeout: float = 30.0
+    crawler_max_connections: int = 20  # keep-alive 연결 풀 크기
+    crawler_concurrency_per_host: int = 4  # 호스트별 동시 요청 수
+    crawler_rate_per_host: float = 2.0  # 호스트별 초당 요청 수 (0 = 제한 없음)
+    crawler_rate_burst: int = 4  # 토큰 버킷 최대 버스트
+    crawler_queue_size: int = 4  # 크롤링 → 매칭 사이 대기 가능한 페이지 배치 수
+    crawler_html_parser: str = "lxml"  # 목록 파서 엔진: lxml / selectolax / html.parser
+    crawler_default_charset: str = "euc-kr"  # 응답에 charset 선언이 없을 때 사용
+    crawler_parse_workers: int = 0  # 파싱 워커 프로세스 수 (0이면 이벤트 루프에서 직접 파싱)
+    crawler_enrich_details: bool = False  # 새 물건의 상세 페이지에서 면적/최저가/유찰 횟수 보강
+    crawler_detail_concurrency: int = 4  # 상세 페이지 동시 요청 수
+    crawler_detail_cache_size: int = 10000  # 상세 페이지 결과 캐시(URL 기준) 최대 개수
+    crawler_page_cache_enabled: bool = True  # 조건부 요청 + 본문 해시로 변경 없는 페이지 파싱 생략
+    crawler_page_cache_path: str = ".cache/crawler_pages.sqlite3"
+    crawler_incremental_max_pages: int = 50  # 증분 모드 최대 페이지 수
+    crawler_incremental_stop_pages: int = 2  # 연속으로 모두 이미 본 페이지가 이만큼이면 종료
+    crawler_seen_filter_path: str = ".cache/seen_urls.bloom"
+    crawler_seen_filter_capacity: int = 1000000
+    crawler_seen_filter_error_rate: float = 0.001
+    
+    # Keyword Matching
+    keyword_index_ttl_seconds: int = 300  # 키워드 역색인 재적재 주기 (워커 간 동기화)
+    
+    # Response Cache (/detected 조회 응답)
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: float = 300.0
+    response_cache_max_entries: int = 1024
+    response_cache_shared: bool = True  # 여러 워커 간 무효화 전달 (Postgres LISTEN/NOTIFY, 단일 워커면 false 가능)
+    
+    # Search
+    search_candidate_limit: int = 1000  # 순위 계산 전 최신순으로 가져올 검색 후보 수
+    
+    # Notifications (외부 채널 발송: outbox 테이블 + 워커)
+    notification_channels: List[str] = []  # 알림 생성 시 outbox에 넣을 채널 (email / webhook, 비어 있으면 발송 안 함)
+    notification_workers: int = 2  # 프로세스당 outbox 처리 워커 수 (0 = 이 프로세스에서는 발송 안 함)
+    notification_batch_size: int = 100  # 워커가 한 번에 가져가는 행 수
+    notification_concurrency: int = 100  # 채널별 동시 발송 수 (프로세스 내 전체 워커 합계, 웹훅 배치 크기의 상한)
+    notification_poll_seconds: float = 2.0  # 대기 행이 없을 때 다시 확인하는 주기
+    notification_lease_seconds: float = 300.0  # 가져간 행의 결과를 기록하지 못하면 다시 발송 대상이 되기까지 시간
+    notification_max_attempts: int = 8
+    notification_backoff_base_seconds: float = 5.0  # 재시도 간격: base * 2^(시도 횟수-1), 최대 max
+    notification_backoff_max_seconds: float = 3600.0
+    notification_sent_retention_hours: float = 168.0  # 발송 완료 행 보관 기간 (0 = 삭제 안 함)
+    notification_prune_interval_seconds: float = 3600.0  # 보관 기간이 지난 발송 완료 행 삭제 주기
+    webhook_default_url: Optional[str] = None  # 사용자별 주소가 없을 때 보낼 웹훅 주소
+    webhook_user_urls: Dict[str, str] = {}  # 사용자 ID → 웹훅 주소
+    webhook_timeout_seconds: float = 5.0
+    webhook_max_connections: int = 50  # 모든 주소가 공유하는 keep-alive 연결 풀 크기
+    webhook_batch_window_seconds: float = 0.5  # 같은 주소로 가는 알림을 모아 보내는 시간
+    webhook_batch_max_size: int = 100  # 한 요청에 담는 최대 알림 수
+    webhook_endpoint_concurrency: int = 2  # 주소별 동시 요청 수
+    webhook_breaker_failures: int = 5  # 연속 실패가 이만큼이면 차단
+    webhook_breaker_reset_seconds: float = 60.0  # 차단 후 다시 시험 요청을 보내기까지 시간
+    email_from: str = "경매 알림 <noreply@localhost>"
+    email_user_addresses: Dict[str, str] = {}  # 사용자 ID → 메일 주소 (없으면 user_id가 메일 주소일 때만 발송)
+    email_digest_window_seconds: float = 600.0  # 사용자의 첫 알림 후 이 시간 동안 쌓인 알림을 요약 메일 한 통으로
+    email_digest_max_users: int = 50  # 워커가 한 번에 요약 메일을 보내는 사용자 수
+    smtp_host: str = "localhost"
+    smtp_port: int = 587
+    smtp_username: Optional[str] = None
+    smtp_password: Optional[str] = None
+    smtp_starttls: bool = True
+    smtp_use_ssl: bool = False  # 465 포트(SMTPS)
+    smtp_timeout_seconds: float = 30.0
+    smtp_idle_check_seconds: float = 30.0  # 이보다 오래 쉰 연결은 NOOP으로 살아 있는지 확인 후 재사용
+    
+    # Alert Stream (/alerts/stream, SSE)
+    alert_stream_queue_size: int = 100  # 연결별 대기 알림 수 (넘치면 연결을 끊고 재연결 시 보충)
+    alert_stream_heartbeat_seconds: float = 15.0  # 프록시가 유휴 연결을 끊지 않도록 보내는 주석 줄 주기
+    alert_stream_retry_ms: int = 3000  # 클라이언트 재연결 대기 시간
+    
+    # Profiling
+    profiling_enabled: bool = False  # X-Profile 헤더가 있는 요청을 pyinstrument로 프로파일링 (선택 의존성)
+    profiling_token: Optional[str] = None  # 설정하면 X-Profile-Token 헤더가 일치하는 요청만 프로파일링
+    profiling_interval: float = 0.001  # 샘플링 간격 (초)
+    slow_query_threshold_ms: float = 0  # 이보다 오래 걸린 SQL을 호출한 CRUD 메서드와 함께 로그 (0 = 끔)
     
     class Config:
         env_file = ".env"
@@ -1,4 +1,6 @@
-from .base import BaseCrawler
+from .base import BaseCrawler, FetchedPage, PageBatch
 from .court_auction import CourtAuctionCrawler
+from .registry import discover_crawlers, create_crawlers
+from .coordinator import CrawlCoordinator
 
-__all__ = ["BaseCrawler", "CourtAuctionCrawler"] 
\ No newline at end of file
+__all__ = ["BaseCrawler", "FetchedPage", "PageBatch", "CourtAuctionCrawler", "discover_crawlers", "create_crawlers", "CrawlCoordinator"] 
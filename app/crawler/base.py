@@ -1,58 +1,376 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import AsyncIterator, Iterable, List, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+import asyncio
 import time
-import random
+import httpx
+from bs4 import BeautifulSoup
 from app.config import settings
+from app.metrics import CRAWLER_FETCH_SECONDS, CRAWLER_FETCH_TOTAL
+from .page_cache import PageCache, PageValidators
+from .parsers import decode_content, normalize_charset, sniff_charset
+from .rate_limiter import HostLimiter
+from .seen_filter import BloomFilter
+
+
+class FetchedPage(NamedTuple):
+    """fetch_content 결과 (이전 실행과 같은 페이지면 content가 빈 바이트)"""
+    content: bytes
+    encoding: str
+    validators: Optional[PageValidators] = None  # 적재 후 페이지 캐시에 저장할 검증값
+
+
+class PageBatch(list):
+    """목록 페이지 하나에서 추출한 물건 목록 (list) + 페이지 캐시 검증값 + 이미 본 URL 필터
+
+    검증값과 이미 본 URL은 물건이 DB에 적재된 뒤 mark_ingested()로 기록한다. 요청 직후에
+    기록하면 파싱/적재가 실패했을 때 다음 실행이 304/해시 일치나 증분 조기 종료로 그 페이지를
+    건너뛰어 그 페이지의 물건이 영영 저장되지 않는다.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Dict] = (),
+        cache: Optional[PageCache] = None,
+        validators: Optional[PageValidators] = None,
+        seen: Optional[BloomFilter] = None,
+    ):
+        super().__init__(items)
+        self.cache = cache
+        self.validators = validators
+        self.seen = seen
+
+    async def mark_ingested(self):
+        if self.seen is not None:
+            self.seen.update(item['url'] for item in self)
+        if self.cache is not None and self.validators is not None:
+            await self.cache.store([self.validators])
 
 
 class BaseCrawler(ABC):
-    """크롤러 베이스 클래스"""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': settings.user_agent
-        })
-        
+    """크롤러 베이스 클래스
+
+    하위 클래스는 name(소스 식별자)과 source_site(표시 이름)를 지정하면 레지스트리에서
+    자동으로 발견된다 (app.crawler.registry).
+    """
+
+    name = ""
+    source_site = ""
+    supports_details = False  # 상세 페이지 보강(parse_detail) 지원 여부
+
+    def __init__(self, concurrency: Optional[int] = None, global_limit: Optional[asyncio.Semaphore] = None):
+        # keep-alive 연결을 재사용하는 비동기 HTTP 클라이언트
+        self.client = httpx.AsyncClient(
+            headers={'User-Agent': settings.user_agent},
+            timeout=settings.crawler_request_timeout,
+            limits=httpx.Limits(
+                max_connections=settings.crawler_max_connections,
+                max_keepalive_connections=settings.crawler_max_connections,
+            ),
+            follow_redirects=True,
+        )
+        # 소스별 동시 요청 수 / 모든 소스가 공유하는 전체 동시 요청 수
+        self.concurrency = concurrency or settings.crawler_concurrency_per_host
+        self.global_limit = global_limit
+        self.limiter = HostLimiter(
+            concurrency=self.concurrency,
+            rate=settings.crawler_rate_per_host,
+            burst=settings.crawler_rate_burst,
+        )
+        # 호스트별로 한 번 확인한 charset 캐시 (매 페이지 인코딩 추측 방지)
+        self._charsets: Dict[str, str] = {}
+        # 조건부 요청/본문 해시 캐시 (이전 실행과 같은 페이지는 파싱 생략)
+        self.page_cache = PageCache(settings.crawler_page_cache_path) if settings.crawler_page_cache_enabled else None
+        # 실행 통계 (시간은 동시 요청 각각의 합계)
+        self.stats: Dict = self.new_stats()
+
+    @property
+    def metrics_source(self) -> str:
+        """메트릭 라벨용 소스 이름"""
+        return self.name or type(self).__name__
+
+    @staticmethod
+    def new_stats() -> Dict:
+        return {
+            'pages_fetched': 0,
+            'pages_not_modified': 0,
+            'pages_failed': 0,
+            'detail_fetches': 0,  # 상세 페이지 보강 요청 (목록 페이지 수와 따로 셈)
+            'details_failed': 0,
+            'rows_parsed': 0,
+            'wait_seconds': 0.0,  # 동시성/속도 제한 대기
+            'fetch_seconds': 0.0,
+            'parse_seconds': 0.0,
+        }
+
     @abstractmethod
-    async def crawl_items(self) -> List[Dict]:
-        """경매 물건 크롤링 (하위 클래스에서 구현)"""
+    async def crawl_page(self, page: int) -> Optional[List[Dict]]:
+        """목록 페이지 1개 크롤링 (하위 클래스에서 구현, 요청 실패 시 None)
+
+        fetch_content로 받은 페이지는 page_batch()로 감싸 반환해야 적재 후 페이지 캐시에 기록된다.
+        """
         pass
-    
-    def get_page(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
-        """웹페이지 요청 및 파싱"""
+
+    def page_batch(self, items: Iterable[Dict], fetched: FetchedPage) -> PageBatch:
+        """페이지의 물건 목록과 그 페이지의 캐시 검증값을 묶음"""
+        return PageBatch(items, self.page_cache, fetched.validators)
+
+    async def fetch_detail(self, url: str) -> Optional[Dict]:
+        """상세 페이지를 요청해 추가 속성 추출 (요청 실패 또는 미지원 시 None)
+
+        상세 페이지는 물건마다 한 번만 요청하므로 페이지 캐시(조건부 요청)를 거치지 않는다.
+        """
+        if not self.supports_details:
+            return None
+        response = await self.fetch(url, detail=True)
+        if response is None or response.status_code == 304:
+            return None
+        return self.parse_detail(self.decode(url, response))
+
+    @classmethod
+    def parse_detail(cls, html: str) -> Optional[Dict]:
+        """상세 페이지 HTML에서 추가 속성 추출 (하위 클래스에서 구현)"""
+        return None
+
+    async def crawl_items(self, pages: int = 3) -> List[Dict]:
+        """경매 물건 크롤링 (전체 결과를 리스트로 반환)"""
+        items = []
+
+        try:
+            async for batch in self.iter_pages(pages):
+                items.extend(batch)
+        except Exception as e:
+            print(f"❌ 크롤링 실패: {e}")
+
+        print(f"🎯 총 {len(items)}개 물건 크롤링 완료")
+        return items
+
+    async def iter_pages(
+        self, pages: int = 3, seen: Optional[BloomFilter] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """페이지를 동시에 요청하고 먼저 끝난 페이지의 물건부터 배치로 반환
+
+        동시에 요청 중인 페이지 수를 호스트별 동시성으로 제한하므로, 소비자가 배치를
+        가져가지 않으면 다음 페이지 요청도 시작되지 않는다 (백프레셔).
+
+        seen(이미 본 URL 필터)을 넘기면 증분 모드로 동작한다. 연속된
+        crawler_incremental_stop_pages 개 페이지의 물건이 모두 이미 본 것이면
+        그 뒤 페이지는 요청하지 않는다. 배치의 URL은 소비자가 적재한 뒤
+        mark_ingested()를 호출해야 필터에 들어간다.
+        """
+        window = self.concurrency
+        stop_after = max(1, settings.crawler_incremental_stop_pages)
+        last_page = pages
+        known_pages = {}  # 페이지 번호 -> 모든 물건을 이미 봤는지
+        pending = {}
+        next_page = 1
+
+        try:
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < window:
+                    pending[asyncio.create_task(self.crawl_page(next_page))] = next_page
+                    next_page += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = pending.pop(task)
+                    batch = task.result()
+                    if batch is None:
+                        # 요청 실패한 페이지는 "이미 본 페이지"로 치지 않음
+                        known_pages[page] = False
+                        continue
+
+                    if seen is not None:
+                        known_pages[page] = all(item['url'] in seen for item in batch)
+                        # 이미 본 URL로는 적재에 성공한 뒤에 기록 (PageBatch.mark_ingested)
+                        if not isinstance(batch, PageBatch):
+                            batch = PageBatch(batch)
+                        batch.seen = seen
+
+                    yield batch
+
+                if seen is not None:
+                    stop_page = self._incremental_stop_page(known_pages, stop_after)
+                    if stop_page is not None and stop_page < last_page:
+                        print(f"⏹️ 페이지 {stop_page - stop_after + 1}~{stop_page}가 모두 이미 본 물건이라 크롤링 조기 종료")
+                        last_page = stop_page
+                        for task, page in list(pending.items()):
+                            if page > last_page:
+                                task.cancel()
+                                del pending[task]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _incremental_stop_page(known_pages: Dict[int, bool], stop_after: int) -> Optional[int]:
+        """연속 stop_after 개 페이지가 모두 이미 본 페이지인 구간의 마지막 페이지 번호"""
+        run = 0
+        previous = None
+        for page in sorted(known_pages):
+            if not known_pages[page]:
+                run = 0
+            elif run and page == previous + 1:
+                run += 1
+            else:
+                run = 1
+            previous = page
+            if run >= stop_after:
+                return page
+        return None
+
+    async def stream_items(
+        self, pages: int = 3, queue_size: Optional[int] = None, seen: Optional[BloomFilter] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """크롤링 결과를 제한된 크기의 큐를 거쳐 페이지 배치 단위로 전달
+
+        크롤링은 별도 태스크에서 진행되고, 큐가 가득 차면 소비자(매칭)가 따라올 때까지 멈춘다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or settings.crawler_queue_size)
+
+        async def produce():
+            try:
+                async for batch in self.iter_pages(pages, seen):
+                    await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
         try:
-            # 요청 간격 조절 (1-3초 랜덤)
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # 인코딩 설정
-            response.encoding = response.apparent_encoding
-            
-            return BeautifulSoup(response.text, 'html.parser')
-            
-        except requests.RequestException as e:
-            print(f"❌ 페이지 요청 실패: {url}, 오류: {e}")
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            producer.cancel()
+
+    async def fetch(
+        self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, detail: bool = False
+    ) -> Optional[httpx.Response]:
+        """호스트별/전체 동시성과 속도 제한을 지키며 웹페이지 요청 (304 응답은 그대로 반환)
+
+        detail=True(상세 페이지)면 목록 페이지 통계(pages_*) 대신 detail_fetches/details_failed에 센다.
+        """
+        waited = time.perf_counter()
+        async with self.limiter.semaphore(url):
+            await self.limiter.bucket(url).acquire()
+            # 전체 동시 요청 슬롯은 실제 요청하는 동안만 점유 (속도 제한 대기 중에는 다른 소스가 사용)
+            if self.global_limit is not None:
+                await self.global_limit.acquire()
+            started = time.perf_counter()
+            self.stats['wait_seconds'] += started - waited
+            status = "error"
+            try:
+                response = await self.client.get(url, params=params, headers=headers)
+                status = str(response.status_code)
+                if response.status_code != 304:
+                    response.raise_for_status()
+                self.stats['detail_fetches' if detail else 'pages_fetched'] += 1
+                return response
+            except httpx.HTTPError as e:
+                self.stats['details_failed' if detail else 'pages_failed'] += 1
+                print(f"❌ 페이지 요청 실패: {url}, 오류: {e}")
+                return None
+            finally:
+                elapsed = time.perf_counter() - started
+                self.stats['fetch_seconds'] += elapsed
+                CRAWLER_FETCH_SECONDS.labels(self.metrics_source).observe(elapsed)
+                CRAWLER_FETCH_TOTAL.labels(self.metrics_source, status).inc()
+                if self.global_limit is not None:
+                    self.global_limit.release()
+
+    async def fetch_content(self, url: str, params: Optional[Dict] = None) -> Optional[FetchedPage]:
+        """웹페이지 요청 후 (본문 바이트, 인코딩, 캐시 검증값) 반환 (디코딩은 호출하는 쪽에서)
+
+        요청 실패 시 None, 이전 실행과 본문이 같으면(304 또는 해시 일치) 파싱할 필요가
+        없으므로 빈 본문을 반환한다. 검증값은 여기서 저장하지 않는다 (PageBatch 참고).
+        """
+        if self.page_cache is None:
+            response = await self.fetch(url, params)
+            return FetchedPage(response.content, self.charset_for(url, response)) if response is not None else None
+
+        key = PageCache.make_key(url, params)
+        cached = await self.page_cache.load(key)
+
+        response = await self.fetch(url, params, self.page_cache.conditional_headers(cached))
+        if response is None:
+            return None
+        if response.status_code == 304:
+            self.stats['pages_not_modified'] += 1
+            return FetchedPage(b"", "")
+
+        content_hash = PageCache.hash_content(response.content)
+        validators = PageValidators(
+            key,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            content_hash,
+        )
+        if cached and cached.content_hash == content_hash:
+            self.stats['pages_not_modified'] += 1
+            return FetchedPage(b"", "", validators)
+
+        return FetchedPage(response.content, self.charset_for(url, response), validators)
+
+    async def fetch_text(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
+        """웹페이지 요청 후 문자열로 디코딩 (실패 시 None, 변경 없으면 빈 문자열)"""
+        page = await self.fetch_content(url, params)
+        if page is None:
+            return None
+        return decode_content(page.content, page.encoding) if page.content else ""
+
+    def charset_for(self, url: str, response: httpx.Response) -> str:
+        """응답 본문 인코딩 결정 (헤더 charset → 호스트 캐시 → meta 선언 → 기본값 순)
+
+        본문 전체에 대한 인코딩 추측(chardet)은 하지 않는다.
+        """
+        host = urlsplit(url).netloc
+        encoding = (
+            normalize_charset(response.charset_encoding)
+            or self._charsets.get(host)
+            or sniff_charset(response.content)
+            or normalize_charset(settings.crawler_default_charset)
+        )
+        self._charsets[host] = encoding
+        return encoding
+
+    def decode(self, url: str, response: httpx.Response) -> str:
+        """응답 본문 디코딩"""
+        return decode_content(response.content, self.charset_for(url, response))
+
+    async def get_page(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
+        """웹페이지 요청 및 파싱"""
+        text = await self.fetch_text(url, params)
+        if text is None:
             return None
-    
-    def extract_number(self, text: str) -> Optional[int]:
-        """텍스트에서 숫자만 추출"""
+        return BeautifulSoup(text, 'html.parser')
+
+    @staticmethod
+    def extract_number(text: str) -> Optional[int]:
+        """텍스트의 첫 번째 숫자 추출 (천 단위 쉼표 허용)
+        
+        "1,840,000,000(1,472,000,000)"처럼 한 칸에 감정가와 최저가가 함께 있어도 첫 숫자만 사용한다.
+        """
         import re
-        numbers = re.findall(r'\d+', text.replace(',', ''))
-        if numbers:
-            return int(''.join(numbers))
+        number = re.search(r'\d[\d,]*', text)
+        if number:
+            return int(number.group().replace(',', ''))
         return None
-    
-    def clean_text(self, text: str) -> str:
+
+    @staticmethod
+    def clean_text(text: str) -> str:
         """텍스트 정리"""
         if not text:
             return ""
         return text.strip().replace('\n', ' ').replace('\t', ' ')
-    
-    def close(self):
-        """세션 종료"""
-        self.session.close() 
\ No newline at end of file
+
+    async def close(self):
+        """HTTP 클라이언트 및 페이지 캐시 종료"""
+        await self.client.aclose()
+        if self.page_cache is not None:
+            self.page_cache.close()
@@ -0,0 +1,69 @@
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+from app.config import settings
+from .base import BaseCrawler
+from .registry import create_crawlers
+from .seen_filter import BloomFilter
+
+
+class CrawlCoordinator:
+    """여러 소스 크롤러를 동시에 실행하고 결과를 하나의 배치 스트림으로 합침
+
+    소스마다 별도 태스크로 크롤링하므로 전체 소요 시간은 가장 느린 소스 하나의 시간에
+    가깝고, 요청 슬롯은 소스별 동시성(HostLimiter)과 전체 동시성(global_limit)을 모두
+    지킨다. 한 소스가 실패해도 나머지 소스의 결과는 그대로 전달된다.
+    """
+
+    def __init__(
+        self,
+        names: Optional[Iterable[str]] = None,
+        global_concurrency: Optional[int] = None,
+        stats: Optional[Dict] = None,
+    ):
+        self.global_limit = asyncio.Semaphore(global_concurrency or settings.crawler_global_concurrency)
+        self.crawlers: List[BaseCrawler] = create_crawlers(names, self.global_limit)
+        self.failed: Dict[str, str] = {}  # 소스 이름 -> 오류
+
+        # 모든 소스가 같은 통계 dict에 누적
+        if stats is not None:
+            for key, value in BaseCrawler.new_stats().items():
+                stats.setdefault(key, value)
+            for crawler in self.crawlers:
+                crawler.stats = stats
+
+    @property
+    def source_names(self) -> List[str]:
+        return [crawler.name for crawler in self.crawlers]
+
+    async def stream_items(
+        self, pages: int = 3, queue_size: Optional[int] = None, seen: Optional[BloomFilter] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """모든 소스의 페이지 배치를 도착 순서대로 하나의 제한된 큐로 전달"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or settings.crawler_queue_size)
+
+        async def produce(crawler: BaseCrawler):
+            try:
+                async for batch in crawler.iter_pages(pages, seen):
+                    await queue.put(batch)
+            except Exception as e:
+                print(f"❌ {crawler.name} 크롤링 실패: {e}")
+                self.failed[crawler.name] = str(e)
+            await queue.put(None)
+
+        producers = [asyncio.create_task(produce(crawler)) for crawler in self.crawlers]
+        remaining = len(producers)
+        try:
+            while remaining:
+                batch = await queue.get()
+                if batch is None:
+                    remaining -= 1
+                    continue
+                yield batch
+        finally:
+            for producer in producers:
+                producer.cancel()
+
+    async def close(self):
+        for crawler in self.crawlers:
+            await crawler.close()
@@ -1,87 +1,146 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, date
+import asyncio
 import re
+import time
+from app.config import settings
+from app.metrics import CRAWLER_PARSE_SECONDS, CRAWLER_ROWS_PER_PAGE
 from .base import BaseCrawler
+from .parse_pool import parse_in_pool
+from .parsers import ListingParser, ListingRow, get_parser
+
+# 상세 페이지 항목 (태그를 걷어낸 텍스트 기준)
+_TAG = re.compile(r'<[^>]+>')
+_AREA = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(?:㎡|m2|m²)')
+_MINIMUM_BID = re.compile(r'최저\s*(?:매각|입찰)?\s*가(?:격)?\s*[:：]?\s*([\d,]+)\s*원')
+_FAILED_BIDS = re.compile(r'유찰\s*(\d+)\s*회')
 
 
 class CourtAuctionCrawler(BaseCrawler):
     """대법원 경매정보 크롤러"""
     
-    def __init__(self):
-        super().__init__()
-        self.base_url = "http://www.courtauction.go.kr"
+    name = "court_auction"
+    source_site = "대법원 경매정보"
+    supports_details = True
+    base_url = "http://www.courtauction.go.kr"
+    
+    def __init__(self, concurrency: Optional[int] = None, global_limit: Optional[asyncio.Semaphore] = None):
+        super().__init__(concurrency, global_limit)
         self.search_url = f"{self.base_url}/RetrieveRealEstateDetailList.laf"
+        self.parser = get_parser(settings.crawler_html_parser)
+    
+    async def crawl_page(self, page: int) -> Optional[List[Dict]]:
+        """대법원 경매정보 목록 페이지 1개 크롤링"""
+        fetched = await self.fetch_content(self.search_url, self._build_params(page))
+        if fetched is None:
+            return None
+        if not fetched.content:
+            # 이전 실행과 같은 페이지
+            return self.page_batch([], fetched)
+        
+        # 경매 물건 목록 추출 (파싱 워커 모드면 프로세스 풀에서, 아니면 이벤트 루프에서)
+        started = time.perf_counter()
+        items, row_count = await parse_in_pool(type(self), self.parser, fetched.content, fetched.encoding)
+        
+        elapsed = time.perf_counter() - started
+        self.stats['parse_seconds'] += elapsed
+        self.stats['rows_parsed'] += len(items)
+        CRAWLER_PARSE_SECONDS.labels(self.metrics_source).observe(elapsed)
+        CRAWLER_ROWS_PER_PAGE.labels(self.metrics_source).observe(len(items))
+        print(f"✅ 페이지 {page}: {row_count}개 물건 처리")
+        return self.page_batch(items, fetched)
     
-    async def crawl_items(self, pages: int = 3) -> List[Dict]:
-        """대법원 경매정보 크롤링"""
+    @classmethod
+    def parse_listing(cls, parser: ListingParser, html: str) -> Tuple[List[Dict], int]:
+        """목록 HTML에서 물건 데이터 추출 (목록 테이블만 파싱) → (물건 목록, 행 수)
+        
+        인스턴스 상태를 쓰지 않으므로 파싱 워커 프로세스에서도 그대로 호출된다.
+        """
         items = []
+        item_rows = parser.extract_rows(html)
         
-        try:
-            for page in range(1, pages + 1):
-                print(f"📄 페이지 {page} 크롤링 중...")
-                
-                # 검색 파라미터 설정
-                params = {
-                    'pageIndex': page,
-                    'pageSize': 20,
-                    'realEstateUsage': '',  # 용도 (빈값 = 전체)
-                    'roadNameAddress': '',  # 도로명주소
-                    'appraisalValueMin': '',  # 최소 감정가
-                    'appraisalValueMax': '',  # 최대 감정가
-                }
-                
-                soup = self.get_page(self.search_url, params)
-                if not soup:
-                    continue
-                
-                # 경매 물건 목록 추출
-                item_rows = soup.find_all('tr', {'class': ['Ltbllist', 'Ltbllist2']})
-                
-                for row in item_rows:
-                    try:
-                        item_data = self._extract_item_data(row)
-                        if item_data:
-                            items.append(item_data)
-                    except Exception as e:
-                        print(f"❌ 물건 데이터 추출 실패: {e}")
-                        continue
-                
-                print(f"✅ 페이지 {page}: {len(item_rows)}개 물건 처리")
-                
-        except Exception as e:
-            print(f"❌ 크롤링 실패: {e}")
+        for row in item_rows:
+            try:
+                item_data = cls._extract_item_data(row)
+                if item_data:
+                    items.append(item_data)
+            except Exception as e:
+                print(f"❌ 물건 데이터 추출 실패: {e}")
+                continue
         
-        print(f"🎯 총 {len(items)}개 물건 크롤링 완료")
-        return items
+        return items, len(item_rows)
+    
+    @classmethod
+    def parse_detail(cls, html: str) -> Optional[Dict]:
+        """물건 상세 페이지에서 면적/최저매각가격/유찰 횟수 추출"""
+        text = ' '.join(_TAG.sub(' ', html).split())
+        
+        # 면적은 목록 내역의 첫 번째 값 (건물 전용면적, 없으면 토지 면적)
+        area_match = _AREA.search(text)
+        area = float(area_match.group(1).replace(',', '')) if area_match else None
+        
+        minimum_bid_match = _MINIMUM_BID.search(text)
+        minimum_bid = cls.extract_number(minimum_bid_match.group(1)) if minimum_bid_match else None
+        
+        failed_bids = _FAILED_BIDS.findall(text)
+        failed_bid_count = max(map(int, failed_bids)) if failed_bids else (0 if minimum_bid else None)
+        
+        if area is None and minimum_bid is None and failed_bid_count is None:
+            return None
+        
+        # 상세 정보로 매칭할 수 있도록 키워드 추가
+        keywords = []
+        if failed_bid_count:
+            keywords.append('유찰')
+        elif failed_bid_count == 0:
+            keywords.append('신건')
+        
+        return {
+            'area': area,
+            'minimum_bid': minimum_bid,
+            'failed_bid_count': failed_bid_count,
+            'keywords': keywords,
+        }
+    
+    def _build_params(self, page: int) -> Dict:
+        """검색 파라미터 설정"""
+        return {
+            'pageIndex': page,
+            'pageSize': 20,
+            'realEstateUsage': '',  # 용도 (빈값 = 전체)
+            'roadNameAddress': '',  # 도로명주소
+            'appraisalValueMin': '',  # 최소 감정가
+            'appraisalValueMax': '',  # 최대 감정가
+        }
     
-    def _extract_item_data(self, row) -> Dict:
+    @classmethod
+    def _extract_item_data(cls, row: ListingRow) -> Dict:
         """테이블 행에서 물건 데이터 추출"""
         try:
-            cells = row.find_all('td')
+            cells = row.cells
             if len(cells) < 8:
                 return None
             
             # 물건 상세 링크 추출
-            detail_link = cells[2].find('a')
-            if not detail_link:
+            if row.link_text is None:
                 return None
             
-            href = detail_link.get('href', '')
-            detail_url = f"{self.base_url}/{href}" if href else ""
+            href = row.link_href
+            detail_url = f"{cls.base_url}/{href}" if href else ""
             
             # 물건명/주소
-            title = self.clean_text(detail_link.get_text())
+            title = cls.clean_text(row.link_text)
             
             # 감정가 추출
-            appraisal_text = self.clean_text(cells[4].get_text())
-            appraisal_value = self.extract_number(appraisal_text)
+            appraisal_text = cls.clean_text(cells[4])
+            appraisal_value = cls.extract_number(appraisal_text)
             
             # 입찰일 추출
-            bid_date_text = self.clean_text(cells[6].get_text())
-            bid_date = self._parse_date(bid_date_text)
+            bid_date_text = cls.clean_text(cells[6])
+            bid_date = cls._parse_date(bid_date_text)
             
             # 키워드 추출 (제목에서)
-            keywords = self._extract_keywords(title)
+            keywords = cls._extract_keywords(title)
             
             return {
                 'title': title,
@@ -89,14 +148,15 @@ class CourtAuctionCrawler(BaseCrawler):
                 'bid_date': bid_date,
                 'url': detail_url,
                 'keywords': keywords,
-                'source_site': '대법원 경매정보'
+                'source_site': cls.source_site
             }
             
         except Exception as e:
             print(f"❌ 데이터 추출 오류: {e}")
             return None
     
-    def _parse_date(self, date_text: str) -> date:
+    @staticmethod
+    def _parse_date(date_text: str) -> date:
         """날짜 텍스트를 date 객체로 변환"""
         try:
             # "2024.02.15" 형태로 가정
@@ -108,7 +168,8 @@ class CourtAuctionCrawler(BaseCrawler):
             pass
         return None
     
-    def _extract_keywords(self, title: str) -> List[str]:
+    @staticmethod
+    def _extract_keywords(title: str) -> List[str]:
         """제목에서 키워드 추출"""
         keywords = []
         
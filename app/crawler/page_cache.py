@@ -0,0 +1,111 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, NamedTuple, Optional
+from urllib.parse import urlencode
+
+
+class CachedPage(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+
+
+class PageValidators(NamedTuple):
+    """이번 응답의 검증값 (페이지의 물건을 적재한 뒤에 PageCache.store로 저장)"""
+    key: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+
+
+class PageCache:
+    """(url, params)별 ETag/Last-Modified/본문 해시를 로컬 디스크(sqlite)에 보관
+
+    sqlite 읽기/쓰기는 이벤트 루프를 막지 않도록 전용 스레드 하나에서 실행한다
+    (비동기 코드에서는 load/store 사용).
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-cache")
+        # 연결은 만든 스레드와 전용 스레드에서 번갈아 쓰지만 동시에 쓰지는 않음
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """요청 URL과 파라미터로 캐시 키 생성 (파라미터 순서 무관)"""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        row = self.conn.execute(
+            "SELECT etag, last_modified, content_hash FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def conditional_headers(self, cached: Optional[CachedPage]) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        return headers
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], content_hash: str):
+        self.put_many([PageValidators(key, etag, last_modified, content_hash)])
+
+    def put_many(self, pages: Iterable[PageValidators]):
+        """검증값 여러 개를 한 트랜잭션으로 저장"""
+        now = time.time()
+        self.conn.executemany(
+            """
+            INSERT INTO pages (key, etag, last_modified, content_hash, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash,
+                updated_at = excluded.updated_at
+            """,
+            [(page.key, page.etag, page.last_modified, page.content_hash, now) for page in pages],
+        )
+        self.conn.commit()
+
+    async def load(self, key: str) -> Optional[CachedPage]:
+        """get을 전용 스레드에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, key)
+
+    async def store(self, pages: Iterable[PageValidators]):
+        """put_many를 전용 스레드에서 실행"""
+        pages = list(pages)
+        if pages:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self.put_many, pages)
+
+    def close(self):
+        # 진행 중인 저장이 끝난 뒤 연결 종료
+        self._executor.shutdown(wait=True)
+        self.conn.close()
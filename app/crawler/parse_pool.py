@@ -0,0 +1,67 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple, Type
+
+from app.config import settings
+from .parsers import ListingParser, decode_content, get_parser
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+# 워커 프로세스 안에서 엔진별로 한 번만 생성한 파서
+_worker_parsers: Dict[str, ListingParser] = {}
+
+
+def parse_listing_content(crawler_class: Type, engine: str, content: bytes, encoding: str) -> Tuple[List[Dict], int]:
+    """(워커 프로세스) 원본 바이트를 디코딩해 목록 행과 물건 데이터를 추출
+
+    crawler_class는 모듈 경로로 pickle되므로 크롤러 인스턴스(HTTP 클라이언트 등)는 넘어가지 않는다.
+    """
+    parser = _worker_parsers.get(engine)
+    if parser is None:
+        parser = _worker_parsers[engine] = get_parser(engine)
+    return crawler_class.parse_listing(parser, decode_content(content, encoding))
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """파싱 워커 프로세스 풀 (crawler_parse_workers가 0이면 None → 이벤트 루프에서 직접 파싱)"""
+    global _pool
+    if settings.crawler_parse_workers <= 0:
+        return None
+    if _pool is None:
+        # 이벤트 루프/DB 연결 상태를 물려받지 않도록 spawn으로 새 프로세스 시작
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.crawler_parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        print(f"🧵 파싱 워커 프로세스 {settings.crawler_parse_workers}개 시작")
+    return _pool
+
+
+async def parse_in_pool(
+    crawler_class: Type, parser: ListingParser, content: bytes, encoding: str
+) -> Tuple[List[Dict], int]:
+    """워커 프로세스에서 파싱 (풀이 없거나 깨졌으면 현재 프로세스에서 파싱)"""
+    global _pool
+    pool = get_parse_pool()
+    if pool is not None:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                pool, parse_listing_content, crawler_class, parser.name, content, encoding
+            )
+        except BrokenProcessPool as e:
+            print(f"⚠️ 파싱 워커 풀 오류, 다시 생성합니다: {e}")
+            if _pool is pool:
+                _pool = None
+            pool.shutdown(wait=False)
+
+    return crawler_class.parse_listing(parser, decode_content(content, encoding))
+
+
+def shutdown_parse_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
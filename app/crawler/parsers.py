@@ -0,0 +1,183 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Type
+import re
+from app.config import settings
+
+# 목록 테이블 행 클래스 (대법원 경매정보)
+LISTING_ROW_CLASSES = ('Ltbllist', 'Ltbllist2')
+
+_ROW_CLASS = re.compile(r'class\s*=\s*["\']?\s*ltbllist')
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+# 선언된 charset을 실제 디코딩에 쓸 코덱으로 (EUC-KR 페이지에는 CP949 확장 문자가 섞여 있음)
+_CODEC_ALIASES = {
+    'euc-kr': 'cp949',
+    'euckr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'x-windows-949': 'cp949',
+}
+
+
+class ListingRow(NamedTuple):
+    """목록 테이블의 한 행 (파서 엔진과 무관한 형태)"""
+    cells: List[str]  # 각 td의 텍스트
+    link_text: Optional[str]  # 세 번째 td의 상세 링크 텍스트 (링크가 없으면 None)
+    link_href: Optional[str]
+
+
+def normalize_charset(charset: Optional[str]) -> Optional[str]:
+    """charset 이름을 디코딩용 코덱 이름으로 변환"""
+    if not charset:
+        return None
+    name = charset.strip().lower()
+    return _CODEC_ALIASES.get(name, name)
+
+
+def sniff_charset(content: bytes) -> Optional[str]:
+    """문서 앞부분의 <meta charset> 선언 확인"""
+    match = _META_CHARSET.search(content[:2048])
+    if match:
+        return normalize_charset(match.group(1).decode('ascii'))
+    return None
+
+
+def decode_content(content: bytes, encoding: str) -> str:
+    """본문 바이트 디코딩 (알 수 없는 인코딩이면 기본 charset으로)"""
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode(normalize_charset(settings.crawler_default_charset), errors='replace')
+
+
+def listing_fragment(html: str) -> str:
+    """목록 행이 들어있는 <table> 부분만 잘라내기 (찾지 못하면 원문 그대로)"""
+    lower = html.lower()
+    rows = [match.start() for match in _ROW_CLASS.finditer(lower)]
+    if not rows:
+        return html
+
+    start = lower.rfind('<table', 0, rows[0])
+    if start < 0:
+        return html
+
+    # 마지막 행 이후에서 중첩 테이블을 건너뛰고 목록 테이블의 닫는 태그 찾기
+    pos, depth = rows[-1], 0
+    while True:
+        close = lower.find('</table', pos)
+        if close < 0:
+            return html[start:]
+        depth += lower.count('<table', pos, close)
+        if depth == 0:
+            end = lower.find('>', close)
+            return html[start:end + 1 if end >= 0 else len(html)]
+        depth -= 1
+        pos = close + len('</table')
+
+
+class ListingParser(ABC):
+    """목록 페이지 파서 엔진"""
+
+    name = ""
+
+    @abstractmethod
+    def extract_rows(self, html: str) -> List[ListingRow]:
+        """HTML에서 목록 행 추출"""
+        pass
+
+
+class SoupListingParser(ListingParser):
+    """BeautifulSoup(html.parser) 엔진 - 목록 행만 파싱"""
+
+    name = "html.parser"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup, SoupStrainer
+        self._soup = BeautifulSoup
+        self._strainer = SoupStrainer('tr', {'class': list(LISTING_ROW_CLASSES)})
+
+    def extract_rows(self, html: str) -> List[ListingRow]:
+        soup = self._soup(listing_fragment(html), 'html.parser', parse_only=self._strainer)
+        rows = []
+        for tr in soup.find_all('tr', {'class': list(LISTING_ROW_CLASSES)}):
+            tds = tr.find_all('td', recursive=False)
+            link = tds[2].find('a') if len(tds) > 2 else None
+            rows.append(ListingRow(
+                cells=[td.get_text() for td in tds],
+                link_text=link.get_text() if link else None,
+                link_href=link.get('href', '') if link else None,
+            ))
+        return rows
+
+
+class LxmlListingParser(ListingParser):
+    """lxml 엔진"""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        self._fromstring = lxml.html.fromstring
+        self._xpath = " | ".join(
+            f"//tr[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+            for cls in LISTING_ROW_CLASSES
+        )
+
+    def extract_rows(self, html: str) -> List[ListingRow]:
+        fragment = listing_fragment(html)
+        if not fragment.strip():
+            return []
+        root = self._fromstring(fragment)
+        rows = []
+        for tr in root.xpath(self._xpath):
+            tds = tr.findall('td')
+            links = tds[2].findall('.//a') if len(tds) > 2 else []
+            link = links[0] if links else None
+            rows.append(ListingRow(
+                cells=[td.text_content() for td in tds],
+                link_text=link.text_content() if link is not None else None,
+                link_href=link.get('href', '') if link is not None else None,
+            ))
+        return rows
+
+
+class SelectolaxListingParser(ListingParser):
+    """selectolax(lexbor) 엔진 - 설치된 경우에만 사용 가능"""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+        self._selector = ", ".join(f"tr.{cls}" for cls in LISTING_ROW_CLASSES)
+
+    def extract_rows(self, html: str) -> List[ListingRow]:
+        tree = self._parser(listing_fragment(html))
+        rows = []
+        for tr in tree.css(self._selector):
+            tds = [node for node in tr.iter() if node.tag == 'td']
+            link = tds[2].css_first('a') if len(tds) > 2 else None
+            rows.append(ListingRow(
+                cells=[td.text(deep=True) for td in tds],
+                link_text=link.text(deep=True) if link else None,
+                link_href=(link.attributes.get('href') or '') if link else None,
+            ))
+        return rows
+
+
+PARSERS: Dict[str, Type[ListingParser]] = {
+    parser.name: parser
+    for parser in (SoupListingParser, LxmlListingParser, SelectolaxListingParser)
+}
+
+
+def get_parser(name: str) -> ListingParser:
+    """이름으로 파서 엔진 생성 (라이브러리가 없으면 html.parser로 대체)"""
+    parser_class = PARSERS.get(name)
+    if parser_class is None:
+        raise ValueError(f"지원하지 않는 파서 엔진: {name}")
+
+    try:
+        return parser_class()
+    except ImportError:
+        print(f"⚠️ {name} 파서를 사용할 수 없어 html.parser로 대체합니다")
+        return SoupListingParser()
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """토큰 버킷 요청 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (이벤트 루프는 막지 않음)"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 + 초당 요청 수 제한"""
+
+    def __init__(self, concurrency: int, rate: float, burst: int):
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.burst = burst
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _host(self, url: str) -> str:
+        return urlsplit(url).netloc
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        host = self._host(url)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.concurrency)
+        return self._semaphores[host]
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = self._host(url)
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
@@ -0,0 +1,47 @@
+import asyncio
+import importlib
+import inspect
+import pkgutil
+from typing import Dict, Iterable, List, Optional, Type
+
+from app.config import settings
+from .base import BaseCrawler
+
+
+def discover_crawlers() -> Dict[str, Type[BaseCrawler]]:
+    """app.crawler 패키지의 모듈을 모두 불러와 name이 지정된 BaseCrawler 하위 클래스 수집"""
+    package = importlib.import_module(__package__)
+    for module in pkgutil.iter_modules(package.__path__):
+        importlib.import_module(f"{__package__}.{module.name}")
+
+    crawlers = {}
+    stack = list(BaseCrawler.__subclasses__())
+    while stack:
+        crawler_class = stack.pop()
+        stack.extend(crawler_class.__subclasses__())
+        if crawler_class.name and not inspect.isabstract(crawler_class):
+            crawlers[crawler_class.name] = crawler_class
+    return crawlers
+
+
+def create_crawlers(
+    names: Optional[Iterable[str]] = None, global_limit: Optional[asyncio.Semaphore] = None
+) -> List[BaseCrawler]:
+    """이름으로 크롤러 생성 (names가 비어 있으면 등록된 전체)
+
+    소스별 동시 요청 수는 crawler_source_concurrency 설정을 따른다.
+    """
+    registry = discover_crawlers()
+    names = list(names or registry)
+
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"등록되지 않은 크롤러 소스: {', '.join(unknown)}")
+
+    return [
+        registry[name](
+            concurrency=settings.crawler_source_concurrency.get(name),
+            global_limit=global_limit,
+        )
+        for name in names
+    ]
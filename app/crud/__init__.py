@@ -1,5 +1,8 @@
 from .keyword import keyword_crud
 from .detected_item import detected_item_crud
 from .alert import alert_crud
+from .alert_inbox import alert_inbox_crud
+from .crawl_job import crawl_job_crud
+from .notification_outbox import notification_outbox_crud
 
-__all__ = ["keyword_crud", "detected_item_crud", "alert_crud"] 
\ No newline at end of file
+__all__ = ["keyword_crud", "detected_item_crud", "alert_crud", "alert_inbox_crud", "crawl_job_crud", "notification_outbox_crud"] 
\ No newline at end of file
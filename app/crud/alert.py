@@ -1,9 +1,28 @@
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from collections import Counter
+from sqlalchemy import select, update, func, bindparam, String, Integer, Text
+from sqlalchemy.dialects.postgresql import insert, ARRAY
 from sqlalchemy.orm import joinedload
 from app.models.alert import Alert
+from app.models.detected_item import DetectedItem
 from app.schemas.alert import AlertCreate
+from .alert_inbox import alert_inbox_crud
+from .notification_outbox import notification_outbox_crud
+from .pagination import Cursor, keyset_before
+
+
+def item_summary():
+    """알림과 함께 저장할 물건 요약 (목록 화면에서 물건 테이블 조인 없이 사용)"""
+    return func.jsonb_build_object(
+        'title', DetectedItem.title,
+        'url', DetectedItem.url,
+        'appraisal_value', DetectedItem.appraisal_value,
+        'minimum_bid', DetectedItem.minimum_bid,
+        'bid_date', DetectedItem.bid_date,
+        'area', DetectedItem.area,
+        'source_site', DetectedItem.source_site,
+    )
 
 
 class AlertCRUD:
@@ -12,24 +31,143 @@ class AlertCRUD:
         alert = Alert(
             user_id=alert_in.user_id,
             item_id=alert_in.item_id,
-            message=alert_in.message
+            message=alert_in.message,
+            item_summary=select(item_summary()).where(DetectedItem.id == alert_in.item_id).scalar_subquery()
         )
         db.add(alert)
+        await db.flush()
+        await db.refresh(alert)
+        await alert_inbox_crud.add_alerts(db, {alert.user_id: (1, alert.sent_at)})
         await db.commit()
         await db.refresh(alert)
         return alert
     
-    async def get_by_user_id(self, db: AsyncSession, user_id: str, limit: int = 50) -> List[Alert]:
-        """사용자별 알림 목록 조회 (관련 물건 정보 포함)"""
+    async def bulk_create(
+        self, db: AsyncSession, alerts_in: List[AlertCreate], channels: Sequence[str] = ()
+    ) -> Dict:
+        """알림 일괄 생성 (이미 보낸 (user_id, item_id) 알림은 건너뜀)
+        
+        배열 파라미터를 unnest 한 INSERT ... SELECT ... ON CONFLICT DO NOTHING 한 문장으로
+        처리하므로 구독자 수와 관계없이 왕복 횟수가 일정하다.
+        물건 요약(item_summary)을 함께 저장하고, 같은 트랜잭션에서 사용자별 안 읽은 알림 수를
+        늘린다. channels가 있으면 새로 생성된 알림의 외부 채널 발송 행(outbox)도 추가한다.
+        커밋하지 않음: 새 물건 저장과 같은 트랜잭션으로 호출한 쪽에서 커밋.
+        """
+        if not alerts_in:
+            return {'requested': 0, 'created': 0, 'duplicates': 0}
+        
+        source = func.unnest(
+            bindparam('user_ids', [alert.user_id for alert in alerts_in], type_=ARRAY(String(100))),
+            bindparam('item_ids', [alert.item_id for alert in alerts_in], type_=ARRAY(Integer)),
+            bindparam('messages', [alert.message for alert in alerts_in], type_=ARRAY(Text)),
+        ).table_valued('user_id', 'item_id', 'message')
+        
         result = await db.execute(
+            insert(Alert)
+            .from_select(
+                ['user_id', 'item_id', 'message', 'item_summary'],
+                select(source.c.user_id, source.c.item_id, source.c.message, item_summary())
+                .select_from(source.join(DetectedItem, DetectedItem.id == source.c.item_id))
+            )
+            .on_conflict_do_nothing(index_elements=[Alert.user_id, Alert.item_id])
+            .returning(Alert.id, Alert.user_id, Alert.sent_at)
+        )
+        rows = result.all()
+        created = len(rows)
+        
+        # 같은 트랜잭션에서 사용자별 안 읽은 알림 수 증가, 외부 채널 발송 행 추가
+        added = Counter(row.user_id for row in rows)
+        last_at = {}
+        for row in rows:
+            last_at[row.user_id] = max(last_at.get(row.user_id, row.sent_at), row.sent_at)
+        await alert_inbox_crud.add_alerts(db, {user_id: (added[user_id], last_at[user_id]) for user_id in added})
+        await notification_outbox_crud.enqueue(db, [(row.id, row.user_id) for row in rows], channels)
+        
+        return {
+            'requested': len(alerts_in),
+            'created': created,
+            'duplicates': len(alerts_in) - created
+        }
+    
+    async def get_by_user_id(
+        self, db: AsyncSession, user_id: str, limit: int = 50, cursor: Optional[Cursor] = None
+    ) -> List[Alert]:
+        """사용자별 알림 목록 조회 (관련 물건 정보 포함, cursor 이후 페이지, (sent_at, id) 키셋)"""
+        query = (
             select(Alert)
             .options(joinedload(Alert.item))
             .where(Alert.user_id == user_id)
-            .order_by(Alert.sent_at.desc())
+        )
+        after = keyset_before(Alert.sent_at, Alert.id, cursor)
+        if after is not None:
+            query = query.where(after)
+        result = await db.execute(
+            query
+            .order_by(Alert.sent_at.desc(), Alert.id.desc())
             .limit(limit)
         )
         return result.scalars().unique().all()
     
+    async def get_inbox(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        unread_only: bool = False
+    ) -> List[Alert]:
+        """알림함 목록 (물건 조인 없이 저장된 요약만, (sent_at, id) 키셋)"""
+        query = select(Alert).where(Alert.user_id == user_id)
+        if unread_only:
+            query = query.where(Alert.read_at.is_(None))
+        after = keyset_before(Alert.sent_at, Alert.id, cursor)
+        if after is not None:
+            query = query.where(after)
+        result = await db.execute(
+            query
+            .order_by(Alert.sent_at.desc(), Alert.id.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+    
+    async def mark_read(self, db: AsyncSession, user_id: str, alert_ids: Optional[List[int]] = None) -> Dict:
+        """알림 읽음 처리 (alert_ids가 없으면 안 읽은 알림 전체)
+        
+        실제로 안 읽음 → 읽음으로 바뀐 알림 수만큼 같은 트랜잭션에서 안 읽은 알림 수를 줄인다.
+        """
+        query = (
+            update(Alert)
+            .where(Alert.user_id == user_id, Alert.read_at.is_(None))
+            .values(read_at=func.now())
+            .returning(Alert.id)
+            .execution_options(synchronize_session=False)
+        )
+        if alert_ids is not None:
+            if not alert_ids:
+                inbox = await alert_inbox_crud.get(db, user_id)
+                return {'marked': 0, 'unread_count': inbox.unread_count if inbox else 0}
+            query = query.where(Alert.id.in_(alert_ids))
+        
+        marked = len((await db.execute(query)).all())
+        unread_count = await alert_inbox_crud.mark_read(db, user_id, marked)
+        await db.commit()
+        return {'marked': marked, 'unread_count': unread_count}
+    
+    async def stream_alerts(
+        self, db: AsyncSession, user_id: Optional[str] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Alert]:
+        """알림을 최신순으로 서버 측 커서로 순회 (내보내기용, user_id가 없으면 전체)"""
+        query = select(Alert).options(joinedload(Alert.item))
+        if user_id is not None:
+            query = query.where(Alert.user_id == user_id)
+        result = await db.stream_scalars(
+            query
+            .order_by(Alert.sent_at.desc(), Alert.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for alert in result:
+            yield alert
+    
     async def get_by_id(self, db: AsyncSession, alert_id: int) -> Optional[Alert]:
         """ID로 알림 조회"""
         result = await db.execute(
@@ -39,6 +177,29 @@ class AlertCRUD:
         )
         return result.scalar_one_or_none()
     
+    async def get_by_ids(self, db: AsyncSession, alert_ids: List[int]) -> List[Alert]:
+        """ID 목록으로 알림 조회 (관련 물건 정보 포함, 요약 메일 작성용)"""
+        if not alert_ids:
+            return []
+        result = await db.execute(
+            select(Alert)
+            .options(joinedload(Alert.item))
+            .where(Alert.id.in_(alert_ids))
+            .order_by(Alert.sent_at, Alert.id)
+        )
+        return result.scalars().unique().all()
+    
+    async def get_since(self, db: AsyncSession, user_id: str, after_id: int, limit: int = 100) -> List[Alert]:
+        """after_id 이후 생성된 사용자 알림 (실시간 스트림 재연결 시 놓친 알림 보충, 오래된 순)"""
+        result = await db.execute(
+            select(Alert)
+            .options(joinedload(Alert.item))
+            .where(Alert.user_id == user_id, Alert.id > after_id)
+            .order_by(Alert.id)
+            .limit(limit)
+        )
+        return result.scalars().unique().all()
+    
     async def check_duplicate_alert(self, db: AsyncSession, user_id: str, item_id: int) -> bool:
         """중복 알림 체크"""
         result = await db.execute(
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, bindparam, Integer, String, DateTime
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from app.models.alert_inbox import AlertInbox
+
+
+class AlertInboxCRUD:
+    async def get(self, db: AsyncSession, user_id: str) -> Optional[AlertInbox]:
+        """사용자 알림함 요약 (기본 키 조회)"""
+        return await db.get(AlertInbox, user_id)
+
+    async def add_alerts(self, db: AsyncSession, counts: Dict[str, Tuple[int, datetime]]) -> None:
+        """새 알림 수만큼 안 읽은/전체 알림 수 증가 (counts: user_id → (개수, 마지막 알림 시각), 커밋하지 않음)
+
+        사용자 순서를 정렬해서 갱신하므로 동시에 실행되는 적재끼리 교착 상태가 생기지 않는다.
+        """
+        if not counts:
+            return
+
+        user_ids = sorted(counts)
+        source = func.unnest(
+            bindparam('inbox_user_ids', user_ids, type_=ARRAY(String(100))),
+            bindparam('inbox_counts', [counts[user_id][0] for user_id in user_ids], type_=ARRAY(Integer)),
+            bindparam('inbox_last_at', [counts[user_id][1] for user_id in user_ids], type_=ARRAY(DateTime(timezone=True))),
+        ).table_valued('user_id', 'added', 'last_alert_at')
+
+        statement = insert(AlertInbox).from_select(
+            ['user_id', 'unread_count', 'total_count', 'last_alert_at'],
+            select(source.c.user_id, source.c.added, source.c.added, source.c.last_alert_at)
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[AlertInbox.user_id],
+                set_={
+                    'unread_count': AlertInbox.unread_count + statement.excluded.unread_count,
+                    'total_count': AlertInbox.total_count + statement.excluded.total_count,
+                    'last_alert_at': func.greatest(AlertInbox.last_alert_at, statement.excluded.last_alert_at),
+                    'updated_at': func.now(),
+                }
+            )
+        )
+
+    async def mark_read(self, db: AsyncSession, user_id: str, count: int) -> int:
+        """읽음 처리한 알림 수만큼 안 읽은 알림 수 감소 (커밋하지 않음, 남은 안 읽은 알림 수 반환)"""
+        result = await db.execute(
+            update(AlertInbox)
+            .where(AlertInbox.user_id == user_id)
+            .values(
+                unread_count=func.greatest(AlertInbox.unread_count - count, 0),
+                updated_at=func.now(),
+            )
+            .returning(AlertInbox.unread_count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() or 0
+
+
+alert_inbox_crud = AlertInboxCRUD()
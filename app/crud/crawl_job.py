@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from app.models.crawl_job import CrawlJob
+from app.schemas.crawl_job import CrawlJobCreate
+
+
+class CrawlJobCRUD:
+    async def create(self, db: AsyncSession, job_in: CrawlJobCreate) -> CrawlJob:
+        """크롤링 작업 생성"""
+        job = CrawlJob(
+            status="running",
+            trigger=job_in.trigger,
+            pages_requested=job_in.pages_requested,
+            incremental=job_in.incremental
+        )
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+    
+    async def update(self, db: AsyncSession, job_id: int, values: Dict) -> None:
+        """크롤링 작업 통계/상태 갱신 (테이블에 없는 키는 무시)"""
+        columns = {key: value for key, value in values.items() if key in CrawlJob.__table__.columns}
+        if not columns:
+            return
+        await db.execute(
+            update(CrawlJob).where(CrawlJob.id == job_id).values(**columns)
+        )
+        await db.commit()
+    
+    async def get_by_id(self, db: AsyncSession, job_id: int) -> Optional[CrawlJob]:
+        """ID로 크롤링 작업 조회"""
+        result = await db.execute(
+            select(CrawlJob).where(CrawlJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def get_recent_jobs(self, db: AsyncSession, limit: int = 20) -> List[CrawlJob]:
+        """최근 크롤링 작업 목록 조회"""
+        result = await db.execute(
+            select(CrawlJob)
+            .order_by(CrawlJob.started_at.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+
+crawl_job_crud = CrawlJobCRUD()
@@ -1,6 +1,11 @@
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set
+import json
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, update, and_, or_, case, cast, func
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.exc import DBAPIError
+from app.config import settings
+from .pagination import Cursor, keyset_before
 from app.models.detected_item import DetectedItem
 from app.schemas.detected_item import DetectedItemCreate
 
@@ -21,6 +26,54 @@ class DetectedItemCRUD:
         await db.refresh(item)
         return item
     
+    async def bulk_create(
+        self, db: AsyncSession, items_in: List[DetectedItemCreate], chunk_size: int = 1000
+    ) -> List[DetectedItem]:
+        """물건 일괄 저장 (이미 있는 URL은 건너뛰고 새로 저장된 물건만 반환)
+        
+        다중 행 INSERT ... ON CONFLICT (url) DO NOTHING RETURNING 으로 중복 체크와 저장을
+        함께 처리한다. 커밋하지 않음: 이어지는 알림 생성과 같은 트랜잭션으로 호출한 쪽에서 커밋.
+        DB가 거부하는 행이 있으면 그 묶음만 savepoint로 되돌리고 행별로 다시 저장해서 그 행만 빠진다.
+        """
+        rows = []
+        seen_urls = set()
+        for item_in in items_in:
+            if item_in.url in seen_urls:
+                continue
+            seen_urls.add(item_in.url)
+            rows.append(item_in.model_dump())
+        
+        created = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            try:
+                async with db.begin_nested():
+                    created.extend(await self._insert_rows(db, chunk))
+            except DBAPIError as e:
+                print(f"⚠️ 물건 일괄 저장 실패, 행별로 다시 저장: {e.orig}")
+                for row in chunk:
+                    try:
+                        async with db.begin_nested():
+                            created.extend(await self._insert_rows(db, [row]))
+                    except DBAPIError as e:
+                        print(f"❌ 물건 저장 실패: {row['url']}, 오류: {e.orig}")
+        return created
+    
+    async def _insert_rows(self, db: AsyncSession, rows: List[Dict]) -> List[DetectedItem]:
+        result = await db.execute(
+            insert(DetectedItem)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[DetectedItem.url])
+            .returning(DetectedItem)
+        )
+        return result.scalars().all()
+    
+    async def bulk_update_details(self, db: AsyncSession, details: List[Dict]) -> None:
+        """상세 페이지 보강 속성 일괄 갱신 (details: id와 갱신할 컬럼을 담은 dict 목록, 커밋하지 않음)"""
+        if not details:
+            return
+        await db.execute(update(DetectedItem), details)
+    
     async def get_by_id(self, db: AsyncSession, item_id: int) -> Optional[DetectedItem]:
         """ID로 물건 조회"""
         result = await db.execute(
@@ -35,44 +88,103 @@ class DetectedItemCRUD:
         )
         return result.scalar_one_or_none()
     
-    async def get_recent_items(self, db: AsyncSession, limit: int = 50) -> List[DetectedItem]:
-        """최근 감지된 물건 목록 조회"""
+    async def get_existing_urls(self, db: AsyncSession, urls: List[str]) -> Set[str]:
+        """urls 중 이미 저장된 URL 집합"""
+        if not urls:
+            return set()
+        result = await db.execute(select(DetectedItem.url).where(DetectedItem.url.in_(urls)))
+        return set(result.scalars().all())
+    
+    async def iter_urls(self, db: AsyncSession, batch_size: int = 5000) -> AsyncIterator[str]:
+        """저장된 모든 물건 URL을 서버 측 커서로 순회"""
+        result = await db.stream_scalars(
+            select(DetectedItem.url).execution_options(yield_per=batch_size)
+        )
+        async for url in result:
+            yield url
+    
+    async def get_recent_items(
+        self, db: AsyncSession, limit: int = 50, cursor: Optional[Cursor] = None
+    ) -> List[DetectedItem]:
+        """최근 감지된 물건 목록 조회 (cursor 이후 페이지, (created_at, id) 키셋)"""
+        query = select(DetectedItem)
+        after = keyset_before(DetectedItem.created_at, DetectedItem.id, cursor)
+        if after is not None:
+            query = query.where(after)
         result = await db.execute(
-            select(DetectedItem)
-            .order_by(DetectedItem.created_at.desc())
+            query
+            .order_by(DetectedItem.created_at.desc(), DetectedItem.id.desc())
             .limit(limit)
         )
         return result.scalars().all()
     
-    async def get_by_keyword(self, db: AsyncSession, keyword: str, limit: int = 50) -> List[DetectedItem]:
-        """키워드로 물건 검색"""
-        result = await db.execute(
+    async def stream_all(self, db: AsyncSession, batch_size: int = 1000) -> AsyncIterator[DetectedItem]:
+        """전체 물건을 최신순으로 서버 측 커서로 순회 (내보내기용, 메모리 사용량 일정)"""
+        result = await db.stream_scalars(
             select(DetectedItem)
-            .where(
-                or_(
-                    DetectedItem.title.ilike(f"%{keyword}%"),
-                    DetectedItem.keywords.op("@>")(f'["{keyword}"]')
-                )
+            .order_by(DetectedItem.created_at.desc(), DetectedItem.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for item in result:
+            yield item
+    
+    def _keyword_condition(self, keyword: str):
+        """키워드 검색 조건 (인덱스 사용)
+        
+        제목은 글자 bigram 배열 포함(GIN 인덱스)으로 후보를 좁힌 뒤 ILIKE로 확인하고,
+        추출 키워드는 JSONB 포함(GIN 인덱스)으로 찾는다. bigram이 없는 한 글자 키워드만
+        인덱스 없이 ILIKE로 검색한다.
+        """
+        title_match = DetectedItem.title.icontains(keyword, autoescape=True)
+        if any(len(word) >= 2 for word in keyword.split()):
+            title_match = and_(
+                DetectedItem.title_bigrams.op("@>")(func.auction_bigrams(keyword)),
+                title_match
             )
-            .order_by(DetectedItem.created_at.desc())
-            .limit(limit)
+        return or_(title_match, self._keyword_tag_match(keyword))
+    
+    def _keyword_tag_match(self, keyword: str):
+        return DetectedItem.keywords.op("@>")(cast(json.dumps([keyword], ensure_ascii=False), JSONB))
+    
+    def _keyword_rank(self, keywords: List[str]):
+        """검색 순위 점수 (추출 키워드 일치 1점 + 제목 단어 유사도)"""
+        return sum(
+            case((self._keyword_tag_match(keyword), 1.0), else_=0.0)
+            + func.word_similarity(keyword, DetectedItem.title)
+            for keyword in keywords
         )
-        return result.scalars().all()
     
-    async def get_matching_items(self, db: AsyncSession, keywords: List[str], limit: int = 100) -> List[DetectedItem]:
-        """여러 키워드와 매칭되는 물건 조회"""
-        conditions = []
-        for keyword in keywords:
-            conditions.append(DetectedItem.title.ilike(f"%{keyword}%"))
-            conditions.append(DetectedItem.keywords.op("@>")(f'["{keyword}"]'))
+    async def _search(self, db: AsyncSession, keywords: List[str], limit: int) -> List[DetectedItem]:
+        """키워드 검색 후 순위순 정렬
+        
+        매칭되는 물건 중 최신 search_candidate_limit 개만 후보로 삼아 순위를 계산하므로,
+        흔한 키워드라도 테이블 크기와 무관하게 일정한 비용으로 끝난다.
+        """
+        keywords = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+        if not keywords:
+            return []
         
+        candidates = (
+            select(DetectedItem.id)
+            .where(or_(*(self._keyword_condition(keyword) for keyword in keywords)))
+            .order_by(DetectedItem.created_at.desc())
+            .limit(settings.search_candidate_limit)
+            .subquery()
+        )
         result = await db.execute(
             select(DetectedItem)
-            .where(or_(*conditions))
-            .order_by(DetectedItem.created_at.desc())
+            .join(candidates, DetectedItem.id == candidates.c.id)
+            .order_by(self._keyword_rank(keywords).desc(), DetectedItem.created_at.desc())
             .limit(limit)
         )
         return result.scalars().all()
-
+    
+    async def get_by_keyword(self, db: AsyncSession, keyword: str, limit: int = 50) -> List[DetectedItem]:
+        """키워드로 물건 검색 (관련도순)"""
+        return await self._search(db, [keyword], limit)
+    
+    async def get_matching_items(self, db: AsyncSession, keywords: List[str], limit: int = 100) -> List[DetectedItem]:
+        """여러 키워드와 매칭되는 물건 조회 (일치하는 키워드가 많을수록 앞에)"""
+        return await self._search(db, keywords, limit)
 
 detected_item_crud = DetectedItemCRUD() 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
 from app.models.keyword import Keyword
@@ -15,6 +15,7 @@ class KeywordCRUD:
         db.add(keyword)
         await db.commit()
         await db.refresh(keyword)
+        _keyword_index().add(keyword.keyword, keyword.user_id)
         return keyword
     
     async def get_by_user_id(self, db: AsyncSession, user_id: str) -> List[Keyword]:
@@ -38,26 +39,50 @@ class KeywordCRUD:
         )
         return [keyword for keyword in result.scalars().all()]
     
+    async def get_subscriptions(self, db: AsyncSession) -> List[Tuple[str, str]]:
+        """전체 (keyword, user_id) 구독 목록 조회 (역색인 적재용)"""
+        result = await db.execute(
+            select(Keyword.keyword, Keyword.user_id)
+        )
+        return [(keyword, user_id) for keyword, user_id in result.all()]
+    
     async def update(self, db: AsyncSession, keyword_id: int, keyword_update: KeywordUpdate) -> Optional[Keyword]:
         """키워드 수정"""
         keyword = await self.get_by_id(db, keyword_id)
         if not keyword:
             return None
         
+        previous = (keyword.keyword, keyword.user_id)
         for field, value in keyword_update.dict(exclude_unset=True).items():
             setattr(keyword, field, value)
         
         await db.commit()
         await db.refresh(keyword)
+        if (keyword.keyword, keyword.user_id) != previous:
+            _keyword_index().remove(*previous)
+            _keyword_index().add(keyword.keyword, keyword.user_id)
         return keyword
     
     async def delete(self, db: AsyncSession, keyword_id: int) -> bool:
         """키워드 삭제"""
         result = await db.execute(
-            delete(Keyword).where(Keyword.id == keyword_id)
+            delete(Keyword).where(Keyword.id == keyword_id).returning(Keyword.keyword, Keyword.user_id)
         )
+        deleted = result.first()
         await db.commit()
-        return result.rowcount > 0
+        if deleted is None:
+            return False
+        _keyword_index().remove(deleted.keyword, deleted.user_id)
+        return True
+
+
+def _keyword_index():
+    """키워드 등록/수정/삭제를 이 워커의 매칭 역색인에 바로 반영하기 위한 색인
+    
+    app.services가 app.crud를 import하므로 순환 import를 피하려고 사용할 때 가져온다.
+    """
+    from app.services.keyword_index import keyword_index
+    return keyword_index
 
 
 keyword_crud = KeywordCRUD() 
\ No newline at end of file
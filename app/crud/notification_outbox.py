@@ -0,0 +1,208 @@
+from datetime import timedelta
+from typing import Dict, List, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, func, literal, union_all, bindparam, Integer, String, Float
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from app.config import settings
+from app.models.alert import Alert
+from app.models.notification_outbox import NotificationOutbox
+
+
+# 발송 대기(pending) 또는 임대 중(sending, 임대가 끝나면 다시 발송 대상)
+ACTIVE_STATUSES = ('pending', 'sending')
+
+
+def status_in(*statuses: str):
+    """상태 조건 (값을 SQL에 그대로 넣어 prepared statement의 일반 계획에서도 부분 인덱스를 사용)"""
+    return NotificationOutbox.status.in_([literal(status, literal_execute=True) for status in statuses])
+
+
+def channel_delay_seconds(channel: str) -> float:
+    """채널별 첫 발송까지 대기 시간 (이메일은 사용자별 요약 창)"""
+    if channel == 'email':
+        return settings.email_digest_window_seconds
+    return 0.0
+
+
+class NotificationOutboxCRUD:
+    async def enqueue(self, db: AsyncSession, alerts: Sequence[Tuple[int, str]], channels: Sequence[str]) -> int:
+        """새 알림 (alert_id, user_id)마다 채널별 발송 행 추가 (커밋하지 않음: 알림과 같은 트랜잭션)
+        
+        이메일처럼 모아 보내는 채널은 요약 창이 끝나는 시각을 첫 발송 시각으로 둔다.
+        """
+        if not alerts or not channels:
+            return 0
+
+        rows = [(alert_id, user_id, channel) for alert_id, user_id in alerts for channel in channels]
+        source = func.unnest(
+            bindparam('alert_ids', [row[0] for row in rows], type_=ARRAY(Integer)),
+            bindparam('user_ids', [row[1] for row in rows], type_=ARRAY(String(100))),
+            bindparam('channels', [row[2] for row in rows], type_=ARRAY(String(20))),
+            bindparam('delays', [channel_delay_seconds(row[2]) for row in rows], type_=ARRAY(Float)),
+        ).table_valued('alert_id', 'user_id', 'channel', 'delay')
+
+        await db.execute(
+            insert(NotificationOutbox)
+            .from_select(
+                ['alert_id', 'user_id', 'channel', 'next_attempt_at'],
+                select(
+                    source.c.alert_id,
+                    source.c.user_id,
+                    source.c.channel,
+                    func.now() + func.make_interval(0, 0, 0, 0, 0, 0, source.c.delay),
+                )
+            )
+            .on_conflict_do_nothing(index_elements=[NotificationOutbox.alert_id, NotificationOutbox.channel])
+        )
+        return len(rows)
+
+    async def claim(
+        self, db: AsyncSession, limit: int, lease_seconds: float, exclude_channels: Sequence[str] = ()
+    ) -> List[Dict]:
+        """발송할 행을 가져가고 임대 시각까지 다른 워커가 가져가지 못하게 표시
+        
+        FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행은 건너뛰므로 워커끼리 기다리지 않고,
+        바로 커밋해 발송하는 동안 트랜잭션/잠금을 붙잡고 있지 않는다.
+        임대가 끝나기 전에 결과를 기록하지 못하면(워커 장애) 다시 발송 대상이 된다.
+        """
+        due = (
+            select(NotificationOutbox.id)
+            .where(
+                status_in(*ACTIVE_STATUSES),
+                NotificationOutbox.next_attempt_at <= func.now()
+            )
+            .order_by(NotificationOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if exclude_channels:
+            due = due.where(NotificationOutbox.channel.not_in(exclude_channels))
+        return await self._lease(db, due.scalar_subquery(), lease_seconds)
+
+    async def claim_user_batches(
+        self, db: AsyncSession, channel: str, max_users: int, lease_seconds: float
+    ) -> List[Dict]:
+        """발송 시각이 된 행이 있는 사용자의 해당 채널 행을 모두 가져감 (사용자별 요약 발송용)
+        
+        사용자의 첫 알림이 요약 창을 다 기다리면 그 뒤에 쌓인 알림까지 한 번에 가져가므로
+        요약 메일 수는 알림 수가 아니라 사용자 수에 비례한다.
+        """
+        due_users = (
+            select(NotificationOutbox.user_id)
+            .where(
+                NotificationOutbox.channel == channel,
+                status_in(*ACTIVE_STATUSES),
+                NotificationOutbox.next_attempt_at <= func.now()
+            )
+            .group_by(NotificationOutbox.user_id)
+            .order_by(func.min(NotificationOutbox.next_attempt_at))
+            .limit(max_users)
+        )
+        rows = (
+            select(NotificationOutbox.id)
+            .where(
+                NotificationOutbox.channel == channel,
+                NotificationOutbox.user_id.in_(due_users),
+                # 발송 완료/실패 이력은 잠그지 않음 (부분 인덱스 범위 안에서만 찾음)
+                status_in(*ACTIVE_STATUSES),
+                (NotificationOutbox.status == 'pending')
+                | (NotificationOutbox.next_attempt_at <= func.now())
+            )
+            .with_for_update(skip_locked=True)
+        )
+        return await self._lease(db, rows.scalar_subquery(), lease_seconds)
+
+    async def _lease(self, db: AsyncSession, ids, lease_seconds: float) -> List[Dict]:
+        result = await db.execute(
+            update(NotificationOutbox)
+            .where(
+                NotificationOutbox.id.in_(ids),
+                status_in(*ACTIVE_STATUSES),
+                NotificationOutbox.alert_id == Alert.id
+            )
+            .values(
+                status='sending',
+                attempts=NotificationOutbox.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(
+                NotificationOutbox.id,
+                NotificationOutbox.alert_id,
+                NotificationOutbox.user_id,
+                NotificationOutbox.channel,
+                NotificationOutbox.attempts,
+                Alert.item_id,
+                Alert.message,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        claimed = [dict(row._mapping) for row in result]
+        await db.commit()
+        return claimed
+
+    async def mark_sent(self, db: AsyncSession, ids: List[int]) -> None:
+        """발송 완료 처리"""
+        if not ids:
+            return
+        await db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(ids))
+            .values(status='sent', sent_at=func.now(), last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def mark_failed(self, db: AsyncSession, failures: List[Dict]) -> None:
+        """발송 실패 기록 (failures: id, status, next_attempt_at, last_error를 담은 dict 목록)"""
+        if not failures:
+            return
+        await db.execute(update(NotificationOutbox), failures)
+        await db.commit()
+
+    async def count_by_status(self, db: AsyncSession) -> Dict[str, int]:
+        """대기/발송 중/실패 상태별 행 수
+        
+        발송 완료(sent) 행은 발송 이력 전체라서 세지 않고, 상태마다 부분 인덱스 범위만 센다.
+        """
+        active = (
+            select(NotificationOutbox.status, func.count())
+            .where(status_in(*ACTIVE_STATUSES))
+            .group_by(NotificationOutbox.status)
+        )
+        failed = (
+            select(literal('failed'), func.count())
+            .where(status_in('failed'))
+        )
+        result = await db.execute(union_all(active, failed))
+        counts = {status: 0 for status in (*ACTIVE_STATUSES, 'failed')}
+        counts.update({status: count for status, count in result.all()})
+        return counts
+    
+    async def prune_sent(self, db: AsyncSession, older_than: timedelta, batch_size: int = 5000) -> int:
+        """보관 기간이 지난 발송 완료 행 삭제 (batch_size개씩 나눠 커밋, 삭제한 행 수 반환)
+        
+        다른 프로세스가 같은 행을 지우는 중이면 SKIP LOCKED로 건너뛴다.
+        """
+        deleted = 0
+        while True:
+            expired = (
+                select(NotificationOutbox.id)
+                .where(
+                    status_in('sent'),
+                    NotificationOutbox.sent_at < func.now() - older_than
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                delete(NotificationOutbox)
+                .where(NotificationOutbox.id.in_(expired.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+
+notification_outbox_crud = NotificationOutboxCRUD()
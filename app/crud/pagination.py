@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import tuple_
+
+# 키셋 커서: 마지막 행의 (정렬 시각, id)
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """마지막 행의 (시각, id)를 URL에 넣을 수 있는 커서 문자열로 변환"""
+    raw = json.dumps([timestamp.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """커서 문자열 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, row_id = json.loads(raw)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def keyset_before(timestamp_column, id_column, cursor: Optional[Cursor]):
+    """(시각, id) 내림차순 정렬에서 커서 다음 행들의 조건 (커서가 없으면 None)
+
+    (시각, id) 복합 인덱스를 그대로 타므로 몇 번째 페이지든 첫 페이지와 같은 비용이다.
+    """
+    if cursor is None:
+        return None
+    return tuple_(timestamp_column, id_column) < tuple_(*cursor)
@@ -1,22 +1,78 @@
-from sqlalchemy import create_engine, MetaData
+from typing import Dict
+import time
+from sqlalchemy import create_engine, MetaData, exc, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+from app.metrics import instrument_engine
+from app.profiling import install_slow_query_log
 import asyncpg
 
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """연결 체크아웃 횟수/대기 시간/타임아웃을 기록하는 연결 풀"""
+    
+    checkouts = 0
+    timeouts = 0
+    wait_seconds = 0.0
+    max_wait_seconds = 0.0
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+def create_engine_from_settings(database_url: str) -> AsyncEngine:
+    """설정값(풀 크기, 재연결, SQL 로그 등)으로 비동기 엔진 생성 (SQL 실행 시간 수집, 느린 쿼리 로그 포함)"""
+    async_engine = create_async_engine(
+        database_url.replace("postgresql://", "postgresql+asyncpg://"),
+        echo=settings.database_echo,
+        poolclass=TimedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args={
+            # PgBouncer(트랜잭션 모드) 뒤에서는 0으로 꺼야 함
+            "statement_cache_size": settings.database_statement_cache_size,
+        },
+    )
+    instrument_engine(async_engine.sync_engine)
+    if settings.slow_query_threshold_ms > 0:
+        install_slow_query_log(async_engine.sync_engine, settings.slow_query_threshold_ms)
+    return async_engine
+
+
 # 동기 엔진 (마이그레이션용)
 engine = create_engine(settings.database_url)
 
-# 비동기 엔진 (FastAPI용)
-async_database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-async_engine = create_async_engine(async_database_url, echo=True)
+# 비동기 엔진 (FastAPI용): 쓰기/일반 조회는 primary, 조회 전용 API는 read replica (없으면 primary)
+async_engine = create_engine_from_settings(settings.database_url)
+read_engine = (
+    create_engine_from_settings(settings.database_read_url)
+    if settings.database_read_url else async_engine
+)
 
 # 세션 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 AsyncSessionLocal = sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
 )
+ReadSessionLocal = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 # Base 클래스
 Base = declarative_base()
@@ -34,11 +90,42 @@ async def get_db():
             await session.close()
 
 
+# 조회 전용 세션 의존성 (read replica가 설정되어 있으면 replica 사용, 복제 지연 허용)
+async def get_read_db():
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def pool_stats() -> Dict:
+    """엔진별 연결 풀 상태 및 체크아웃 대기 통계"""
+    engines = {"primary": async_engine}
+    if read_engine is not async_engine:
+        engines["replica"] = read_engine
+    
+    stats = {}
+    for name, target in engines.items():
+        pool = target.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "avg_wait_ms": pool.wait_seconds * 1000 / pool.checkouts if pool.checkouts else 0.0,
+            "max_wait_ms": pool.max_wait_seconds * 1000,
+        }
+    return stats
+
+
 # 데이터베이스 연결 테스트
 async def test_database_connection():
     try:
         async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+            await session.execute(text("SELECT 1"))
         print("✅ 데이터베이스 연결 성공!")
         return True
     except Exception as e:
@@ -1,11 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
+import time
 
 from app.config import settings
-from app.database import test_database_connection, Base, async_engine
+from app.database import test_database_connection, pool_stats, Base, async_engine, AsyncSessionLocal
+from app.crud import notification_outbox_crud
 from app.api import keywords_router, detected_router, alerts_router
 from app.api.crawler import router as crawler_router
+from app.services import (
+    start_scheduler, shutdown_scheduler, response_cache, notification_dispatcher,
+    webhook_channel, email_digest_channel, alert_stream_hub
+)
+from app.crawler.parse_pool import shutdown_parse_pool
+from app.metrics import CONTENT_TYPE_LATEST, HTTP_REQUEST_SECONDS, render_metrics
+from app.profiling import ProfilingMiddleware, profiling_available
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -23,8 +32,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 키셋 페이지네이션 커서
 )
 
+# 요청 프로파일링 (켜져 있을 때만 등록, X-Profile 헤더가 있는 요청만 프로파일링)
+if settings.profiling_enabled:
+    if profiling_available():
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=settings.profiling_token,
+            interval=settings.profiling_interval,
+        )
+    else:
+        print("⚠️ pyinstrument가 설치되어 있지 않아 요청 프로파일링을 사용할 수 없습니다")
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """라우트별 API 응답 시간 수집 (라벨은 경로 템플릿, 예: /detected/{item_id})"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            request.method,
+            route.path if route is not None else "unmatched",
+            str(status),
+        ).observe(time.perf_counter() - started)
+
+
 # API 라우터 등록
 app.include_router(keywords_router)
 app.include_router(detected_router)
@@ -42,6 +82,15 @@ async def startup_event():
     if not success:
         print("❌ 경고: 데이터베이스 연결에 실패했습니다. 환경 변수를 확인하세요.")
     
+    # 주기 크롤링 스케줄러 시작 (워커 간 중복 실행은 advisory lock으로 방지)
+    start_scheduler()
+    
+    # 여러 워커에서 응답 캐시 무효화를 공유하는 경우 알림 구독
+    await response_cache.start_listener()
+    
+    # 외부 채널 알림 발송 워커 (outbox, 워커 간 SKIP LOCKED로 분배)
+    notification_dispatcher.start()
+    
     print(f"📖 API 문서: http://localhost:8000/docs")
     print(f"🔧 환경: {settings.environment}")
 
@@ -50,6 +99,13 @@ async def startup_event():
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     print("🛑 경매 알림 SaaS API 종료 중...")
+    shutdown_scheduler()
+    shutdown_parse_pool()
+    await response_cache.stop_listener()
+    await notification_dispatcher.stop()
+    await webhook_channel.close()
+    await email_digest_channel.close()
+    await alert_stream_hub.close()
 
 
 @app.get("/")
@@ -83,6 +139,31 @@ async def health_check():
         }
 
 
+@app.get("/health/db")
+async def database_pool_status():
+    """데이터베이스 연결 풀 상태 (체크아웃 수, 대기 시간, 타임아웃)"""
+    return pool_stats()
+
+
+@app.get("/health/notifications")
+async def notification_outbox_status():
+    """알림 발송 대기열 상태 (상태별 행 수, 이 프로세스 워커/웹훅/이메일 채널의 처리 통계)"""
+    async with AsyncSessionLocal() as db:
+        outbox = await notification_outbox_crud.count_by_status(db)
+    return {
+        "outbox": outbox,
+        "dispatcher": notification_dispatcher.stats,
+        "webhook": webhook_channel.endpoint_stats(),
+        "email": email_digest_channel.stats,
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (크롤링/매칭/알림/API/SQL)"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
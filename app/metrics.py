@@ -0,0 +1,86 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 크롤링
+CRAWLER_FETCH_SECONDS = Histogram(
+    "crawler_fetch_seconds", "목록/상세 페이지 요청 시간 (속도 제한 대기 제외)", ["source"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+CRAWLER_FETCH_TOTAL = Counter(
+    "crawler_fetch_total", "페이지 요청 수 (status: HTTP 상태 코드 또는 error)", ["source", "status"]
+)
+CRAWLER_PARSE_SECONDS = Histogram(
+    "crawler_parse_seconds", "목록 페이지 파싱/추출 시간", ["source"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+CRAWLER_ROWS_PER_PAGE = Histogram(
+    "crawler_rows_per_page", "목록 페이지당 추출된 물건 수", ["source"],
+    buckets=(0, 1, 5, 10, 20, 50, 100),
+)
+
+# 키워드 매칭
+MATCHER_MATCH_SECONDS = Histogram(
+    "matcher_match_seconds", "배치 하나의 키워드 매칭 시간",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+MATCHER_FANOUT = Histogram(
+    "matcher_fanout", "매칭된 물건 하나당 알림 받는 사용자 수",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 1000),
+)
+MATCHER_ITEMS_TOTAL = Counter(
+    "matcher_items_total", "처리한 물건 수 (result: new / duplicate / matched)", ["result"]
+)
+
+# 알림
+NOTIFICATION_SEND_TOTAL = Counter(
+    "notification_send_total", "알림 발송 결과", ["channel", "outcome"]
+)
+
+# API / DB
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_seconds", "API 요청 처리 시간", ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds", "SQL 실행 시간", ["operation"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+
+def instrument_engine(engine: Engine):
+    """SQL 실행 시간을 엔진 이벤트로 수집 (비동기 엔진은 sync_engine을 넘김)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        DB_QUERY_SECONDS.labels(_operation(statement)).observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("query_started") if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+
+def _operation(statement: str) -> str:
+    words = statement.lstrip().split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식 (여러 워커면 PROMETHEUS_MULTIPROC_DIR의 값을 합산)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
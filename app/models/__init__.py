@@ -1,5 +1,8 @@
 from .keyword import Keyword
 from .detected_item import DetectedItem
 from .alert import Alert
+from .alert_inbox import AlertInbox
+from .crawl_job import CrawlJob
+from .notification_outbox import NotificationOutbox
 
-__all__ = ["Keyword", "DetectedItem", "Alert"] 
\ No newline at end of file
+__all__ = ["Keyword", "DetectedItem", "Alert", "AlertInbox", "CrawlJob", "NotificationOutbox"] 
\ No newline at end of file
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -6,12 +7,19 @@ from app.database import Base
 
 class Alert(Base):
     __tablename__ = "auction_alerts"
+    __table_args__ = (
+        UniqueConstraint("user_id", "item_id", name="uq_auction_alerts_user_item"),
+        Index("idx_auction_alerts_user_unread", "user_id", "id", postgresql_where=text("read_at IS NULL")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(100), nullable=False, index=True)
     item_id = Column(Integer, ForeignKey("auction_detected_items.id"), nullable=False)
     message = Column(Text)
     sent_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    read_at = Column(DateTime(timezone=True))  # 비어 있으면 안 읽은 알림
+    # 알림 생성 시점의 물건 요약 (목록 화면이 물건 테이블을 조인하지 않도록 함께 저장)
+    item_summary = Column(JSONB)
     
     # 관계 설정
     item = relationship("DetectedItem", backref="alerts")
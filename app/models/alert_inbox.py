@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AlertInbox(Base):
+    """사용자별 알림함 요약 (안 읽은 알림 수 등)
+
+    알림 생성/읽음 처리와 같은 트랜잭션에서 증감하므로 배지 갱신은 기본 키 조회 한 번이다.
+    """
+    __tablename__ = "auction_alert_inbox"
+    
+    user_id = Column(String(100), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    total_count = Column(Integer, nullable=False, default=0)
+    last_alert_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<AlertInbox(user_id='{self.user_id}', unread_count={self.unread_count})>"
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, Float, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class CrawlJob(Base):
+    __tablename__ = "auction_crawl_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, default="running")  # running / completed / failed
+    trigger = Column(String(20), nullable=False)  # manual / scheduler
+    pages_requested = Column(Integer, nullable=False)
+    incremental = Column(Boolean, nullable=False, default=False)
+    
+    # 진행 통계
+    pages_fetched = Column(Integer, nullable=False, default=0)
+    pages_not_modified = Column(Integer, nullable=False, default=0)
+    pages_failed = Column(Integer, nullable=False, default=0)
+    rows_parsed = Column(Integer, nullable=False, default=0)
+    new_items = Column(Integer, nullable=False, default=0)
+    duplicate_items = Column(Integer, nullable=False, default=0)
+    matched_items = Column(Integer, nullable=False, default=0)
+    alerts_created = Column(Integer, nullable=False, default=0)
+    
+    # 단계별 소요 시간 (초, 동시 처리분은 합계)
+    wait_seconds = Column(Float, nullable=False, default=0)
+    fetch_seconds = Column(Float, nullable=False, default=0)
+    parse_seconds = Column(Float, nullable=False, default=0)
+    match_seconds = Column(Float, nullable=False, default=0)
+    write_seconds = Column(Float, nullable=False, default=0)
+    total_seconds = Column(Float)
+    
+    error = Column(Text)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    finished_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f"<CrawlJob(id={self.id}, status='{self.status}', trigger='{self.trigger}')>"
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, BigInteger, Date, DateTime, JSON
+from sqlalchemy import Column, Computed, Integer, String, Text, BigInteger, Float, Date, DateTime, JSON
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -8,11 +10,19 @@ class DetectedItem(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(Text, nullable=False)
+    # 제목 글자 bigram (GIN 인덱스로 한국어 부분 문자열 검색, DB가 생성하는 컬럼)
+    title_bigrams = deferred(Column(ARRAY(Text), Computed("auction_bigrams(title)", persisted=True)))
     appraisal_value = Column(BigInteger)
     bid_date = Column(Date)
-    url = Column(Text, nullable=False)
+    url = Column(Text, nullable=False, unique=True)
     keywords = Column(JSON)  # ["송파구", "아파트"] 형태
     source_site = Column(String(100))  # 크롤링 출처
+    
+    # 상세 페이지 보강 속성 (enriched_at이 비어 있으면 아직 보강되지 않은 물건)
+    area = Column(Float)  # 면적 (㎡)
+    minimum_bid = Column(BigInteger)  # 최저매각가격
+    failed_bid_count = Column(Integer)  # 유찰 횟수
+    enriched_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     def __repr__(self):
@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class NotificationOutbox(Base):
+    """외부 채널(이메일/웹훅) 알림 발송 대기열
+
+    알림(auction_alerts)과 같은 트랜잭션에서 생성되므로 알림이 저장되면 발송 대상도
+    반드시 남는다. 워커는 FOR UPDATE SKIP LOCKED로 행을 나눠 가져간다.
+    """
+    __tablename__ = "auction_notification_outbox"
+    __table_args__ = (
+        UniqueConstraint("alert_id", "channel", name="uq_auction_notification_outbox_alert_channel"),
+        Index(
+            "idx_auction_notification_outbox_active",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+        Index(
+            "idx_auction_notification_outbox_user_channel",
+            "user_id",
+            "channel",
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+        Index(
+            "idx_auction_notification_outbox_failed",
+            "next_attempt_at",
+            postgresql_where=text("status = 'failed'"),
+        ),
+        Index(
+            "idx_auction_notification_outbox_sent_at",
+            "sent_at",
+            postgresql_where=text("status = 'sent'"),
+        ),
+    )
+    
+    id = Column(BigInteger, primary_key=True)
+    alert_id = Column(Integer, ForeignKey("auction_alerts.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(100), nullable=False)
+    channel = Column(String(20), nullable=False)  # email / webhook
+    status = Column(String(20), nullable=False, default="pending")  # pending / sending / sent / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    # 다음 시도 시각 (발송 중에는 임대 만료 시각: 워커가 죽으면 이 시각 이후 다른 워커가 다시 가져감)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f"<NotificationOutbox(id={self.id}, alert_id={self.alert_id}, channel='{self.channel}', status='{self.status}')>"
@@ -0,0 +1,167 @@
+import hmac
+import os
+import sys
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    import greenlet
+except ImportError:
+    greenlet = None
+
+try:
+    from pyinstrument import Profiler  # 선택 의존성: 요청 프로파일링에만 필요
+except ImportError:
+    Profiler = None
+
+# 프로파일링 요청 헤더: X-Profile 값은 출력 형식, 관리자 토큰이 설정되어 있으면 X-Profile-Token도 필요
+PROFILE_HEADER = b"x-profile"
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+
+PROFILE_FORMATS = {
+    "html": "text/html; charset=utf-8",
+    "text": "text/plain; charset=utf-8",
+    "speedscope": "application/json",
+}
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_CRUD_DIR = os.path.join(_APP_DIR, "crud") + os.sep
+_SKIP_FILES = {os.path.join(_APP_DIR, "profiling.py"), os.path.join(_APP_DIR, "metrics.py")}
+
+
+def profiling_available() -> bool:
+    return Profiler is not None
+
+
+class ProfilingMiddleware:
+    """X-Profile 헤더가 있는 요청만 pyinstrument로 샘플링 프로파일링 (ASGI 미들웨어)
+
+    프로파일링한 요청은 원래 응답 대신 프로파일 결과(html/text/speedscope)를 반환한다.
+    헤더가 없는 요청은 헤더 확인 한 번만 하고 그대로 통과시킨다.
+    """
+
+    def __init__(self, app, token: Optional[str] = None, interval: float = 0.001):
+        self.app = app
+        self.token = token
+        self.interval = interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope.get("headers") or ())
+        profile_format = headers.get(PROFILE_HEADER)
+        if profile_format is None or not self._authorized(headers.get(PROFILE_TOKEN_HEADER)):
+            return await self.app(scope, receive, send)
+
+        profile_format = profile_format.decode("latin-1").strip().lower() or "html"
+        if profile_format not in PROFILE_FORMATS:
+            profile_format = "html"
+
+        status = {"code": 500}
+
+        async def capture(message):
+            # 원래 응답은 버리고 상태 코드만 기록 (직렬화 시간까지 프로파일에 포함됨)
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            profiler.stop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        body = self._render(profiler, profile_format).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", PROFILE_FORMATS[profile_format].encode()),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profiled-status", str(status["code"]).encode()),
+                (b"x-profiled-duration-ms", f"{elapsed_ms:.1f}".encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _authorized(self, token: Optional[bytes]) -> bool:
+        if not self.token:
+            return True
+        return token is not None and hmac.compare_digest(token, self.token.encode())
+
+    @staticmethod
+    def _render(profiler, profile_format: str) -> str:
+        if profile_format == "text":
+            return profiler.output_text(unicode=True, color=False, show_all=False)
+        if profile_format == "speedscope":
+            from pyinstrument.renderers import SpeedscopeRenderer
+            return profiler.output(renderer=SpeedscopeRenderer())
+        return profiler.output_html()
+
+
+def install_slow_query_log(engine: Engine, threshold_ms: float):
+    """threshold_ms보다 오래 걸린 SQL의 문장/파라미터/호출한 CRUD 메서드를 로그 (비동기 엔진은 sync_engine을 넘김)"""
+    threshold = threshold_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["slow_query_started"].pop()
+        if elapsed < threshold:
+            return
+        # 호출 위치는 느린 쿼리에서만 찾음
+        print(
+            f"🐢 느린 쿼리 {elapsed * 1000:.1f}ms ({_caller()})\n"
+            f"    {_truncate(' '.join(statement.split()), 2000)}\n"
+            f"    파라미터{' (executemany)' if executemany else ''}: {_truncate(repr(parameters), 500)}"
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("slow_query_started") if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+
+def _caller() -> str:
+    """쿼리를 실행한 CRUD 메서드 (없으면 가장 가까운 app 코드 위치)
+
+    비동기 세션의 동기 실행부는 별도 greenlet에서 돌기 때문에 부모 greenlet(await한 코루틴)의
+    프레임까지 이어서 찾는다.
+    """
+    fallback = None
+    for frame in _frames():
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_APP_DIR) or filename in _SKIP_FILES:
+            continue
+        owner = frame.f_locals.get("self")
+        name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None else frame.f_code.co_name
+        if filename.startswith(_CRUD_DIR):
+            return name
+        if fallback is None:
+            fallback = f"{name} ({os.path.relpath(filename, _APP_DIR)}:{frame.f_lineno})"
+    return fallback or "unknown"
+
+
+def _frames():
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent() if greenlet is not None else None
+    while frame is not None or current is not None:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent if current is not None else None
+        frame = current.gr_frame if current is not None else None
+
+
+def _truncate(value: str, limit: int) -> str:
+    return value if len(value) <= limit else value[:limit] + f"... ({len(value)}자)"
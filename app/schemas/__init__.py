@@ -1,9 +1,15 @@
 from .keyword import KeywordCreate, KeywordResponse, KeywordUpdate
 from .detected_item import DetectedItemResponse, DetectedItemCreate
-from .alert import AlertResponse, AlertCreate
+from .alert import (
+    AlertResponse, AlertCreate, AlertItemSummary, AlertInboxItem, AlertInboxSummary,
+    AlertMarkRead, AlertMarkReadResult
+)
+from .crawl_job import CrawlJobCreate, CrawlJobResponse
 
 __all__ = [
     "KeywordCreate", "KeywordResponse", "KeywordUpdate",
     "DetectedItemResponse", "DetectedItemCreate",
-    "AlertResponse", "AlertCreate"
+    "AlertResponse", "AlertCreate", "AlertItemSummary", "AlertInboxItem", "AlertInboxSummary",
+    "AlertMarkRead", "AlertMarkReadResult",
+    "CrawlJobCreate", "CrawlJobResponse"
 ] 
\ No newline at end of file
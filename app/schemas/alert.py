@@ -1,9 +1,20 @@
 from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 from .detected_item import DetectedItemResponse
 
 
+class AlertItemSummary(BaseModel):
+    """알림에 함께 저장된 물건 요약"""
+    title: str
+    url: str
+    appraisal_value: Optional[int] = None
+    minimum_bid: Optional[int] = None
+    bid_date: Optional[date] = None
+    area: Optional[float] = None
+    source_site: Optional[str] = None
+
+
 class AlertBase(BaseModel):
     user_id: str
     item_id: int
@@ -17,7 +28,40 @@ class AlertCreate(AlertBase):
 class AlertResponse(AlertBase):
     id: int
     sent_at: datetime
+    read_at: Optional[datetime] = None
+    item_summary: Optional[AlertItemSummary] = None
     item: Optional[DetectedItemResponse] = None
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+
+class AlertInboxItem(AlertBase):
+    """알림함 목록용 (물건 테이블 조인 없이 저장된 요약만)"""
+    id: int
+    sent_at: datetime
+    read_at: Optional[datetime] = None
+    item_summary: Optional[AlertItemSummary] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class AlertInboxSummary(BaseModel):
+    user_id: str
+    unread_count: int = 0
+    total_count: int = 0
+    last_alert_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class AlertMarkRead(BaseModel):
+    user_id: str
+    alert_ids: Optional[List[int]] = None  # 비어 있으면 안 읽은 알림 전체
+
+
+class AlertMarkReadResult(BaseModel):
+    marked: int
+    unread_count: int 
\ No newline at end of file
@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class CrawlJobCreate(BaseModel):
+    trigger: str
+    pages_requested: int
+    incremental: bool = False
+
+
+class CrawlJobResponse(BaseModel):
+    id: int
+    status: str
+    trigger: str
+    pages_requested: int
+    incremental: bool
+    pages_fetched: int = 0
+    pages_not_modified: int = 0
+    pages_failed: int = 0
+    rows_parsed: int = 0
+    new_items: int = 0
+    duplicate_items: int = 0
+    matched_items: int = 0
+    alerts_created: int = 0
+    wait_seconds: float = 0
+    fetch_seconds: float = 0
+    parse_seconds: float = 0
+    match_seconds: float = 0
+    write_seconds: float = 0
+    total_seconds: Optional[float] = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
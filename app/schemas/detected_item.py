@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from datetime import datetime, date
 from typing import Optional, List
 
@@ -12,12 +12,26 @@ class DetectedItemBase(BaseModel):
     source_site: Optional[str] = None
 
 
+# BIGINT 컬럼 범위
+BIGINT_MAX = 2 ** 63 - 1
+
+
 class DetectedItemCreate(DetectedItemBase):
-    pass
+    @field_validator("appraisal_value")
+    @classmethod
+    def appraisal_value_in_range(cls, value: Optional[int]) -> Optional[int]:
+        """컬럼 범위를 벗어난 감정가는 비움 (잘못 파싱된 값 하나로 일괄 저장 전체가 실패하지 않도록)"""
+        if value is not None and not 0 <= value <= BIGINT_MAX:
+            return None
+        return value
 
 
 class DetectedItemResponse(DetectedItemBase):
     id: int
+    area: Optional[float] = None
+    minimum_bid: Optional[int] = None
+    failed_bid_count: Optional[int] = None
+    enriched_at: Optional[datetime] = None
     created_at: datetime
     
     class Config:
@@ -1,4 +1,23 @@
 from .keyword_matcher import KeywordMatcher
-from .notification import NotificationService
+from .enrichment import DetailEnricher, DetailCache, detail_cache
+from .keyword_automaton import KeywordAutomaton
+from .keyword_index import KeywordIndex, keyword_index
+from .notification import NotificationError, NotificationService
+from .email_digest import EmailDigestChannel, EmailError, email_digest_channel
+from .webhook import CircuitBreaker, WebhookChannel, WebhookError, webhook_channel
+from .notification_dispatcher import NotificationDispatcher, notification_dispatcher
+from .response_cache import ResponseCache, response_cache
+from .alert_stream import AlertStreamHub, alert_stream_hub
+from .crawling import CrawlRunner, crawl_runner, perform_crawling
+from .scheduler import start_scheduler, shutdown_scheduler
 
-__all__ = ["KeywordMatcher", "NotificationService"] 
\ No newline at end of file
+__all__ = [
+    "KeywordMatcher", "DetailEnricher", "DetailCache", "detail_cache",
+    "KeywordAutomaton", "KeywordIndex", "keyword_index", "NotificationService",
+    "NotificationError", "NotificationDispatcher", "notification_dispatcher",
+    "CircuitBreaker", "WebhookChannel", "WebhookError", "webhook_channel",
+    "EmailDigestChannel", "EmailError", "email_digest_channel",
+    "ResponseCache", "response_cache",
+    "AlertStreamHub", "alert_stream_hub",
+    "CrawlRunner", "crawl_runner", "perform_crawling", "start_scheduler", "shutdown_scheduler"
+] 
\ No newline at end of file
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from typing import Dict, List, Optional, Set
+
+import asyncpg
+
+from app.config import settings
+from app.crud import alert_crud
+from app.database import AsyncSessionLocal
+from app.schemas.alert import AlertResponse
+
+# 알림 생성 트리거가 보내는 NOTIFY 채널 (migrations/009_alerts_notify_trigger.sql)
+ALERTS_CHANNEL = "auction_alerts"
+
+
+class AlertSubscription:
+    """연결된 클라이언트 하나 (SSE 응답 하나)"""
+
+    def __init__(self, user_id: str, queue_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[AlertResponse]" = asyncio.Queue(maxsize=queue_size)
+        # 큐가 넘쳐 알림을 놓친 구독자는 스트림을 끊고, 클라이언트가 Last-Event-ID로 다시 연결해 보충
+        self.overflowed = False
+
+
+class AlertStreamHub:
+    """알림 생성 NOTIFY를 연결된 사용자에게 나눠 주는 허브 (API 워커당 LISTEN 연결 하나)
+
+    구독자가 처음 생길 때 LISTEN 연결을 열고, 알림이 오면 그 사용자를 구독 중인 경우에만
+    알림 내용을 한 번 조회해 그 사용자의 모든 연결(탭)에 전달한다.
+    """
+
+    def __init__(self):
+        self.queue_size = settings.alert_stream_queue_size
+        self._subscribers: Dict[str, Set[AlertSubscription]] = {}
+        self._listener: Optional[asyncpg.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {'notifications': 0, 'pushed': 0, 'overflowed': 0}
+
+    @property
+    def connected_clients(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    async def subscribe(self, user_id: str) -> AlertSubscription:
+        await self._ensure_listener()
+        subscription = AlertSubscription(user_id, self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AlertSubscription):
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.user_id]
+
+    async def _ensure_listener(self):
+        if self._listener is not None and not self._listener.is_closed():
+            return
+        async with self._connect_lock:
+            if self._listener is not None and not self._listener.is_closed():
+                return
+            self._listener = await asyncpg.connect(settings.database_url)
+            await self._listener.add_listener(ALERTS_CHANNEL, self._on_notify)
+            self._listener.add_termination_listener(self._on_terminated)
+            print("📡 실시간 알림 구독 시작")
+
+    def _on_terminated(self, connection):
+        # 연결이 끊기면 다음 구독 때 다시 연결하고, 연결 중인 구독자는 끊어서 재연결(보충)하게 함
+        print("⚠️ 실시간 알림 LISTEN 연결이 끊겼습니다")
+        self._listener = None
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                subscription.overflowed = True
+                _offer(subscription, None)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            message = json.loads(payload)
+            user_id = message["user_id"]
+            alert_ids = [int(alert_id) for alert_id in message["alert_ids"]]
+        except (ValueError, KeyError, TypeError):
+            return
+        self.stats['notifications'] += 1
+        if user_id not in self._subscribers:
+            return
+
+        task = asyncio.create_task(self._push(user_id, alert_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _push(self, user_id: str, alert_ids: List[int]):
+        # 방금 커밋된 알림이므로 복제 지연이 없는 primary에서 조회
+        try:
+            async with AsyncSessionLocal() as db:
+                alerts = await alert_crud.get_by_ids(db, alert_ids)
+        except Exception as e:
+            print(f"❌ 실시간 알림 조회 실패: {e}")
+            return
+
+        responses = [AlertResponse.model_validate(alert) for alert in alerts]
+        for subscription in list(self._subscribers.get(user_id, ())):
+            for response in responses:
+                if not _offer(subscription, response):
+                    self.stats['overflowed'] += 1
+                    break
+                self.stats['pushed'] += 1
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            await listener.close()
+
+
+def _offer(subscription: AlertSubscription, response: Optional[AlertResponse]) -> bool:
+    """구독자 큐에 넣기 (가득 차면 구독자를 끊도록 표시, None은 스트림 종료 신호)"""
+    if subscription.overflowed and response is not None:
+        return False
+    try:
+        subscription.queue.put_nowait(response)
+        return True
+    except asyncio.QueueFull:
+        subscription.overflowed = True
+        # 종료 신호가 들어갈 자리를 만든다
+        subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        return False
+
+
+alert_stream_hub = AlertStreamHub()
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.crawler import BaseCrawler, CrawlCoordinator
+from app.crawler.seen_filter import BloomFilter
+from app.crud import crawl_job_crud, detected_item_crud
+from app.schemas.crawl_job import CrawlJobCreate
+from .enrichment import DetailEnricher
+from .keyword_matcher import KeywordMatcher
+
+# 크롤링 실행 전체(모든 워커/레플리카)에서 공유하는 Postgres advisory lock 키
+CRAWL_LOCK_KEY = 0x61756374696F6E  # "auction"
+
+
+class CrawlRunner:
+    """크롤링 단일 실행 관리
+
+    한 프로세스 안에서는 실행 중인 태스크에 합류(single-flight)하고, 여러 uvicorn 워커나
+    레플리카 사이에서는 Postgres advisory lock으로 한 곳에서만 크롤링한다.
+    실행마다 auction_crawl_jobs 행을 남기고, 진행 통계는 메모리(current_job)에 실시간으로
+    쌓으면서 주기적으로 DB에도 반영한다. DB 작업은 요청 세션과 무관한 자체 세션으로 한다.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.current_job: Dict = {}
+        self._trigger_lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def current_task(self) -> Optional[asyncio.Task]:
+        return self._task if self.is_running else None
+
+    def snapshot(self) -> Dict:
+        """현재(또는 마지막) 작업의 진행 통계 사본"""
+        if not self.current_job:
+            return {}
+        return {"id": self.current_job["id"], "started_at": self.current_job["started_at"],
+                **self._job_values(self.current_job)}
+
+    async def trigger(self, pages: int = 3, incremental: bool = False, trigger: str = "manual") -> Dict:
+        """크롤링 시작 (이미 실행 중이면 그 실행에 합류)"""
+        async with self._trigger_lock:
+            if self.is_running:
+                return {"status": "already_running", "job_id": self.current_job["id"]}
+
+            lock_conn = await self._try_advisory_lock()
+            if lock_conn is None:
+                return {"status": "running_elsewhere", "message": "다른 워커에서 크롤링이 실행 중입니다"}
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    job = await crawl_job_crud.create(db, CrawlJobCreate(
+                        trigger=trigger, pages_requested=pages, incremental=incremental
+                    ))
+            except Exception:
+                await self._release_advisory_lock(lock_conn)
+                raise
+
+            self.current_job = {
+                "id": job.id,
+                "status": "running",
+                "trigger": trigger,
+                "pages_requested": pages,
+                "incremental": incremental,
+                "started_at": job.started_at,
+                **BaseCrawler.new_stats(),
+            }
+            self._task = asyncio.create_task(self._run(lock_conn, pages, incremental))
+            return {"status": "started", "job_id": job.id}
+
+    async def _try_advisory_lock(self) -> Optional[asyncpg.Connection]:
+        """advisory lock 획득 시도 (획득하면 락을 쥔 연결 반환)
+
+        세션 단위 락이므로 풀과 무관한 전용 연결(DATABASE_URL 직접 연결, 자동 커밋)로 잡는다.
+        풀 연결로 잡으면 크롤링 내내 idle in transaction 상태로 남아
+        idle_in_transaction_session_timeout이나 PgBouncer 트랜잭션 모드에서 락이 조용히 풀린다.
+        """
+        conn = await asyncpg.connect(settings.database_url)
+        try:
+            locked = await conn.fetchval("SELECT pg_try_advisory_lock($1)", CRAWL_LOCK_KEY)
+        except Exception:
+            await conn.close()
+            raise
+
+        if not locked:
+            await conn.close()
+            return None
+        conn.add_termination_listener(self._on_lock_lost)
+        return conn
+
+    def _on_lock_lost(self, connection):
+        if self.is_running:
+            print("⚠️ 크롤링 advisory lock 연결이 끊겼습니다 (다른 워커가 크롤링을 시작할 수 있음)")
+
+    async def _release_advisory_lock(self, lock_conn: asyncpg.Connection):
+        lock_conn.remove_termination_listener(self._on_lock_lost)
+        try:
+            if not lock_conn.is_closed():
+                await lock_conn.execute("SELECT pg_advisory_unlock($1)", CRAWL_LOCK_KEY)
+        finally:
+            await lock_conn.close()
+
+    async def _run(self, lock_conn: asyncpg.Connection, pages: int, incremental: bool) -> Dict:
+        job = self.current_job
+        started = time.perf_counter()
+        flusher = asyncio.create_task(self._flush_progress(job))
+        try:
+            async with AsyncSessionLocal() as db:
+                await perform_crawling(db, pages, incremental, stats=job)
+            job["status"] = "completed"
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        finally:
+            flusher.cancel()
+            job["total_seconds"] = time.perf_counter() - started
+            job["finished_at"] = datetime.now(timezone.utc)
+            await self._save_job(job)
+            await self._release_advisory_lock(lock_conn)
+
+        print(f"📊 크롤링 작업 #{job['id']} {job['status']}: {self._job_values(job)}")
+        return job
+
+    async def _flush_progress(self, job: Dict):
+        """실행 중 진행 통계를 주기적으로 DB에 반영 (다른 워커에서도 조회 가능하도록)"""
+        while True:
+            await asyncio.sleep(settings.crawl_job_flush_seconds)
+            await self._save_job(job)
+
+    async def _save_job(self, job: Dict):
+        try:
+            async with AsyncSessionLocal() as db:
+                await crawl_job_crud.update(db, job["id"], self._job_values(job))
+        except Exception as e:
+            print(f"❌ 크롤링 작업 기록 실패: {e}")
+
+    @staticmethod
+    def _job_values(job: Dict) -> Dict:
+        values = {key: value for key, value in job.items() if key not in ("id", "started_at")}
+        values["alerts_created"] = job.get("alerts_sent", 0)
+        return values
+
+
+async def perform_crawling(
+    db: AsyncSession, pages: int = 3, incremental: bool = False, stats: Optional[Dict] = None
+) -> Dict:
+    """실제 크롤링 수행 (stats를 넘기면 크롤링/매칭 통계를 그 dict에 실시간으로 누적)
+
+    crawler_sources에 지정된(비어 있으면 등록된 전체) 소스를 동시에 크롤링해
+    하나의 매칭 스트림으로 처리한다.
+    """
+    coordinator = CrawlCoordinator(settings.crawler_sources, stats=stats)
+    try:
+        print(f"🕷️ 크롤링 시작... (소스: {', '.join(coordinator.source_names)})")
+
+        # 상세 페이지 보강은 목록 크롤링과 같은 크롤러(속도 제한/동시성 예산)를 사용
+        enricher = DetailEnricher(coordinator.crawlers) if settings.crawler_enrich_details else None
+        matcher = KeywordMatcher(enricher=enricher)
+
+        # 증분 모드: 이미 본 URL 필터를 읽고, 최대 페이지 수까지 새 물건이 나오는 동안만 크롤링
+        seen = None
+        if incremental:
+            seen = await load_seen_filter(db)
+            pages = max(pages, settings.crawler_incremental_max_pages)
+
+        # 페이지가 도착하는 대로 키워드 매칭 및 알림 처리
+        results = await matcher.process_stream(db, coordinator.stream_items(pages, seen=seen), totals=stats)
+
+        if coordinator.failed and len(coordinator.failed) == len(coordinator.crawlers):
+            raise RuntimeError(f"모든 소스 크롤링 실패: {coordinator.failed}")
+
+        if seen is not None:
+            seen.save(settings.crawler_seen_filter_path)
+
+        print(f"✅ 크롤링 완료: {results}")
+        return results
+
+    except Exception as e:
+        print(f"❌ 크롤링 실패: {e}")
+        raise
+    finally:
+        # 크롤러 정리
+        await coordinator.close()
+
+
+async def load_seen_filter(db: AsyncSession) -> BloomFilter:
+    """이미 본 URL 필터 읽기 (없거나 용량을 넘었으면 DB의 물건 URL로 새로 생성)"""
+    seen = BloomFilter.load(settings.crawler_seen_filter_path)
+    if seen is not None and not seen.is_full:
+        return seen
+
+    capacity = max(settings.crawler_seen_filter_capacity, len(seen) * 2 if seen else 0)
+    seen = BloomFilter(capacity, settings.crawler_seen_filter_error_rate)
+    async for url in detected_item_crud.iter_urls(db):
+        seen.add(url)
+
+    print(f"🧮 이미 본 URL 필터 생성: {len(seen)}개")
+    return seen
+
+
+crawl_runner = CrawlRunner()
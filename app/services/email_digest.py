@@ -0,0 +1,190 @@
+import asyncio
+import html
+import smtplib
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import List, Optional
+
+from app.config import settings
+from app.models.alert import Alert
+
+
+class EmailError(Exception):
+    """이메일 발송 실패 (retryable=False면 재시도해도 같은 결과)"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class EmailDigestChannel:
+    """사용자별 알림 요약 메일 채널
+
+    요약 창(email_digest_window_seconds) 동안 쌓인 사용자의 알림을 메일 한 통으로 보낸다
+    (창은 outbox의 첫 발송 시각으로 구현, NotificationOutboxCRUD.claim_user_batches 참고).
+    SMTP 연결은 프로세스당 하나를 유지하며 재사용하고, 한 번에 가져간 요약 메일들은 그 연결로
+    이어서 보내므로 SMTP 핸드셰이크/로그인 횟수는 메일 수와 관계없이 연결이 끊길 때만 늘어난다.
+    smtplib은 동기 API라서 전용 스레드 하나에서 실행한다.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.stats = {'connections': 0, 'messages': 0, 'failed': 0}
+
+    @staticmethod
+    def address_for(user_id: str) -> Optional[str]:
+        """사용자의 메일 주소 (매핑이 없고 user_id가 메일 주소 형태면 그대로 사용)"""
+        address = settings.email_user_addresses.get(user_id)
+        if address:
+            return address
+        return user_id if "@" in user_id else None
+
+    def render_digest(self, user_id: str, alerts: List[Alert]) -> EmailMessage:
+        """알림 + 물건 정보로 요약 메일 작성 (텍스트/HTML)"""
+        message = EmailMessage()
+        message["Subject"] = f"[경매 알림] 새 경매 물건 {len(alerts)}건"
+        message["From"] = settings.email_from
+        message["To"] = self.address_for(user_id)
+
+        lines = [f"등록하신 키워드와 일치하는 새 경매 물건이 {len(alerts)}건 있습니다.", ""]
+        rows = []
+        for alert in alerts:
+            item = alert.item
+            details = _item_details(item)
+            lines.append(f"- {item.title}")
+            if details:
+                lines.append(f"  {details}")
+            lines.append(f"  {item.url}")
+            rows.append(
+                f'<li><a href="{html.escape(item.url)}">{html.escape(item.title)}</a>'
+                + (f"<br><small>{html.escape(details)}</small>" if details else "")
+                + "</li>"
+            )
+
+        message.set_content("\n".join(lines))
+        message.add_alternative(
+            f"<p>등록하신 키워드와 일치하는 새 경매 물건이 {len(alerts)}건 있습니다.</p>"
+            f"<ul>{''.join(rows)}</ul>",
+            subtype="html",
+        )
+        return message
+
+    def render_single(self, user_id: str, text: str) -> EmailMessage:
+        message = EmailMessage()
+        message["Subject"] = "[경매 알림] 새 경매 물건"
+        message["From"] = settings.email_from
+        message["To"] = self.address_for(user_id)
+        message.set_content(text)
+        return message
+
+    async def send_messages(self, messages: List[EmailMessage]) -> List[Optional[EmailError]]:
+        """메일 여러 통을 유지 중인 SMTP 연결로 이어서 발송 (메일별 오류 반환, 성공은 None)"""
+        if not messages:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._send_all, messages)
+
+    def _send_all(self, messages: List[EmailMessage]) -> List[Optional[EmailError]]:
+        errors: List[Optional[EmailError]] = []
+        for message in messages:
+            try:
+                self._send_one(message)
+                self.stats['messages'] += 1
+                errors.append(None)
+            except EmailError as e:
+                self.stats['failed'] += 1
+                errors.append(e)
+        self._last_used = time.monotonic()
+        return errors
+
+    def _send_one(self, message: EmailMessage):
+        # 끊긴 연결이면 한 번만 다시 연결해서 재시도
+        for attempt in range(2):
+            try:
+                self._connection().send_message(message)
+                return
+            except smtplib.SMTPRecipientsRefused as e:
+                raise EmailError(f"수신자 거부: {message['To']}, {e.recipients}", retryable=False)
+            except smtplib.SMTPResponseException as e:
+                self._reset_if_broken(e)
+                if 500 <= e.smtp_code < 600:
+                    raise EmailError(f"SMTP 오류 {e.smtp_code}: {e.smtp_error!r}", retryable=False)
+                raise EmailError(f"SMTP 오류 {e.smtp_code}: {e.smtp_error!r}")
+            except (smtplib.SMTPServerDisconnected, OSError) as e:
+                self._close()
+                if attempt == 1:
+                    raise EmailError(f"SMTP 연결 실패: {type(e).__name__}: {e}")
+
+    def _connection(self) -> smtplib.SMTP:
+        # 오래 쉬었던 연결은 서버가 이미 닫았을 수 있으므로 NOOP으로 확인
+        if self._smtp is not None and time.monotonic() - self._last_used > settings.smtp_idle_check_seconds:
+            try:
+                self._smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                self._close()
+
+        if self._smtp is None:
+            if settings.smtp_use_ssl:
+                smtp = smtplib.SMTP_SSL(
+                    settings.smtp_host, settings.smtp_port,
+                    timeout=settings.smtp_timeout_seconds, context=ssl.create_default_context(),
+                )
+            else:
+                smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds)
+            # STARTTLS/로그인이 실패하면 만든 연결의 소켓을 닫고 다시 발생
+            try:
+                if settings.smtp_starttls and not settings.smtp_use_ssl:
+                    smtp.starttls(context=ssl.create_default_context())
+                if settings.smtp_username:
+                    smtp.login(settings.smtp_username, settings.smtp_password or "")
+            except BaseException:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            self.stats['connections'] += 1
+        return self._smtp
+
+    def _reset_if_broken(self, error: smtplib.SMTPResponseException):
+        # 421: 서버가 연결을 닫는 중
+        if error.smtp_code == 421:
+            self._close()
+        elif self._smtp is not None:
+            try:
+                self._smtp.rset()
+            except (smtplib.SMTPException, OSError):
+                self._close()
+
+    def _close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=False)
+
+
+def _item_details(item) -> str:
+    parts = []
+    if item.appraisal_value:
+        parts.append(f"감정가 {item.appraisal_value:,}원")
+    if item.minimum_bid:
+        parts.append(f"최저가 {item.minimum_bid:,}원")
+    if item.bid_date:
+        parts.append(f"매각기일 {item.bid_date.isoformat()}")
+    if item.area:
+        parts.append(f"면적 {item.area:g}㎡")
+    if item.failed_bid_count:
+        parts.append(f"유찰 {item.failed_bid_count}회")
+    return " · ".join(parts)
+
+
+email_digest_channel = EmailDigestChannel()
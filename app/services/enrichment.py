@@ -0,0 +1,122 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.crawler import BaseCrawler
+from app.crud import detected_item_crud
+
+
+class DetailCache:
+    """상세 페이지 URL별 추출 결과 (LRU, 같은 상세 페이지를 두 번 요청하지 않기 위함)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Dict]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[Dict]:
+        details = self._items.get(url)
+        if details is not None:
+            self._items.move_to_end(url)
+        return details
+
+    def put(self, url: str, details: Dict):
+        self._items[url] = details
+        self._items.move_to_end(url)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class DetailEnricher:
+    """새로 저장된 물건의 상세 페이지를 동시에 요청해 면적/최저가/유찰 횟수 보강
+
+    목록 크롤링과 같은 크롤러(호스트별 속도 제한, 전체 동시성 예산)를 거쳐 요청하고,
+    한 배치 안의 상세 페이지는 crawler_detail_concurrency 개씩 동시에 받는다.
+    """
+
+    def __init__(self, crawlers: Iterable[BaseCrawler], cache: Optional["DetailCache"] = None):
+        self.crawlers = {crawler.source_site: crawler for crawler in crawlers if crawler.supports_details}
+        self.cache = cache if cache is not None else detail_cache
+        self.semaphore = asyncio.Semaphore(settings.crawler_detail_concurrency)
+
+    async def fetch(self, items: List[Dict]) -> Dict[str, Dict]:
+        """물건(url, source_site를 담은 dict)의 상세 페이지를 받아 URL별 상세 속성 반환
+
+        DB를 건드리지 않으므로 쓰기 트랜잭션을 열기 전에 호출한다 (상세 페이지 요청은 속도 제한
+        때문에 오래 걸릴 수 있어 그동안 새 물건 행의 잠금을 붙잡고 있지 않도록).
+        상세 페이지 요청 실패는 물건별로 건너뛴다.
+        """
+        urls = list(dict.fromkeys(
+            (item['url'], item['source_site']) for item in items
+            if item.get('url') and item.get('source_site') in self.crawlers
+        ))
+        if not urls:
+            return {}
+
+        details_list = await asyncio.gather(*(self._details(url, source_site) for url, source_site in urls))
+        return {url: details for (url, _), details in zip(urls, details_list) if details is not None}
+
+    async def apply(self, db: AsyncSession, items: List[Dict], fetched: Dict[str, Dict]) -> int:
+        """받아 둔 상세 속성으로 물건 스냅샷(KeywordMatcher.snapshot)을 채우고 DB에 반영 (보강된 물건 수 반환)
+
+        네트워크 요청 없이 DB 갱신만 한다. 갱신은 savepoint 안에서 해서 실패해도 호출한 쪽
+        트랜잭션(새 물건/알림 저장)은 그대로 이어진다. 이때 스냅샷은 바꾸지 않는다.
+        """
+        enriched_at = datetime.now(timezone.utc)
+        updates = []
+        for item in items:
+            details = fetched.get(item['url'])
+            if details is None or item['enriched_at'] is not None:
+                continue
+
+            keywords = list(item['keywords'] or [])
+            keywords.extend(keyword for keyword in details.get('keywords', []) if keyword not in keywords)
+
+            updates.append((item, {
+                'area': details.get('area'),
+                'minimum_bid': details.get('minimum_bid'),
+                'failed_bid_count': details.get('failed_bid_count'),
+                'keywords': keywords,
+                'enriched_at': enriched_at,
+            }))
+        if not updates:
+            return 0
+
+        try:
+            async with db.begin_nested():
+                await detected_item_crud.bulk_update_details(
+                    db, [{'id': item['id'], **values} for item, values in updates]
+                )
+        except Exception as e:
+            print(f"❌ 상세 페이지 보강 저장 실패: {e}")
+            return 0
+
+        # 이어지는 키워드 매칭이 보강된 속성을 보도록 스냅샷에도 반영
+        for item, values in updates:
+            item.update(values)
+        return len(updates)
+
+    async def _details(self, url: str, source_site: str) -> Optional[Dict]:
+        details = self.cache.get(url)
+        if details is not None:
+            return details
+
+        async with self.semaphore:
+            try:
+                details = await self.crawlers[source_site].fetch_detail(url)
+            except Exception as e:
+                print(f"❌ 상세 페이지 보강 실패: {url}, 오류: {e}")
+                return None
+
+        if details is not None:
+            self.cache.put(url, details)
+        return details
+
+
+detail_cache = DetailCache(settings.crawler_detail_cache_size)
@@ -0,0 +1,127 @@
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set, Union
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 키워드 매칭 오토마톤
+
+    제목 하나를 한 번만 훑어서 등록된 모든 키워드를 찾는다.
+    키워드는 소문자로 정규화해 저장하며, 추가/삭제 시 트라이를 제자리에서 수정하고
+    실패 링크는 다음 검색 직전에 한 번만 다시 계산한다.
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self.rebuild(keywords)
+
+    def rebuild(self, keywords: Union[Iterable[str], Mapping[str, int]]):
+        """키워드 목록(또는 키워드별 등록 횟수)으로 오토마톤 전체 재생성"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._terminal: List[str] = [""]  # 노드에서 끝나는 키워드 ("" = 없음)
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]  # 실패 경로상 다음 종료 노드
+        self._counts: Dict[str, int] = {}
+        self._dirty = False
+
+        counts = keywords.items() if isinstance(keywords, Mapping) else ((keyword, 1) for keyword in keywords)
+        for keyword, count in counts:
+            self.add(keyword, count)
+
+    def add(self, keyword: str, count: int = 1):
+        """키워드 추가 (같은 키워드는 참조 횟수만 증가)"""
+        key = keyword.strip().lower()
+        if not key or count < 1:
+            return
+
+        exists = key in self._counts
+        self._counts[key] = self._counts.get(key, 0) + count
+        if exists:
+            return
+
+        node = 0
+        for char in key:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._terminal.append("")
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._goto[node][char] = next_node
+            node = next_node
+
+        self._terminal[node] = key
+        self._dirty = True
+
+    def remove(self, keyword: str):
+        """키워드 삭제 (마지막 참조가 사라질 때만 트라이에서 제거)"""
+        key = keyword.strip().lower()
+        count = self._counts.get(key)
+        if not count:
+            return
+
+        if count > 1:
+            self._counts[key] = count - 1
+            return
+
+        del self._counts[key]
+        node = self._find_node(key)
+        if node is not None:
+            self._terminal[node] = ""
+            self._dirty = True
+
+    def search(self, text: str) -> Set[str]:
+        """텍스트에 포함된 키워드(소문자) 집합 반환"""
+        if not self._counts or not text:
+            return set()
+
+        if self._dirty:
+            self._build_links()
+
+        found = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            match = node if self._terminal[node] else self._dict_link[node]
+            while match:
+                found.add(self._terminal[match])
+                match = self._dict_link[match]
+
+        return found
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword.strip().lower() in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _find_node(self, key: str):
+        node = 0
+        for char in key:
+            node = self._goto[node].get(char)
+            if node is None:
+                return None
+        return node
+
+    def _build_links(self):
+        """BFS로 실패 링크와 출력(사전) 링크 계산"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._terminal[fail] else self._dict_link[fail]
+                queue.append(child)
+
+        self._dirty = False
@@ -0,0 +1,89 @@
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+from app.config import settings
+from .keyword_automaton import KeywordAutomaton
+
+
+class KeywordIndex:
+    """키워드 → 구독 사용자 역색인 (메모리 보관)
+
+    크롤링 실행 시작 시 한 번의 쿼리로 적재하고, keyword_crud의 등록/수정/삭제 때마다
+    제자리에서 갱신한다. 다른 API 워커에서 바뀐 키워드는 TTL이 지나 다시 적재할 때 반영된다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self.automaton = KeywordAutomaton()
+        self.generation = 0  # 색인이 바뀔 때마다 증가
+        self.loaded_at: Optional[float] = None
+        self._subscribers: Dict[str, Dict[str, int]] = {}
+
+    def load(self, subscriptions: Iterable[Tuple[str, str]]):
+        """(keyword, user_id) 목록으로 색인 전체 재구성"""
+        subscribers: Dict[str, Dict[str, int]] = {}
+        for keyword, user_id in subscriptions:
+            key = keyword.strip().lower()
+            if not key:
+                continue
+            users = subscribers.setdefault(key, {})
+            users[user_id] = users.get(user_id, 0) + 1
+
+        self._subscribers = subscribers
+        self.automaton.rebuild({key: sum(users.values()) for key, users in subscribers.items()})
+        self.loaded_at = time.monotonic()
+        self.generation += 1
+
+    def is_stale(self) -> bool:
+        """적재된 적이 없거나 TTL이 지났는지 확인"""
+        if self.loaded_at is None:
+            return True
+        return time.monotonic() - self.loaded_at > self.ttl_seconds
+
+    def add(self, keyword: str, user_id: str):
+        """키워드 등록 반영"""
+        key = keyword.strip().lower()
+        if not key:
+            return
+
+        users = self._subscribers.setdefault(key, {})
+        users[user_id] = users.get(user_id, 0) + 1
+        self.automaton.add(key)
+        self.generation += 1
+
+    def remove(self, keyword: str, user_id: str):
+        """키워드 삭제 반영"""
+        key = keyword.strip().lower()
+        users = self._subscribers.get(key)
+        if not users or user_id not in users:
+            return
+
+        users[user_id] -= 1
+        if users[user_id] <= 0:
+            del users[user_id]
+        if not users:
+            del self._subscribers[key]
+        self.automaton.remove(key)
+        self.generation += 1
+
+    def match(self, title: str, item_keywords: Optional[Iterable[str]] = None) -> Set[str]:
+        """제목/추출 키워드와 일치하는 등록 키워드(소문자) 집합"""
+        matched = self.automaton.search(title or '')
+        for keyword in item_keywords or []:
+            key = keyword.strip().lower()
+            if key in self._subscribers:
+                matched.add(key)
+        return matched
+
+    def subscribers(self, keywords: Iterable[str]) -> Set[str]:
+        """키워드들을 구독한 사용자 ID 집합"""
+        user_ids = set()
+        for keyword in keywords:
+            user_ids.update(self._subscribers.get(keyword.strip().lower(), ()))
+        return user_ids
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+# 모든 요청/크롤링이 공유하는 역색인 인스턴스
+keyword_index = KeywordIndex(settings.keyword_index_ttl_seconds)
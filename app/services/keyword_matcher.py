@@ -1,15 +1,25 @@
-from typing import List, Dict, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
+import time
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.crawler import PageBatch
 from app.crud import keyword_crud, detected_item_crud, alert_crud
 from app.schemas.detected_item import DetectedItemCreate
 from app.schemas.alert import AlertCreate
+from app.config import settings
+from app.metrics import MATCHER_FANOUT, MATCHER_ITEMS_TOTAL, MATCHER_MATCH_SECONDS
+from .enrichment import DetailEnricher
+from .keyword_index import KeywordIndex, keyword_index
+from .notification_dispatcher import notification_dispatcher
+from .response_cache import LIST_TAG, item_tag, response_cache
 
 
 class KeywordMatcher:
     """키워드 매칭 서비스"""
     
-    def __init__(self):
-        pass
+    def __init__(self, index: KeywordIndex = keyword_index, enricher: Optional[DetailEnricher] = None):
+        self.index = index
+        # 상세 페이지 보강 (저장되지 않은 물건만, 쓰기 트랜잭션 전에 받아 두고 매칭 전에 반영)
+        self.enricher = enricher
     
     async def process_crawled_items(self, db: AsyncSession, crawled_items: List[Dict]) -> Dict:
         """크롤링된 물건들을 처리하고 키워드 매칭 수행"""
@@ -18,82 +28,209 @@ class KeywordMatcher:
             'new_items': 0,
             'duplicate_items': 0,
             'matched_items': 0,
-            'alerts_sent': 0
+            'alerts_sent': 0,
+            'duplicate_alerts': 0,
+            'enriched_items': 0,
+            'failed_batches': 0,
+            'match_seconds': 0.0,
+            'write_seconds': 0.0,
+            'enrich_seconds': 0.0
         }
         
+        # 키워드 역색인은 실행 시작 시 한 번의 쿼리로 적재 (TTL 내에서는 재사용)
+        started = time.perf_counter()
+        await self.load_index(db)
+        results['match_seconds'] += time.perf_counter() - started
+        
+        # 스키마 검증 (잘못된 물건만 제외)
+        item_creates = []
         for item_data in crawled_items:
             try:
-                # 중복 체크
-                existing_item = await detected_item_crud.get_by_url(db, item_data['url'])
-                if existing_item:
-                    results['duplicate_items'] += 1
-                    continue
-                
-                # 새 물건 저장
-                item_create = DetectedItemCreate(**item_data)
-                new_item = await detected_item_crud.create(db, item_create)
-                results['new_items'] += 1
-                
+                item_creates.append(DetectedItemCreate(**item_data))
+            except Exception as e:
+                print(f"❌ 물건 처리 실패: {e}")
+        
+        # 상세 페이지는 쓰기 트랜잭션 밖에서 받아 둠 (요청하는 동안 새 물건 행/URL 인덱스 잠금을 쥐지 않도록)
+        fetched = {}
+        if self.enricher is not None and item_creates:
+            started = time.perf_counter()
+            try:
+                fetched = await self._fetch_details(db, item_creates)
+            except Exception as e:
+                await db.rollback()
+                print(f"❌ 상세 페이지 보강 실패: {e}")
+            results['enrich_seconds'] += time.perf_counter() - started
+        
+        # 물건/알림/외부 채널 발송 행(outbox)을 한 트랜잭션으로 저장
+        # (알림 생성이 실패했는데 물건만 커밋되면 다음 크롤링부터 중복으로 걸러져 알림이 영영 생성되지 않음)
+        try:
+            new_items = await self._write_batch(db, item_creates, fetched, results)
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ 물건/알림 저장 실패: {e}")
+            results['failed_batches'] = 1
+            return results
+        
+        MATCHER_ITEMS_TOTAL.labels("new").inc(results['new_items'])
+        MATCHER_ITEMS_TOTAL.labels("duplicate").inc(results['duplicate_items'])
+        MATCHER_ITEMS_TOTAL.labels("matched").inc(results['matched_items'])
+        if results['alerts_sent'] and settings.notification_channels:
+            notification_dispatcher.wake()
+        
+        # 새 물건이 목록/검색 응답에, 보강 속성이 물건 상세 응답에 반영되도록 캐시 무효화
+        if new_items:
+            await self._invalidate_cache(db, new_items)
+        
+        return results
+    
+    async def _fetch_details(self, db: AsyncSession, item_creates: List[DetectedItemCreate]) -> Dict[str, Dict]:
+        """아직 저장되지 않은 물건의 상세 페이지를 받아 URL별 상세 속성 반환
+        
+        이미 저장된 URL 조회 후 트랜잭션을 끝내고 나서 요청한다. 조회와 저장 사이에 다른 곳에서
+        같은 URL을 저장하면 그 물건은 중복으로 건너뛰고 받아 둔 상세 속성만 쓰이지 않는다.
+        """
+        existing = await detected_item_crud.get_existing_urls(db, [item.url for item in item_creates])
+        await db.commit()
+        return await self.enricher.fetch([
+            {'url': item.url, 'source_site': item.source_site}
+            for item in item_creates if item.url not in existing
+        ])
+    
+    async def _write_batch(
+        self, db: AsyncSession, item_creates: List[DetectedItemCreate], fetched: Dict[str, Dict], results: Dict
+    ) -> List[Dict]:
+        """새 물건 저장 → 상세 속성 반영 → 매칭 → 알림 생성 후 한 번만 커밋 (저장된 새 물건 스냅샷 반환)
+        
+        중간에 실패하면 호출한 쪽에서 롤백하므로 물건도 저장되지 않고 다음 크롤링에서 다시 처리된다.
+        """
+        # 새 물건 일괄 저장 (URL 중복은 DB에서 건너뜀)
+        started = time.perf_counter()
+        created = await detected_item_crud.bulk_create(db, item_creates)
+        results['write_seconds'] += time.perf_counter() - started
+        
+        # 이후 단계는 ORM 객체 대신 값 사본을 사용 (롤백 등으로 객체가 만료되면 속성 접근 시
+        # 비동기 세션에서 암묵적 refresh가 일어나 MissingGreenlet으로 실패함)
+        new_items = [self.snapshot(item) for item in created]
+        
+        # 미리 받아 둔 상세 속성만 반영 (이 트랜잭션 안에서는 네트워크 요청을 하지 않음)
+        enriched = await self.enricher.apply(db, new_items, fetched) if self.enricher is not None else 0
+        
+        started = time.perf_counter()
+        matched_items = 0
+        alerts_to_create = []
+        for item_data in new_items:
+            try:
                 # 키워드 매칭 수행
-                matched_users = await self._find_matching_users(db, item_data)
+                matched_users = self._find_matching_users(item_data)
                 if matched_users:
-                    results['matched_items'] += 1
+                    matched_items += 1
+                    MATCHER_FANOUT.observe(len(matched_users))
                     
-                    # 매칭된 사용자들에게 알림 생성
+                    # 매칭된 사용자들의 알림을 모아서 한 번에 생성
+                    message = self._build_message(item_data)
                     for user_id in matched_users:
-                        await self._create_alert(db, user_id, new_item.id, item_data)
-                        results['alerts_sent'] += 1
+                        alerts_to_create.append(
+                            AlertCreate(user_id=user_id, item_id=item_data['id'], message=message)
+                        )
                 
             except Exception as e:
                 print(f"❌ 물건 처리 실패: {e}")
                 continue
+        elapsed = time.perf_counter() - started
+        results['match_seconds'] += elapsed
+        MATCHER_MATCH_SECONDS.observe(elapsed)
         
-        return results
-    
-    async def _find_matching_users(self, db: AsyncSession, item_data: Dict) -> List[str]:
-        """물건과 매칭되는 사용자들 찾기"""
-        matching_users = set()
-        
-        # 모든 키워드 조회
-        all_keywords = await keyword_crud.get_all_keywords(db)
+        started = time.perf_counter()
+        # 외부 채널 발송 행(outbox)도 같은 트랜잭션에서 생성 → 발송은 NotificationDispatcher 워커가 처리
+        alert_results = await alert_crud.bulk_create(
+            db, alerts_to_create, channels=settings.notification_channels
+        )
+        await db.commit()
+        results['write_seconds'] += time.perf_counter() - started
         
-        # 물건 제목과 키워드 비교
-        title = item_data.get('title', '').lower()
-        item_keywords = item_data.get('keywords', [])
+        # 커밋된 뒤에만 결과 반영
+        results['new_items'] = len(new_items)
+        results['duplicate_items'] = len(item_creates) - len(new_items)
+        results['enriched_items'] = enriched
+        results['matched_items'] = matched_items
+        results['alerts_sent'] = alert_results['created']
+        results['duplicate_alerts'] = alert_results['duplicates']
+        return new_items
+    
+    async def process_stream(
+        self, db: AsyncSession, batches: AsyncIterator[List[Dict]], totals: Optional[Dict] = None
+    ) -> Dict:
+        """크롤링 배치가 도착하는 대로 저장/매칭/알림 처리 후 결과 합산
         
-        for keyword in all_keywords:
-            keyword_lower = keyword.lower()
-            
-            # 제목에 키워드가 포함되거나, 추출된 키워드에 일치하는 것이 있는지 확인
-            if keyword_lower in title or keyword in item_keywords:
-                # 해당 키워드를 등록한 사용자들 찾기
-                keyword_records = await keyword_crud.get_by_user_id(db, keyword)
-                for record in keyword_records:
-                    if record.keyword.lower() == keyword_lower:
-                        matching_users.add(record.user_id)
-        
-        return list(matching_users)
+        totals를 넘기면 배치마다 그 dict에 바로 누적한다 (진행 상황 조회용).
+        적재가 끝난 페이지 배치만 페이지 캐시와 이미 본 URL 필터에 기록하므로 저장에 실패한
+        페이지는 다음 실행에서 다시 요청/파싱된다.
+        """
+        totals = {} if totals is None else totals
+        async for batch in batches:
+            results = await self.process_crawled_items(db, batch)
+            for key, value in results.items():
+                totals[key] = totals.get(key, 0) + value
+            if isinstance(batch, PageBatch) and not results['failed_batches']:
+                try:
+                    await batch.mark_ingested()
+                except Exception as e:
+                    print(f"❌ 페이지 캐시 기록 실패: {e}")
+        return totals
+    
+    @staticmethod
+    def snapshot(item) -> Dict:
+        """매칭/보강/캐시 무효화에 쓰는 물건 값 사본"""
+        return {
+            'id': item.id,
+            'title': item.title,
+            'url': item.url,
+            'source_site': item.source_site,
+            'keywords': list(item.keywords or []),
+            'area': item.area,
+            'minimum_bid': item.minimum_bid,
+            'failed_bid_count': item.failed_bid_count,
+            'enriched_at': item.enriched_at,
+        }
     
-    async def _create_alert(self, db: AsyncSession, user_id: str, item_id: int, item_data: Dict):
-        """알림 생성"""
+    async def _invalidate_cache(self, db: AsyncSession, new_items: List[Dict]) -> None:
+        tags = [LIST_TAG] + [item_tag(item['id']) for item in new_items if item['enriched_at'] is not None]
         try:
-            # 중복 알림 체크
-            if await alert_crud.check_duplicate_alert(db, user_id, item_id):
-                return
-            
-            # 알림 메시지 생성
-            message = f"새로운 경매 물건이 발견되었습니다: {item_data.get('title', '')[:50]}..."
-            
-            alert_create = AlertCreate(
-                user_id=user_id,
-                item_id=item_id,
-                message=message
-            )
-            
-            await alert_crud.create(db, alert_create)
-            
+            await response_cache.invalidate(db, tags)
         except Exception as e:
-            print(f"❌ 알림 생성 실패: {e}")
+            await db.rollback()
+            print(f"❌ 응답 캐시 무효화 실패: {e}")
+    
+    async def load_index(self, db: AsyncSession, force: bool = False):
+        """키워드 역색인 적재 (TTL이 지났거나 강제할 때만)"""
+        if force or self.index.is_stale():
+            self.index.load(await keyword_crud.get_subscriptions(db))
+    
+    def _find_matching_users(self, item_data: Dict) -> List[str]:
+        """물건과 매칭되는 사용자들 찾기"""
+        matched_keywords = self.match_keywords(item_data)
+        if not matched_keywords:
+            return []
+        return list(self.index.subscribers(matched_keywords))
+    
+    def match_keywords(self, item_data: Dict) -> Set[str]:
+        """물건 제목/추출 키워드와 일치하는 등록 키워드(소문자) 집합"""
+        return self.index.match(item_data.get('title', ''), item_data.get('keywords'))
+    
+    def _build_message(self, item_data: Dict) -> str:
+        """알림 메시지 생성 (상세 페이지 보강 속성이 있으면 함께 표시)"""
+        message = f"새로운 경매 물건이 발견되었습니다: {item_data.get('title', '')[:50]}..."
+        
+        details = []
+        if item_data.get('area'):
+            details.append(f"면적 {item_data['area']:g}㎡")
+        if item_data.get('minimum_bid'):
+            details.append(f"최저가 {item_data['minimum_bid']:,}원")
+        if item_data.get('failed_bid_count'):
+            details.append(f"유찰 {item_data['failed_bid_count']}회")
+        if details:
+            message += f" ({', '.join(details)})"
+        return message
     
     def calculate_match_score(self, item_data: Dict, user_keywords: List[str]) -> float:
         """매칭 점수 계산 (향후 확장용)"""
@@ -1,61 +1,136 @@
 from typing import List, Dict, Optional
 import asyncio
 from app.config import settings
+from app.metrics import NOTIFICATION_SEND_TOTAL
+from app.models.alert import Alert
+from .email_digest import EmailDigestChannel, email_digest_channel
+from .webhook import WebhookChannel, WebhookError, webhook_channel
+
+
+class NotificationError(Exception):
+    """알림 발송 실패 (retryable=False면 재시도하지 않음)"""
+    
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
 
 
 class NotificationService:
     """알림 서비스"""
     
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        webhook: Optional[WebhookChannel] = None,
+        email: Optional[EmailDigestChannel] = None,
+    ):
+        # 대량 발송 시 동시에 진행할 발송 수
+        self.concurrency = concurrency or settings.notification_concurrency
+        self.webhook = webhook or webhook_channel
+        self.email = email or email_digest_channel
     
-    async def send_notification(self, user_id: str, message: str, channel: str = "database") -> bool:
-        """알림 발송"""
+    async def deliver(
+        self, user_id: str, message: str, channel: str = "database", alert: Optional[Dict] = None
+    ) -> None:
+        """알림 발송 (실패하면 NotificationError 등 예외 발생)
+        
+        alert는 outbox에서 온 알림의 alert_id, item_id (웹훅 본문에 포함)
+        """
+        outcome = "error"
         try:
             if channel == "database":
                 # 데이터베이스 저장 (이미 CRUD에서 처리됨)
-                return True
+                pass
             elif channel == "email":
-                return await self._send_email(user_id, message)
+                if not await self._send_email(user_id, message):
+                    raise NotificationError("이메일 발송 실패")
             elif channel == "webhook":
-                return await self._send_webhook(user_id, message)
+                if not await self._send_webhook(user_id, message, alert or {}):
+                    raise NotificationError("웹훅 발송 실패")
             else:
-                print(f"❌ 지원하지 않는 알림 채널: {channel}")
-                return False
+                outcome = "unsupported"
+                raise NotificationError(f"지원하지 않는 알림 채널: {channel}", retryable=False)
+            outcome = "sent"
+        finally:
+            NOTIFICATION_SEND_TOTAL.labels(channel, outcome).inc()
+    
+    async def send_notification(self, user_id: str, message: str, channel: str = "database") -> bool:
+        """알림 발송"""
+        try:
+            await self.deliver(user_id, message, channel)
+            return True
         except Exception as e:
             print(f"❌ 알림 발송 실패: {e}")
             return False
     
     async def _send_email(self, user_id: str, message: str) -> bool:
-        """이메일 알림 발송 (향후 구현)"""
-        # TODO: 이메일 발송 구현
-        print(f"📧 이메일 알림 (개발 예정): {user_id} - {message}")
+        """이메일 알림 한 건 발송 (outbox를 거치는 이메일은 deliver_email_digests로 모아서 발송)"""
+        if not self.email.address_for(user_id):
+            raise NotificationError(f"메일 주소가 없는 사용자: {user_id}", retryable=False)
+        
+        [error] = await self.email.send_messages([self.email.render_single(user_id, message)])
+        if error is not None:
+            raise NotificationError(str(error), retryable=error.retryable) from error
         return True
     
-    async def _send_webhook(self, user_id: str, message: str) -> bool:
-        """웹훅 알림 발송 (향후 구현)"""
-        # TODO: 웹훅 발송 구현
-        print(f"🔗 웹훅 알림 (개발 예정): {user_id} - {message}")
+    async def deliver_email_digests(self, digests: Dict[str, List[Alert]]) -> Dict[str, Optional[Exception]]:
+        """사용자별 알림을 요약 메일 한 통씩으로 발송 (사용자별 오류 반환, 성공은 None)"""
+        results: Dict[str, Optional[Exception]] = {}
+        messages = []
+        recipients = []
+        for user_id, alerts in digests.items():
+            if not self.email.address_for(user_id):
+                results[user_id] = NotificationError(f"메일 주소가 없는 사용자: {user_id}", retryable=False)
+                continue
+            messages.append(self.email.render_digest(user_id, alerts))
+            recipients.append(user_id)
+        
+        errors = await self.email.send_messages(messages)
+        for user_id, error in zip(recipients, errors):
+            results[user_id] = (
+                NotificationError(str(error), retryable=error.retryable) if error is not None else None
+            )
+        
+        for user_id, error in results.items():
+            outcome = "sent" if error is None else "error"
+            NOTIFICATION_SEND_TOTAL.labels("email", outcome).inc(len(digests[user_id]))
+        return results
+    
+    async def _send_webhook(self, user_id: str, message: str, alert: Dict) -> bool:
+        """웹훅 알림 발송 (같은 주소로 가는 알림은 WebhookChannel이 모아서 한 번에 전송)"""
+        url = self.webhook.endpoint_for(user_id)
+        if not url:
+            raise NotificationError(f"웹훅 주소가 설정되지 않은 사용자: {user_id}", retryable=False)
+        
+        payload = {
+            'alert_id': alert.get('alert_id'),
+            'item_id': alert.get('item_id'),
+            'user_id': user_id,
+            'message': message,
+        }
+        try:
+            await self.webhook.send(url, payload)
+        except WebhookError as e:
+            raise NotificationError(str(e), retryable=e.retryable) from e
         return True
     
     async def send_bulk_notifications(self, notifications: List[Dict]) -> Dict:
-        """대량 알림 발송"""
-        results = {
-            'total': len(notifications),
-            'success': 0,
-            'failed': 0
-        }
+        """대량 알림 발송 (최대 concurrency 개씩 동시에)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        for notification in notifications:
-            success = await self.send_notification(
-                notification.get('user_id'),
-                notification.get('message'),
-                notification.get('channel', 'database')
-            )
-            
-            if success:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
+        async def send(notification: Dict) -> bool:
+            async with semaphore:
+                return await self.send_notification(
+                    notification.get('user_id'),
+                    notification.get('message'),
+                    notification.get('channel', 'database')
+                )
         
-        return results 
\ No newline at end of file
+        outcomes = await asyncio.gather(*(send(notification) for notification in notifications))
+        success = sum(1 for outcome in outcomes if outcome)
+        
+        return {
+            'total': len(notifications),
+            'success': success,
+            'failed': len(notifications) - success
+        }
@@ -0,0 +1,189 @@
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.crud import alert_crud, notification_outbox_crud
+from app.database import AsyncSessionLocal
+from .notification import NotificationError, NotificationService
+
+# 사용자별로 모아 보내는 채널 (행 단위 claim에서 제외)
+DIGEST_CHANNELS = ("email",)
+
+
+class NotificationDispatcher:
+    """outbox 테이블의 알림을 여러 워커가 나눠 발송
+
+    워커는 FOR UPDATE SKIP LOCKED로 서로 겹치지 않게 행을 가져가므로 프로세스/워커 수를
+    늘리면 처리량이 늘어난다. 채널별 세마포어로 동시 발송 수를 제한하고, 실패한 행은
+    지수 백오프(지터 포함)로 다시 시도하다가 max_attempts를 넘으면 failed로 남긴다.
+    """
+
+    def __init__(self, service: Optional[NotificationService] = None):
+        self.service = service or NotificationService()
+        self.workers = settings.notification_workers
+        self.batch_size = settings.notification_batch_size
+        self.concurrency = settings.notification_concurrency
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._wake = asyncio.Event()
+        self.stats = {'claimed': 0, 'sent': 0, 'retried': 0, 'failed': 0, 'pruned': 0}
+
+    def start(self):
+        """발송 워커 시작 (채널이 설정되어 있고 workers > 0일 때)"""
+        if self._tasks or self.workers <= 0 or not settings.notification_channels:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(index), name=f"notification-worker-{index}")
+            for index in range(self.workers)
+        ]
+        if settings.notification_sent_retention_hours > 0:
+            self._tasks.append(asyncio.create_task(self._prune(), name="notification-prune"))
+        print(f"📨 알림 발송 워커 시작: {self.workers}개, 채널 {settings.notification_channels}")
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def wake(self):
+        """새 알림이 outbox에 들어갔음을 알림 (같은 프로세스의 워커가 폴링 주기를 기다리지 않도록)"""
+        self._wake.set()
+
+    async def _worker(self, index: int):
+        while True:
+            try:
+                processed = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ 알림 발송 워커 {index} 오류: {e}")
+                processed = 0
+
+            # 가득 찬 배치였으면 밀린 행이 더 있을 수 있으므로 바로 다음 배치
+            if processed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.notification_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _prune(self):
+        """보관 기간이 지난 발송 완료 행을 주기적으로 삭제 (outbox가 발송 이력으로 계속 커지지 않도록)"""
+        retention = timedelta(hours=settings.notification_sent_retention_hours)
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    pruned = await notification_outbox_crud.prune_sent(db, retention)
+                self.stats['pruned'] += pruned
+                if pruned:
+                    print(f"🧹 발송 완료 알림 {pruned}건 정리")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ 발송 완료 알림 정리 실패: {e}")
+            await asyncio.sleep(settings.notification_prune_interval_seconds)
+
+    async def dispatch_once(self) -> int:
+        """발송할 행을 한 배치 가져와 동시에 발송하고 결과 기록 (처리한 행 수 반환)
+        
+        이메일은 행마다 보내지 않고 발송 시각이 된 사용자의 행을 모두 가져와 요약 메일로 보낸다.
+        """
+        async with AsyncSessionLocal() as db:
+            entries = await notification_outbox_crud.claim(
+                db, self.batch_size, settings.notification_lease_seconds, exclude_channels=DIGEST_CHANNELS
+            )
+            digest_entries = []
+            if "email" in settings.notification_channels:
+                digest_entries = await notification_outbox_crud.claim_user_batches(
+                    db, "email", settings.email_digest_max_users, settings.notification_lease_seconds
+                )
+            if not entries and not digest_entries:
+                return 0
+            self.stats['claimed'] += len(entries) + len(digest_entries)
+            
+            outcomes = await asyncio.gather(
+                *(self._send(entry) for entry in entries),
+                self._send_digests(db, digest_entries),
+            )
+            errors = list(outcomes[:len(entries)]) + outcomes[-1]
+            await self._record(db, entries + digest_entries, errors)
+            return len(entries) + len(digest_entries)
+
+    async def _record(self, db, entries: List[Dict], errors: List[Optional[Exception]]):
+        sent_ids = []
+        failures = []
+        now = datetime.now(timezone.utc)
+        for entry, error in zip(entries, errors):
+            if error is None:
+                sent_ids.append(entry['id'])
+                continue
+            
+            retryable = getattr(error, 'retryable', True)
+            if retryable and entry['attempts'] < settings.notification_max_attempts:
+                status, next_attempt_at = 'pending', now + self.backoff(entry['attempts'])
+                self.stats['retried'] += 1
+            else:
+                status, next_attempt_at = 'failed', now
+                self.stats['failed'] += 1
+                print(f"❌ 알림 발송 포기: outbox {entry['id']} ({entry['channel']}), 오류: {error}")
+            failures.append({
+                'id': entry['id'],
+                'status': status,
+                'next_attempt_at': next_attempt_at,
+                'last_error': str(error)[:1000],
+            })
+        
+        await notification_outbox_crud.mark_sent(db, sent_ids)
+        await notification_outbox_crud.mark_failed(db, failures)
+        self.stats['sent'] += len(sent_ids)
+
+    async def _send_digests(self, db, entries: List[Dict]) -> List[Optional[Exception]]:
+        """가져온 이메일 행을 사용자별 요약 메일로 발송 (행별 결과 반환)"""
+        if not entries:
+            return []
+        try:
+            loaded = await alert_crud.get_by_ids(db, [entry['alert_id'] for entry in entries])
+            alerts = {alert.id: alert for alert in loaded}
+            digests: Dict[str, List] = {}
+            for entry in entries:
+                alert = alerts.get(entry['alert_id'])
+                if alert is not None:
+                    digests.setdefault(entry['user_id'], []).append(alert)
+            results = await self.service.deliver_email_digests(digests)
+        except Exception as e:
+            error = NotificationError(f"{type(e).__name__}: {e}")
+            return [error] * len(entries)
+        return [results.get(entry['user_id']) for entry in entries]
+
+    async def _send(self, entry: Dict) -> Optional[Exception]:
+        semaphore = self._semaphores.get(entry['channel'])
+        if semaphore is None:
+            semaphore = self._semaphores[entry['channel']] = asyncio.Semaphore(self.concurrency)
+
+        async with semaphore:
+            try:
+                await self.service.deliver(
+                    entry['user_id'], entry['message'], entry['channel'],
+                    alert={'alert_id': entry['alert_id'], 'item_id': entry['item_id']},
+                )
+                return None
+            except NotificationError as e:
+                return e
+            except Exception as e:
+                return NotificationError(f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    def backoff(attempts: int) -> timedelta:
+        """attempts번째 실패 후 다음 시도까지 대기 시간 (지수 백오프, 50~100% 지터)"""
+        delay = min(
+            settings.notification_backoff_base_seconds * (2 ** max(attempts - 1, 0)),
+            settings.notification_backoff_max_seconds,
+        )
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import asyncpg
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+# 워커 간 무효화 알림 채널 (response_cache_shared=True일 때)
+INVALIDATE_CHANNEL = "auction_response_cache"
+
+# 태그: 목록/검색 응답 전체, 물건 하나
+LIST_TAG = "detected:list"
+
+
+def item_tag(item_id: int) -> str:
+    return f"detected:item:{item_id}"
+
+
+class CachedResponse(NamedTuple):
+    tag: str
+    body: bytes
+    etag: str
+    headers: Dict[str, str]
+    expires_at: float
+
+
+class ResponseCache:
+    """조회 API 응답 캐시 (LRU + TTL, 본문 해시 ETag)
+
+    데이터는 크롤링 적재 때만 바뀌므로 적재 경로(KeywordMatcher)에서 바뀐 범위의
+    태그만 정확히 무효화한다. 무효화와 동시에 계산 중이던 응답은 세대(generation)를
+    비교해 캐시에 넣지 않는다. shared 모드에서는 Postgres NOTIFY로 다른 워커에도
+    무효화를 전달하며, 무효화 알림을 받는 LISTEN 연결이 없는 동안(시작 전, 끊긴 뒤 재연결 전)에는
+    다른 워커의 무효화를 놓칠 수 있으므로 캐시를 쓰지 않는다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True, shared: bool = False):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.shared = shared
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._listener: Optional[asyncpg.Connection] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """캐시 사용 여부 (shared 모드는 무효화 알림을 받고 있을 때만)"""
+        if not self.enabled:
+            return False
+        return not self.shared or (self._listener is not None and not self._listener.is_closed())
+
+    @staticmethod
+    def make_key(request: Request) -> str:
+        """경로 + 정렬한 쿼리 파라미터"""
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def respond(
+        self,
+        request: Request,
+        tag: str,
+        load: Callable[[Response], Awaitable[Any]],
+        adapter: TypeAdapter,
+    ) -> Response:
+        """캐시된 응답 반환 (없으면 load로 데이터를 읽어 직렬화 후 저장)
+
+        load는 헤더(예: X-Next-Cursor)를 설정할 수 있는 Response를 받는다.
+        If-None-Match가 본문 해시와 같으면 304를 반환한다.
+        """
+        key = self.make_key(request)
+        active = self.active
+        entry = self.get(key) if active else None
+
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            generation = self.generation
+            scratch = Response()
+            data = await load(scratch)
+            body = adapter.dump_json(data)
+            headers = {
+                name: value for name, value in scratch.headers.items()
+                if name.lower() not in ("content-length", "content-type")
+            }
+            entry = CachedResponse(tag, body, self.make_etag(body), headers, time.monotonic() + self.ttl_seconds)
+            # 읽는 동안 무효화가 있었으면 오래된 데이터일 수 있으므로 저장하지 않음
+            if active and generation == self.generation:
+                self.put(key, entry)
+
+        headers = {**entry.headers, "ETag": entry.etag, "Cache-Control": "no-cache"}
+        if entry.etag in _parse_if_none_match(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def clear(self):
+        """캐시 전체 비우기 (계산 중이던 응답도 저장하지 않도록 세대 증가)"""
+        self.generation += 1
+        self._entries.clear()
+
+    def invalidate_local(self, tags: Iterable[str]):
+        tags = set(tags)
+        if not tags:
+            return
+        self.generation += 1
+        for key in [key for key, entry in self._entries.items() if entry.tag in tags]:
+            del self._entries[key]
+
+    async def invalidate(self, db: AsyncSession, tags: Iterable[str]):
+        """태그에 해당하는 응답 무효화 (shared 모드면 다른 워커에도 알림)"""
+        tags = list(tags)
+        if not tags:
+            return
+        self.invalidate_local(tags)
+
+        if self.shared:
+            payload = json.dumps({"origin": self._origin, "tags": tags})
+            await db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": INVALIDATE_CHANNEL, "payload": payload})
+            await db.commit()
+
+    async def start_listener(self):
+        """다른 워커의 무효화 알림 구독 (shared 모드에서만, 연결이 끊기면 다시 연결)"""
+        if not (self.enabled and self.shared) or self._listen_task is not None:
+            return
+        self._listen_task = asyncio.create_task(self._listen(), name="response-cache-listener")
+
+    async def _listen(self):
+        delay = 1.0
+        while True:
+            lost = asyncio.Event()
+            try:
+                listener = await asyncpg.connect(settings.database_url)
+                listener.add_termination_listener(lambda connection: lost.set())
+                await listener.add_listener(INVALIDATE_CHANNEL, self._on_notify)
+            except Exception as e:
+                print(f"❌ 응답 캐시 무효화 알림 구독 실패: {e} ({delay:.0f}초 후 재시도)")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                continue
+
+            # 연결이 없던 동안의 무효화를 놓쳤을 수 있으므로 비우고 시작
+            self.clear()
+            self._listener = listener
+            delay = 1.0
+            print("📡 응답 캐시 무효화 알림 구독 시작")
+
+            await lost.wait()
+            self._listener = None
+            self.clear()
+            print("⚠️ 응답 캐시 무효화 알림 연결이 끊겼습니다 (다시 연결할 때까지 캐시 사용 안 함)")
+
+    async def stop_listener(self):
+        task, self._listen_task = self._listen_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            await listener.close()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") != self._origin:
+            self.invalidate_local(message.get("tags", []))
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "generation": self.generation,
+            "active": self.active,
+        }
+
+
+def _parse_if_none_match(value: Optional[str]) -> Tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(tag.strip().removeprefix("W/") for tag in value.split(","))
+
+
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    enabled=settings.response_cache_enabled,
+    shared=settings.response_cache_shared,
+)
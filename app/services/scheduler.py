@@ -0,0 +1,49 @@
+from typing import Optional
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.config import settings
+from .crawling import crawl_runner
+
+_scheduler: Optional[AsyncIOScheduler] = None
+
+
+async def scheduled_crawl():
+    """주기 크롤링 작업 (다른 워커가 실행 중이면 건너뜀)"""
+    result = await crawl_runner.trigger(
+        pages=settings.crawler_scheduled_pages,
+        incremental=settings.crawler_scheduled_incremental,
+        trigger="scheduler",
+    )
+    if result["status"] != "started":
+        print(f"⏭️ 예약 크롤링 건너뜀: {result['status']}")
+        return
+
+    task = crawl_runner.current_task
+    if task is not None:
+        await task
+
+
+def start_scheduler():
+    """crawler_interval_hours 주기로 크롤링 예약"""
+    global _scheduler
+    if _scheduler is not None or not settings.crawler_scheduler_enabled:
+        return
+
+    _scheduler = AsyncIOScheduler(timezone="UTC")
+    _scheduler.add_job(
+        scheduled_crawl,
+        "interval",
+        hours=settings.crawler_interval_hours,
+        id="crawl",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.start()
+    print(f"⏰ 크롤링 스케줄러 시작: {settings.crawler_interval_hours}시간 간격")
+
+
+def shutdown_scheduler():
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from app.config import settings
+
+
+class WebhookError(Exception):
+    """웹훅 발송 실패 (retryable=False면 재시도해도 같은 결과)"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold번이면 reset_seconds 동안 요청을 바로 실패시키는 차단기
+
+    차단 시간이 지나면 요청 하나만 시험 삼아 보내고(half-open), 성공하면 다시 닫는다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+
+class _EndpointQueue:
+    """한 웹훅 주소로 보낼 알림을 모아 두는 대기열"""
+
+    def __init__(self, concurrency: int, breaker: CircuitBreaker):
+        self.pending: List[Tuple[Dict, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.breaker = breaker
+
+
+class WebhookChannel:
+    """웹훅 알림 채널
+
+    - 모든 주소가 keep-alive 연결 풀을 가진 httpx 클라이언트 하나를 공유
+    - 같은 주소로 가는 알림은 batch_window 동안 모아서 JSON POST 한 번으로 전송
+      ({"alerts": [...]}, 최대 batch_max_size개)
+    - 주소별 동시 요청 수 제한, 요청 타임아웃
+    - 주소별 차단기: 응답이 없거나 실패가 이어지는 수신자는 잠시 바로 실패 처리해서
+      발송 워커가 그 수신자를 기다리느라 다른 알림을 못 보내는 일이 없게 함
+    """
+
+    def __init__(self):
+        self.batch_window = settings.webhook_batch_window_seconds
+        self.batch_max_size = settings.webhook_batch_max_size
+        self._client: Optional[httpx.AsyncClient] = None
+        self._endpoints: Dict[str, _EndpointQueue] = {}
+        self._posts: Set[asyncio.Task] = set()
+        self.stats = {'requests': 0, 'alerts': 0, 'failed_requests': 0, 'rejected': 0}
+
+    @staticmethod
+    def endpoint_for(user_id: str) -> Optional[str]:
+        """사용자의 웹훅 주소 (사용자별 주소가 없으면 기본 주소)"""
+        return settings.webhook_user_urls.get(user_id) or settings.webhook_default_url
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.webhook_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.webhook_max_connections,
+                    max_keepalive_connections=settings.webhook_max_connections,
+                ),
+            )
+        return self._client
+
+    async def send(self, url: str, payload: Dict) -> None:
+        """알림 하나를 주소별 배치에 넣고 그 배치가 전송될 때까지 대기 (실패하면 WebhookError)"""
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            endpoint = self._endpoints[url] = _EndpointQueue(
+                settings.webhook_endpoint_concurrency,
+                CircuitBreaker(settings.webhook_breaker_failures, settings.webhook_breaker_reset_seconds),
+            )
+
+        # 차단 중인 주소는 모으지 않고 바로 실패 (발송 워커가 백오프 후 다시 시도)
+        if endpoint.breaker.state == "open":
+            self.stats['rejected'] += 1
+            raise WebhookError(f"웹훅 수신자 차단 중: {url}")
+
+        future = asyncio.get_running_loop().create_future()
+        endpoint.pending.append((payload, future))
+        if len(endpoint.pending) >= self.batch_max_size:
+            self._flush(url, endpoint)
+        elif endpoint.flush_handle is None:
+            endpoint.flush_handle = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush, url, endpoint
+            )
+        await future
+
+    def _flush(self, url: str, endpoint: _EndpointQueue):
+        if endpoint.flush_handle is not None:
+            endpoint.flush_handle.cancel()
+            endpoint.flush_handle = None
+        batch, endpoint.pending = endpoint.pending, []
+        if batch:
+            task = asyncio.create_task(self._post(url, endpoint, batch))
+            self._posts.add(task)
+            task.add_done_callback(self._posts.discard)
+
+    async def _post(self, url: str, endpoint: _EndpointQueue, batch: List[Tuple[Dict, asyncio.Future]]):
+        # 어떤 예외(잘못된 주소, 직렬화할 수 없는 알림, 취소 등)로 끝나도 배치를 기다리는 send()가
+        # 모두 깨어나고, 시험 요청(half-open) 중이던 차단기도 결과를 기록하도록 finally에서 정리
+        error: Optional[WebhookError] = None
+        delivered = False
+        try:
+            async with endpoint.semaphore:
+                if not endpoint.breaker.allow():
+                    self.stats['rejected'] += len(batch)
+                    error = WebhookError(f"웹훅 수신자 차단 중: {url}")
+                    return
+
+                self.stats['requests'] += 1
+                recorded = False
+                try:
+                    response = await self.client.post(url, json={"alerts": [payload for payload, _ in batch]})
+                    if response.is_success:
+                        endpoint.breaker.record_success()
+                        self.stats['alerts'] += len(batch)
+                        delivered = True
+                    else:
+                        # 4xx(408/429 제외)는 요청 내용 문제라서 재시도하지 않음, 수신자 장애로 보지 않음
+                        retryable = response.status_code >= 500 or response.status_code in (408, 429)
+                        if retryable:
+                            endpoint.breaker.record_failure()
+                        else:
+                            endpoint.breaker.record_success()
+                        error = WebhookError(f"웹훅 응답 {response.status_code}: {url}", retryable=retryable)
+                    recorded = True
+                except httpx.HTTPError as e:
+                    error = WebhookError(f"웹훅 요청 실패: {url}, {type(e).__name__}: {e}")
+                except Exception as e:
+                    error = WebhookError(f"웹훅 요청 오류: {url}, {type(e).__name__}: {e}")
+                finally:
+                    if not recorded:
+                        endpoint.breaker.record_failure()
+                    if not delivered:
+                        self.stats['failed_requests'] += 1
+        finally:
+            if not delivered and error is None:
+                error = WebhookError(f"웹훅 발송 중단: {url}")
+            for _, future in batch:
+                if future.done():
+                    continue
+                if delivered:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    async def close(self):
+        """모아 둔 알림을 모두 보내고 연결 풀 종료"""
+        for url, endpoint in list(self._endpoints.items()):
+            self._flush(url, endpoint)
+        await asyncio.gather(*self._posts, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def endpoint_stats(self) -> Dict:
+        return {
+            "endpoints": {
+                url: {"state": endpoint.breaker.state, "pending": len(endpoint.pending)}
+                for url, endpoint in self._endpoints.items()
+            },
+            **self.stats,
+        }
+
+
+webhook_channel = WebhookChannel()
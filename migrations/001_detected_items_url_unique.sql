@@ -0,0 +1,29 @@
+-- =====================================================
+-- 001. auction_detected_items.url 유니크 인덱스
+-- 일괄 저장(INSERT ... ON CONFLICT (url) DO NOTHING)에 필요
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+-- 1. 중복 URL의 알림을 가장 먼저 저장된 물건으로 옮기기
+UPDATE auction_alerts a
+SET item_id = d.keep_id
+FROM (
+    SELECT id, MIN(id) OVER (PARTITION BY url) AS keep_id
+    FROM auction_detected_items
+) d
+WHERE a.item_id = d.id
+    AND d.id <> d.keep_id;
+
+-- 2. 중복 물건 삭제
+DELETE FROM auction_detected_items d
+USING auction_detected_items k
+WHERE d.url = k.url
+    AND d.id > k.id;
+
+-- 3. 기존 일반 인덱스를 유니크 인덱스로 교체
+DROP INDEX IF EXISTS idx_auction_detected_items_url;
+CREATE UNIQUE INDEX idx_auction_detected_items_url ON auction_detected_items(url);
+
+COMMIT;
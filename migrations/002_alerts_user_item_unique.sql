@@ -0,0 +1,20 @@
+-- =====================================================
+-- 002. auction_alerts (user_id, item_id) 유니크 제약
+-- 알림 일괄 생성(INSERT ... SELECT ... ON CONFLICT DO NOTHING)에 필요
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+-- 1. 중복 알림 삭제 (가장 먼저 생성된 알림만 유지)
+DELETE FROM auction_alerts a
+USING auction_alerts k
+WHERE a.user_id = k.user_id
+    AND a.item_id = k.item_id
+    AND a.id > k.id;
+
+-- 2. 유니크 제약 추가
+ALTER TABLE auction_alerts
+    ADD CONSTRAINT uq_auction_alerts_user_item UNIQUE (user_id, item_id);
+
+COMMIT;
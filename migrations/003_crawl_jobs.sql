@@ -0,0 +1,35 @@
+-- =====================================================
+-- 003. auction_crawl_jobs 테이블 (크롤링 실행 기록 및 단계별 소요 시간)
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS auction_crawl_jobs (
+    id SERIAL PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    trigger VARCHAR(20) NOT NULL,
+    pages_requested INT NOT NULL,
+    incremental BOOLEAN NOT NULL DEFAULT FALSE,
+    pages_fetched INT NOT NULL DEFAULT 0,
+    pages_not_modified INT NOT NULL DEFAULT 0,
+    pages_failed INT NOT NULL DEFAULT 0,
+    rows_parsed INT NOT NULL DEFAULT 0,
+    new_items INT NOT NULL DEFAULT 0,
+    duplicate_items INT NOT NULL DEFAULT 0,
+    matched_items INT NOT NULL DEFAULT 0,
+    alerts_created INT NOT NULL DEFAULT 0,
+    wait_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    fetch_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    parse_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    match_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    write_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    total_seconds DOUBLE PRECISION,
+    error TEXT,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_auction_crawl_jobs_started_at ON auction_crawl_jobs(started_at);
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- =====================================================
+-- 004. auction_detected_items 상세 페이지 보강 컬럼
+-- 면적/최저매각가격/유찰 횟수 (CRAWLER_ENRICH_DETAILS=true일 때 채워짐)
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+ALTER TABLE auction_detected_items
+    ADD COLUMN IF NOT EXISTS area DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS minimum_bid BIGINT,
+    ADD COLUMN IF NOT EXISTS failed_bid_count INT,
+    ADD COLUMN IF NOT EXISTS enriched_at TIMESTAMP WITH TIME ZONE;
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- =====================================================
+-- 005. auction_detected_items 키워드 검색 인덱스
+-- 제목 글자 bigram 배열(생성 컬럼) + GIN 인덱스로 '%키워드%' 검색을 인덱스로 처리
+-- (pg_trgm 트라이그램은 2글자 한국어 키워드를 인덱스로 찾지 못하므로 bigram 사용,
+--  pg_trgm은 검색 결과 순위 계산(word_similarity)에 사용)
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+-- 1. 확장 설치
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 2. 글자 bigram 함수 (공백 단위로 나눈 각 단어의 연속된 두 글자, 소문자)
+CREATE OR REPLACE FUNCTION auction_bigrams(input TEXT)
+RETURNS TEXT[]
+LANGUAGE sql
+IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT COALESCE(array_agg(DISTINCT substr(word, i, 2)), '{}'::TEXT[])
+    FROM regexp_split_to_table(lower(input), '\s+') AS word,
+        generate_series(1, char_length(word) - 1) AS i
+$$;
+
+-- 3. 생성 컬럼 추가 (기존 행은 이 시점에 계산됨, 테이블 재작성)
+ALTER TABLE auction_detected_items
+    ADD COLUMN IF NOT EXISTS title_bigrams TEXT[] GENERATED ALWAYS AS (auction_bigrams(title)) STORED;
+
+COMMIT;
+
+-- 4. GIN 인덱스 (운영 중 테이블 잠금을 피하기 위해 트랜잭션 밖에서 CONCURRENTLY로 생성)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auction_detected_items_title_bigrams
+    ON auction_detected_items USING GIN(title_bigrams);
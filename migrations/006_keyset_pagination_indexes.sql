@@ -0,0 +1,19 @@
+-- =====================================================
+-- 006. 키셋 페이지네이션 인덱스
+-- /detected: (created_at, id), /alerts: (user_id, sent_at, id) 순서로 정렬/커서 조건을 인덱스로 처리
+-- 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 한 줄씩 실행)
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auction_detected_items_created_at_id
+    ON auction_detected_items(created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auction_alerts_user_sent_at_id
+    ON auction_alerts(user_id, sent_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_auction_alerts_sent_at_id
+    ON auction_alerts(sent_at DESC, id DESC);
+
+-- 위 인덱스로 대체되는 단일 컬럼 인덱스 정리
+DROP INDEX CONCURRENTLY IF EXISTS idx_auction_detected_items_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_auction_alerts_sent_at;
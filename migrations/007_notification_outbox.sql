@@ -0,0 +1,27 @@
+-- =====================================================
+-- 007. auction_notification_outbox 테이블 (외부 채널 알림 발송 대기열)
+-- 알림과 같은 트랜잭션에서 생성되고, 워커가 FOR UPDATE SKIP LOCKED로 나눠 처리
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS auction_notification_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    alert_id INT NOT NULL REFERENCES auction_alerts(id) ON DELETE CASCADE,
+    user_id VARCHAR(100) NOT NULL,
+    channel VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT uq_auction_notification_outbox_alert_channel UNIQUE (alert_id, channel)
+);
+
+-- 발송 대기 행만 담는 부분 인덱스 (워커의 claim 쿼리용)
+CREATE INDEX IF NOT EXISTS idx_auction_notification_outbox_pending
+    ON auction_notification_outbox(next_attempt_at) WHERE status = 'pending';
+
+COMMIT;
@@ -0,0 +1,17 @@
+-- =====================================================
+-- 008. auction_notification_outbox 발송 중(sending) 상태 및 사용자별 요약 발송용 인덱스
+-- 이메일 요약: 사용자의 대기 행을 한 번에 가져가므로 (user_id, channel) 인덱스 추가
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_auction_notification_outbox_pending;
+
+CREATE INDEX IF NOT EXISTS idx_auction_notification_outbox_active
+    ON auction_notification_outbox(next_attempt_at) WHERE status IN ('pending', 'sending');
+
+CREATE INDEX IF NOT EXISTS idx_auction_notification_outbox_user_channel
+    ON auction_notification_outbox(user_id, channel) WHERE status IN ('pending', 'sending');
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- =====================================================
+-- 009. 알림 생성 시 NOTIFY (실시간 알림 스트림 /alerts/stream 용)
+-- 채널 auction_alerts, 내용 {"user_id": ..., "alert_ids": [...]}
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION auction_alerts_notify()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- 문장 하나(일괄 INSERT)에서 생성된 알림을 사용자별로 묶어 알림
+    -- (NOTIFY 내용은 8000바이트 제한이 있으므로 500개씩 나눔)
+    PERFORM pg_notify(
+        'auction_alerts',
+        json_build_object('user_id', user_id, 'alert_ids', json_agg(id ORDER BY id))::TEXT
+    )
+    FROM (
+        SELECT user_id, id, (row_number() OVER (PARTITION BY user_id ORDER BY id) - 1) / 500 AS chunk
+        FROM new_alerts
+    ) AS numbered
+    GROUP BY user_id, chunk;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_auction_alerts_notify ON auction_alerts;
+CREATE TRIGGER trg_auction_alerts_notify
+    AFTER INSERT ON auction_alerts
+    REFERENCING NEW TABLE AS new_alerts
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION auction_alerts_notify();
+
+COMMIT;
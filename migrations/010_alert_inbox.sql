@@ -0,0 +1,50 @@
+-- =====================================================
+-- 010. 알림함: 읽음 상태, 물건 요약, 사용자별 안 읽은 알림 수
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+ALTER TABLE auction_alerts
+    ADD COLUMN IF NOT EXISTS read_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS item_summary JSONB;
+
+-- 기존 알림의 물건 요약 채우기
+UPDATE auction_alerts AS a
+SET item_summary = jsonb_build_object(
+        'title', d.title,
+        'url', d.url,
+        'appraisal_value', d.appraisal_value,
+        'minimum_bid', d.minimum_bid,
+        'bid_date', d.bid_date,
+        'area', d.area,
+        'source_site', d.source_site
+    )
+FROM auction_detected_items AS d
+WHERE d.id = a.item_id AND a.item_summary IS NULL;
+
+-- 읽음 상태가 없던 기존 알림은 읽은 것으로 처리 (배지가 과거 알림 수로 채워지지 않도록)
+UPDATE auction_alerts SET read_at = sent_at WHERE read_at IS NULL;
+
+CREATE TABLE IF NOT EXISTS auction_alert_inbox (
+    user_id VARCHAR(100) PRIMARY KEY,
+    unread_count INT NOT NULL DEFAULT 0,
+    total_count INT NOT NULL DEFAULT 0,
+    last_alert_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO auction_alert_inbox (user_id, unread_count, total_count, last_alert_at)
+SELECT user_id, count(*) FILTER (WHERE read_at IS NULL), count(*), max(sent_at)
+FROM auction_alerts
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET
+    unread_count = EXCLUDED.unread_count,
+    total_count = EXCLUDED.total_count,
+    last_alert_at = EXCLUDED.last_alert_at,
+    updated_at = CURRENT_TIMESTAMP;
+
+-- 안 읽은 알림 목록/전체 읽음 처리용 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_auction_alerts_user_unread ON auction_alerts(user_id, id) WHERE read_at IS NULL;
+
+COMMIT;
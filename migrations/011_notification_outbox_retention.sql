@@ -0,0 +1,16 @@
+-- =====================================================
+-- 011. auction_notification_outbox 상태 조회/보관 기간 정리용 부분 인덱스
+-- /health/notifications는 대기/발송 중/실패 행만 세고(전체 발송 이력을 훑지 않음),
+-- 보관 기간이 지난 발송 완료(sent) 행은 발송 워커가 주기적으로 삭제
+-- Supabase SQL Editor에서 실행하세요
+-- =====================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_auction_notification_outbox_failed
+    ON auction_notification_outbox(next_attempt_at) WHERE status = 'failed';
+
+CREATE INDEX IF NOT EXISTS idx_auction_notification_outbox_sent_at
+    ON auction_notification_outbox(sent_at) WHERE status = 'sent';
+
+COMMIT;
@@ -5,6 +5,9 @@
 
 -- 0. 기존 테이블 삭제 (초기화)
 -- 외래키 제약조건 때문에 순서 중요
+DROP TABLE IF EXISTS auction_notification_outbox CASCADE;
+DROP TABLE IF EXISTS auction_alert_inbox CASCADE;
+DROP TABLE IF EXISTS auction_crawl_jobs CASCADE;
 DROP TABLE IF EXISTS auction_alerts CASCADE;
 DROP TABLE IF EXISTS auction_detected_items CASCADE;
 DROP TABLE IF EXISTS auction_keywords CASCADE;
@@ -14,6 +17,19 @@ DROP TABLE IF EXISTS alerts CASCADE;
 DROP TABLE IF EXISTS detected_items CASCADE;
 DROP TABLE IF EXISTS keywords CASCADE;
 
+-- 0-1. 키워드 검색용 확장/함수 (제목 글자 bigram)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION auction_bigrams(input TEXT)
+RETURNS TEXT[]
+LANGUAGE sql
+IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT COALESCE(array_agg(DISTINCT substr(word, i, 2)), '{}'::TEXT[])
+    FROM regexp_split_to_table(lower(input), '\s+') AS word,
+        generate_series(1, char_length(word) - 1) AS i
+$$;
+
 -- 1. auction_keywords 테이블 생성
 CREATE TABLE auction_keywords (
     id SERIAL PRIMARY KEY,
@@ -26,11 +42,16 @@ CREATE TABLE auction_keywords (
 CREATE TABLE auction_detected_items (
     id SERIAL PRIMARY KEY,
     title TEXT NOT NULL,
+    title_bigrams TEXT[] GENERATED ALWAYS AS (auction_bigrams(title)) STORED,
     appraisal_value BIGINT,
     bid_date DATE,
     url TEXT NOT NULL,
     keywords JSONB,
     source_site VARCHAR(100),
+    area DOUBLE PRECISION,
+    minimum_bid BIGINT,
+    failed_bid_count INT,
+    enriched_at TIMESTAMP WITH TIME ZONE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -41,19 +62,111 @@ CREATE TABLE auction_alerts (
     item_id INT NOT NULL,
     message TEXT,
     sent_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    CONSTRAINT fk_auction_alerts_item FOREIGN KEY (item_id) REFERENCES auction_detected_items(id)
+    read_at TIMESTAMP WITH TIME ZONE,
+    item_summary JSONB,
+    CONSTRAINT fk_auction_alerts_item FOREIGN KEY (item_id) REFERENCES auction_detected_items(id),
+    CONSTRAINT uq_auction_alerts_user_item UNIQUE (user_id, item_id)
+);
+
+-- 3-0. 알림 생성 시 NOTIFY (실시간 알림 스트림 /alerts/stream 용)
+CREATE OR REPLACE FUNCTION auction_alerts_notify()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- 문장 하나(일괄 INSERT)에서 생성된 알림을 사용자별로 묶어 알림
+    -- (NOTIFY 내용은 8000바이트 제한이 있으므로 500개씩 나눔)
+    PERFORM pg_notify(
+        'auction_alerts',
+        json_build_object('user_id', user_id, 'alert_ids', json_agg(id ORDER BY id))::TEXT
+    )
+    FROM (
+        SELECT user_id, id, (row_number() OVER (PARTITION BY user_id ORDER BY id) - 1) / 500 AS chunk
+        FROM new_alerts
+    ) AS numbered
+    GROUP BY user_id, chunk;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_auction_alerts_notify
+    AFTER INSERT ON auction_alerts
+    REFERENCING NEW TABLE AS new_alerts
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION auction_alerts_notify();
+
+-- 3-1. auction_crawl_jobs 테이블 생성 (크롤링 실행 기록)
+CREATE TABLE auction_crawl_jobs (
+    id SERIAL PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    trigger VARCHAR(20) NOT NULL,
+    pages_requested INT NOT NULL,
+    incremental BOOLEAN NOT NULL DEFAULT FALSE,
+    pages_fetched INT NOT NULL DEFAULT 0,
+    pages_not_modified INT NOT NULL DEFAULT 0,
+    pages_failed INT NOT NULL DEFAULT 0,
+    rows_parsed INT NOT NULL DEFAULT 0,
+    new_items INT NOT NULL DEFAULT 0,
+    duplicate_items INT NOT NULL DEFAULT 0,
+    matched_items INT NOT NULL DEFAULT 0,
+    alerts_created INT NOT NULL DEFAULT 0,
+    wait_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    fetch_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    parse_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    match_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    write_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    total_seconds DOUBLE PRECISION,
+    error TEXT,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- 3-2. auction_notification_outbox 테이블 생성 (외부 채널 알림 발송 대기열)
+CREATE TABLE auction_notification_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    alert_id INT NOT NULL REFERENCES auction_alerts(id) ON DELETE CASCADE,
+    user_id VARCHAR(100) NOT NULL,
+    channel VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT uq_auction_notification_outbox_alert_channel UNIQUE (alert_id, channel)
+);
+
+-- 3-3. auction_alert_inbox 테이블 생성 (사용자별 안 읽은 알림 수)
+CREATE TABLE auction_alert_inbox (
+    user_id VARCHAR(100) PRIMARY KEY,
+    unread_count INT NOT NULL DEFAULT 0,
+    total_count INT NOT NULL DEFAULT 0,
+    last_alert_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 4. 인덱스 생성 (성능 최적화)
 CREATE INDEX idx_auction_keywords_user_id ON auction_keywords(user_id);
 CREATE INDEX idx_auction_keywords_keyword ON auction_keywords(keyword);
-CREATE INDEX idx_auction_detected_items_created_at ON auction_detected_items(created_at);
+CREATE INDEX idx_auction_detected_items_created_at_id ON auction_detected_items(created_at DESC, id DESC);
 CREATE INDEX idx_auction_detected_items_bid_date ON auction_detected_items(bid_date);
 CREATE INDEX idx_auction_detected_items_keywords ON auction_detected_items USING GIN(keywords);
-CREATE INDEX idx_auction_detected_items_url ON auction_detected_items(url);
+CREATE UNIQUE INDEX idx_auction_detected_items_url ON auction_detected_items(url);
+CREATE INDEX idx_auction_detected_items_title_bigrams ON auction_detected_items USING GIN(title_bigrams);
 CREATE INDEX idx_auction_alerts_user_id ON auction_alerts(user_id);
 CREATE INDEX idx_auction_alerts_item_id ON auction_alerts(item_id);
-CREATE INDEX idx_auction_alerts_sent_at ON auction_alerts(sent_at);
+CREATE INDEX idx_auction_alerts_user_sent_at_id ON auction_alerts(user_id, sent_at DESC, id DESC);
+CREATE INDEX idx_auction_alerts_sent_at_id ON auction_alerts(sent_at DESC, id DESC);
+CREATE INDEX idx_auction_alerts_user_unread ON auction_alerts(user_id, id) WHERE read_at IS NULL;
+CREATE INDEX idx_auction_crawl_jobs_started_at ON auction_crawl_jobs(started_at);
+CREATE INDEX idx_auction_notification_outbox_active
+    ON auction_notification_outbox(next_attempt_at) WHERE status IN ('pending', 'sending');
+CREATE INDEX idx_auction_notification_outbox_user_channel
+    ON auction_notification_outbox(user_id, channel) WHERE status IN ('pending', 'sending');
+CREATE INDEX idx_auction_notification_outbox_failed
+    ON auction_notification_outbox(next_attempt_at) WHERE status = 'failed';
+CREATE INDEX idx_auction_notification_outbox_sent_at
+    ON auction_notification_outbox(sent_at) WHERE status = 'sent';
 
 -- 5. RLS (Row Level Security) 설정 (선택사항)
 -- 현재는 임시 사용자 ID를 사용하므로 비활성화
@@ -0,0 +1,162 @@
+"""EmailDigestChannel을 로컬 SMTP 서버(소켓 수준 스텁)에 보내 사용자별 요약/연결 재사용 확인"""
+import asyncio
+import smtplib
+import socket
+import threading
+from datetime import date
+from email import message_from_bytes
+from email.policy import default
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.services.email_digest import EmailDigestChannel
+from app.services.notification import NotificationService
+
+
+class StubSMTPServer:
+    """스레드 하나에서 SMTP 대화를 흉내 내며 연결 수와 받은 메일을 기록"""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages = []
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self._socket.settimeout(0.2)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._socket.getsockname()[1]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        self._socket.close()
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            self.connections += 1
+            threading.Thread(target=self._session, args=(conn,), daemon=True).start()
+
+    def _session(self, conn: socket.socket):
+        with conn, conn.makefile("rb") as reader:
+            def reply(line: str):
+                conn.sendall(line.encode() + b"\r\n")
+
+            reply("220 stub ESMTP")
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                command = line.decode().strip().upper()
+                if command.startswith(("EHLO", "HELO")):
+                    reply("250-stub")
+                    reply("250 8BITMIME")
+                elif command == "DATA":
+                    reply("354 end with <CRLF>.<CRLF>")
+                    data = b""
+                    while not data.endswith(b"\r\n.\r\n"):
+                        chunk = reader.readline()
+                        if not chunk:
+                            return
+                        data += chunk
+                    self.messages.append(message_from_bytes(data[:-3], policy=default))
+                    reply("250 queued")
+                elif command == "QUIT":
+                    reply("221 bye")
+                    return
+                else:
+                    # MAIL / RCPT / RSET / NOOP
+                    reply("250 ok")
+
+
+def _alert(title: str, index: int):
+    item = SimpleNamespace(
+        title=title,
+        url=f"https://example.com/items/{index}",
+        appraisal_value=300_000_000,
+        minimum_bid=210_000_000,
+        bid_date=date(2026, 11, 3),
+        area=84.9,
+        failed_bid_count=1,
+    )
+    return SimpleNamespace(id=index, item=item)
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    with StubSMTPServer() as server:
+        monkeypatch.setattr(settings, "smtp_host", "127.0.0.1")
+        monkeypatch.setattr(settings, "smtp_port", server.port)
+        monkeypatch.setattr(settings, "smtp_starttls", False)
+        monkeypatch.setattr(settings, "smtp_use_ssl", False)
+        monkeypatch.setattr(settings, "smtp_username", None)
+        monkeypatch.setattr(settings, "smtp_timeout_seconds", 5.0)
+        monkeypatch.setattr(settings, "email_user_addresses", {"user-1": "one@example.com"})
+        yield server
+
+
+def test_one_digest_per_user_over_one_connection(smtp_server):
+    digests = {
+        "user-1": [_alert("서울 송파구 아파트", 1), _alert("서울 강남구 오피스텔", 2)],
+        "two@example.com": [_alert("경기 성남시 상가", 3)],
+        "no-address": [_alert("부산 해운대구 아파트", 4)],
+    }
+    more = {"user-1": [_alert("서울 마포구 아파트", 5)]}
+
+    async def scenario():
+        channel = EmailDigestChannel()
+        service = NotificationService(email=channel)
+        first = await service.deliver_email_digests(digests)
+        second = await service.deliver_email_digests(more)
+        await channel.close()
+        return channel, first, second
+
+    channel, first, second = asyncio.run(scenario())
+
+    assert first["user-1"] is None and first["two@example.com"] is None
+    assert first["no-address"] is not None and not first["no-address"].retryable
+    assert second["user-1"] is None
+
+    # 알림 수가 아니라 사용자 수(발송마다)만큼 메일
+    recipients = [message["To"] for message in smtp_server.messages]
+    assert recipients == ["one@example.com", "two@example.com", "one@example.com"]
+    body = smtp_server.messages[0].get_body(("plain",)).get_content()
+    assert "2건" in body and "서울 송파구 아파트" in body and "서울 강남구 오피스텔" in body
+
+    # 두 번의 send_messages가 SMTP 연결 하나를 재사용
+    assert channel.stats == {"connections": 1, "messages": 3, "failed": 0}
+    assert smtp_server.connections == 1
+
+
+def test_failed_login_closes_connection(smtp_server, monkeypatch):
+    # 스텁 서버는 AUTH를 광고하지 않으므로 login()이 SMTPNotSupportedError로 실패
+    monkeypatch.setattr(settings, "smtp_username", "user")
+    closed = []
+    original_close = smtplib.SMTP.close
+    monkeypatch.setattr(smtplib.SMTP, "close", lambda smtp: closed.append(smtp) or original_close(smtp))
+
+    async def scenario():
+        channel = EmailDigestChannel()
+        service = NotificationService(email=channel)
+        results = await service.deliver_email_digests({"user-1": [_alert("서울 송파구 아파트", 1)]})
+        await channel.close()
+        return channel, results
+
+    channel, results = asyncio.run(scenario())
+
+    assert results["user-1"] is not None
+    assert channel.stats["connections"] == 0
+    # 다시 연결해서 한 번 더 시도하므로 만든 연결 두 개가 모두 닫힘
+    assert len(closed) == 2
+    assert all(smtp.sock is None for smtp in closed)
@@ -0,0 +1,137 @@
+"""WebhookChannel을 로컬 스텁 수신자(asyncio HTTP 서버)에 보내 배치/차단기 동작 확인"""
+import asyncio
+import json
+import math
+import time
+
+import pytest
+
+from app.config import settings
+from app.services.webhook import WebhookChannel, WebhookError
+
+
+class StubReceiver:
+    """keep-alive HTTP/1.1 POST를 받아 요청마다 본문을 기록하는 최소 수신자
+
+    mode: "ok"(200), "error"(503), "hang"(응답하지 않음)
+    """
+
+    def __init__(self, mode: str = "ok"):
+        self.mode = mode
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/hook"
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = dict(
+                    line.split(": ", 1) for line in head.decode("latin-1").split("\r\n")[1:] if ": " in line
+                )
+                length = int({key.lower(): value for key, value in headers.items()}.get("content-length", 0))
+                self.requests.append(json.loads(await reader.readexactly(length)))
+
+                if self.mode == "hang":
+                    await asyncio.sleep(3600)
+                status = b"200 OK" if self.mode == "ok" else b"503 Service Unavailable"
+                writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def webhook_settings(monkeypatch):
+    monkeypatch.setattr(settings, "webhook_batch_window_seconds", 0.05)
+    monkeypatch.setattr(settings, "webhook_batch_max_size", 100)
+    monkeypatch.setattr(settings, "webhook_endpoint_concurrency", 1)
+    monkeypatch.setattr(settings, "webhook_timeout_seconds", 0.2)
+    monkeypatch.setattr(settings, "webhook_breaker_failures", 2)
+    monkeypatch.setattr(settings, "webhook_breaker_reset_seconds", 60.0)
+    return settings
+
+
+def test_alerts_to_same_endpoint_are_coalesced(webhook_settings):
+    alerts = 250
+
+    async def scenario():
+        channel = WebhookChannel()
+        async with StubReceiver() as receiver:
+            await asyncio.gather(*(channel.send(receiver.url, {"alert_id": i}) for i in range(alerts)))
+            await channel.close()
+        return channel, receiver
+
+    channel, receiver = asyncio.run(scenario())
+
+    assert len(receiver.requests) == math.ceil(alerts / webhook_settings.webhook_batch_max_size)
+    received = [alert["alert_id"] for body in receiver.requests for alert in body["alerts"]]
+    assert sorted(received) == list(range(alerts))
+    assert all(len(body["alerts"]) <= webhook_settings.webhook_batch_max_size for body in receiver.requests)
+    assert receiver.connections == 1  # 주소별 동시 요청 1개: 배치들이 keep-alive 연결 하나를 재사용
+    assert channel.stats["alerts"] == alerts
+
+
+def test_breaker_opens_and_fails_fast(webhook_settings):
+    async def scenario():
+        channel = WebhookChannel()
+        async with StubReceiver("hang") as receiver:
+            # 응답하지 않는 수신자: 타임아웃이 breaker_failures번 이어지면 차단
+            for index in range(webhook_settings.webhook_breaker_failures):
+                with pytest.raises(WebhookError) as error:
+                    await channel.send(receiver.url, {"alert_id": index})
+                assert error.value.retryable
+
+            started = time.perf_counter()
+            with pytest.raises(WebhookError, match="차단"):
+                await channel.send(receiver.url, {"alert_id": "blocked"})
+            elapsed = time.perf_counter() - started
+
+            state = channel.endpoint_stats()["endpoints"][receiver.url]["state"]
+            requests = len(receiver.requests)
+            await channel.close()
+        return channel, state, requests, elapsed
+
+    channel, state, requests, elapsed = asyncio.run(scenario())
+
+    assert state == "open"
+    assert requests == webhook_settings.webhook_breaker_failures  # 차단 후에는 요청하지 않음
+    assert elapsed < webhook_settings.webhook_batch_window_seconds  # 배치 창/타임아웃을 기다리지 않고 바로 실패
+    assert channel.stats["rejected"] == 1
+
+
+def test_server_errors_are_retryable_and_count_toward_breaker(webhook_settings):
+    async def scenario():
+        channel = WebhookChannel()
+        async with StubReceiver("error") as receiver:
+            errors = []
+            for index in range(webhook_settings.webhook_breaker_failures):
+                try:
+                    await channel.send(receiver.url, {"alert_id": index})
+                except WebhookError as e:
+                    errors.append(e)
+            state = channel.endpoint_stats()["endpoints"][receiver.url]["state"]
+            await channel.close()
+        return errors, state
+
+    errors, state = asyncio.run(scenario())
+
+    assert len(errors) == webhook_settings.webhook_breaker_failures
+    assert all(error.retryable for error in errors)
+    assert state == "open"